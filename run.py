@@ -24,10 +24,12 @@ Run program
 
 import os
 import sys
+from multiprocessing import freeze_support
 
 from tinypedal.main import start_app
 
 
 if __name__ == "__main__":
+    freeze_support()
     os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
     start_app()
@@ -0,0 +1,135 @@
+"""
+Rest API module benchmark
+
+Drive RestAPI module Realtime.update_data against local mock Rest API server,
+and report connection reuse, retry backoff & fetch timing for each scenario.
+Exit with error code if module output does not match recorded resources.
+
+    python tests/benchmark_restapi.py --duration 5 --latency 0.02
+"""
+
+import argparse
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.append(".")
+
+from tests.mock_restapi import MockRestAPI, FIXTURES
+from tinypedal.setting import Preset
+from tinypedal.module_info import minfo
+from tinypedal.module import module_restapi
+
+REPEAT_RESOURCE = "/rest/garage/UIScreen/DriverHandOffStintEnd"
+# Game API stand-in, module only reads sim name from game API
+module_restapi.api = SimpleNamespace(
+    read=SimpleNamespace(check=SimpleNamespace(sim_name=lambda: "LMU")))
+
+
+class BenchmarkConfig:
+    """Default setting without loading or saving setting files"""
+
+    def __init__(self, port: int, update_interval: int, retry: int, retry_delay: float):
+        self.user = Preset()
+        self.user.set_default()
+        self.compatibility = self.user.setting["compatibility"]
+        mcfg = self.user.setting[module_restapi.MODULE_NAME]
+        mcfg["url_host"] = "127.0.0.1"
+        mcfg["url_port_lmu"] = port
+        mcfg["update_interval"] = update_interval
+        mcfg["connection_retry"] = retry
+        mcfg["connection_retry_delay"] = retry_delay
+
+    def save(self, *args):
+        """Skip saving"""
+
+
+def run_scenario(name: str, args, **server_args) -> bool:
+    """Run module against mock server, return whether output matched"""
+    server = MockRestAPI(**server_args)
+    server.start()
+    config = BenchmarkConfig(server.port, args.update_interval, args.retry, args.retry_delay)
+    module = module_restapi.Realtime(config)
+    module.state = SimpleNamespace(active=True)
+    thread = threading.Thread(target=module.update_data, daemon=True)
+
+    time_start = time.perf_counter()
+    thread.start()
+    # Wait until first repeat request, which starts after all runonce tasks finished
+    runonce_time = 0.0
+    while time.perf_counter() - time_start < args.duration:
+        if server.requests.get(REPEAT_RESOURCE, 0) > 1:
+            runonce_time = time.perf_counter() - time_start
+            break
+        time.sleep(0.001)
+    repeat_start = server.requests.get(REPEAT_RESOURCE, 0)
+    time_repeat = time.perf_counter()
+    time.sleep(max(args.duration - (time_repeat - time_start), 0))
+    repeat_count = server.requests.get(REPEAT_RESOURCE, 0) - repeat_start
+    repeat_time = time.perf_counter() - time_repeat
+    valid = check_output(name, server)
+
+    module.event.set()
+    thread.join(timeout=10)
+    server.stop()
+
+    total_requests = server.total_requests()
+    expected_rate = 1000 / max(args.update_interval, config.compatibility["minimum_update_interval"])
+    print(f"{name}:")
+    print(f"  runonce time:     {runonce_time:.3f} sec")
+    print(f"  requests:         {total_requests} ({server.failures} failed)")
+    print(f"  connections:      {server.connections} "
+          f"({total_requests / max(server.connections, 1):.1f} requests per connection)")
+    print(f"  repeat rate:      {repeat_count / max(repeat_time, 0.001):.1f} per sec "
+          f"(target {expected_rate:.1f})")
+    print(f"  output valid:     {valid}")
+    return valid
+
+
+def check_output(name: str, server: MockRestAPI) -> bool:
+    """Check module output against served resources"""
+    fuel_info = server.resources[REPEAT_RESOURCE]["fuelInfo"]
+    checks = {
+        "timeScale": minfo.restapi.timeScale == 1,
+        "steeringWheelRange": minfo.restapi.steeringWheelRange == 480,
+        "maxVirtualEnergy": minfo.restapi.maxVirtualEnergy == fuel_info["maxVirtualEnergy"],
+        # Dynamic resource may update once between last fetch & check
+        "currentVirtualEnergy": (
+            0 <= minfo.restapi.currentVirtualEnergy - fuel_info["currentVirtualEnergy"] <= 1000000),
+    }
+    if "/rest/sessions/weather" not in server.unavailable:
+        weather = FIXTURES["/rest/sessions/weather"]
+        checks["forecastRace"] = (
+            minfo.restapi.forecastRace[0][2]
+            == round(weather["RACE"]["START"]["WNV_TEMPERATURE"]["currentValue"]))
+    failed = [key for key, passed in checks.items() if not passed]
+    if failed:
+        print(f"{name}: output mismatch: {', '.join(failed)}")
+    return not failed
+
+
+def main():
+    """Run all scenarios"""
+    parser = argparse.ArgumentParser(description="Rest API module benchmark")
+    parser.add_argument("--duration", type=float, default=3, help="seconds per scenario")
+    parser.add_argument("--latency", type=float, default=0.02, help="server response delay")
+    parser.add_argument("--update-interval", type=int, default=100)
+    parser.add_argument("--retry", type=int, default=3)
+    parser.add_argument("--retry-delay", type=float, default=0.2)
+    args = parser.parse_args()
+
+    scenarios = (
+        ("static resources", {"update_every": 0}),
+        ("changing resources", {"update_every": 2}),
+        ("latency", {"latency": args.latency, "update_every": 2}),
+        ("unavailable resource (retry backoff)", {
+            "unavailable": ("/rest/sessions/weather",), "update_every": 2}),
+        ("server errors", {"failure_rate": 0.2, "update_every": 2}),
+    )
+    results = [run_scenario(name, args, **server_args) for name, server_args in scenarios]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
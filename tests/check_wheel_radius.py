@@ -0,0 +1,91 @@
+"""
+Wheel radius check
+
+Drive Wheels module wheel radius generator with generated wheel rotation samples,
+and check sorted window interquartile mean against full sort of same window.
+Exit with error code if estimated radius or window mean does not match.
+
+    python tests/check_wheel_radius.py --samples 2000
+"""
+
+import argparse
+import math
+import random
+import sys
+from collections import deque
+from types import SimpleNamespace
+
+sys.path.append(".")
+
+from tinypedal import calculation as calc
+from tinypedal.module import module_wheels
+
+RADIUS_FRONT = 0.330
+RADIUS_REAR = 0.345
+# Game API stand-in, wheel radius only reads vehicle id from game API
+module_wheels.api = SimpleNamespace(
+    read=SimpleNamespace(check=SimpleNamespace(vehicle_id=lambda: "check vehicle")))
+
+
+def full_sort_mean(samples) -> float:
+    """Mean of middle half of fully sorted samples"""
+    sorted_samples = sorted(samples)
+    total = len(sorted_samples)
+    if total < 4:
+        return math.fsum(sorted_samples) / total
+    return calc.mean(sorted_samples[int(total * 0.25):int(total * 0.75)])
+
+
+def check_sorted_window(samples: int) -> bool:
+    """Check sorted window against full sort of same samples"""
+    window = calc.SortedWindow(160)
+    reference = deque([], 160)
+    for _ in range(samples):
+        value = random.gauss(0.33, 0.01)
+        window.add(value)
+        reference.append(value)
+        if abs(window.interquartile_mean() - full_sort_mean(reference)) > 1e-9:
+            print(f"sorted window mismatch after {len(reference)} samples")
+            return False
+    return True
+
+
+def check_wheel_radius(samples: int, last_radius: bool) -> bool:
+    """Run wheel radius generator, check estimated radius"""
+    module = module_wheels.Realtime.__new__(module_wheels.Realtime)
+    module.mcfg = {
+        "last_vehicle_info": "check vehicle" if last_radius else "",
+        "last_wheel_radius_front": 0.3,
+        "last_wheel_radius_rear": 0.3,
+    }
+    gen_wheel_radius = module.calc_wheel_radius()
+    radius_front, radius_rear = next(gen_wheel_radius)
+    for _ in range(samples):
+        speed = random.uniform(20, 60)
+        # Negative rotation = forward, small difference between left & right wheels
+        rot_front = -speed / RADIUS_FRONT * random.uniform(0.999, 1.001)
+        rot_rear = -speed / RADIUS_REAR * random.uniform(0.999, 1.001)
+        wheel_rot = (rot_front, rot_front * 1.0001, rot_rear, rot_rear * 1.0001)
+        radius_front, radius_rear = gen_wheel_radius.send((speed, wheel_rot))
+    valid = (abs(radius_front - RADIUS_FRONT) < 0.002
+             and abs(radius_rear - RADIUS_REAR) < 0.002)
+    print(f"last radius {last_radius}: front {radius_front}, rear {radius_rear}, valid {valid}")
+    return valid
+
+
+def main():
+    """Run all checks"""
+    parser = argparse.ArgumentParser(description="Wheel radius check")
+    parser.add_argument("--samples", type=int, default=2000)
+    args = parser.parse_args()
+    random.seed(0)
+    results = (
+        check_sorted_window(args.samples),
+        check_wheel_radius(args.samples, False),
+        check_wheel_radius(args.samples, True),
+    )
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Mock Rest API server
+
+Local stand-in for RF2/LMU Rest API, serves recorded resources with
+configurable latency & failures. Run directly to serve on LMU port:
+
+    python tests/mock_restapi.py --port 6397 --latency 0.02 --failure-rate 0.1
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Recorded resources, key - url path, value - json payload
+FIXTURES = {
+    "/rest/sessions/setting/SESSSET_race_timescale": {
+        "currentValue": 1,
+        "maxValue": 60,
+        "minValue": 0,
+        "stringValue": "x1",
+    },
+    "/rest/sessions/setting/SESSSET_private_qual": {
+        "currentValue": 0,
+        "maxValue": 1,
+        "minValue": 0,
+        "stringValue": "Off",
+    },
+    "/rest/sessions/weather": {
+        session: {
+            node: {
+                "WNV_SKY": {"currentValue": index % 5, "stringValue": "Partially Cloudy"},
+                "WNV_TEMPERATURE": {"currentValue": 20.4 + index, "stringValue": f"{20 + index}C"},
+                "WNV_RAIN_CHANCE": {"currentValue": index * 10, "stringValue": f"{index * 10}%"},
+                "WNV_WINDSPEED": {"currentValue": 3, "stringValue": "3m/s"},
+            }
+            for index, node in enumerate(("START", "NODE_25", "NODE_50", "NODE_75", "FINISH"))
+        }
+        for session in ("PRACTICE", "QUALIFY", "RACE")
+    },
+    "/rest/garage/chassis": {
+        "VM_STEER_LOCK": {"key": "VM_STEER_LOCK", "stringValue": "480 deg", "value": 12},
+        "VM_BRAKE_BALANCE": {"key": "VM_BRAKE_BALANCE", "stringValue": "54.2:45.8", "value": 42},
+        # Padding, recorded chassis resource contains a full setup
+        "setup": [{"key": f"VM_SETTING_{index}", "stringValue": "0", "value": index}
+                  for index in range(200)],
+    },
+    "/rest/garage/UIScreen/DriverHandOffStintEnd": {
+        "fuelInfo": {
+            "currentFuel": 61.5,
+            "currentVirtualEnergy": 812000000.0,
+            "maxFuel": 105.0,
+            "maxVirtualEnergy": 912000000.0,
+        },
+        # Padding, recorded garage screen resource contains full pit menu
+        "pitMenu": [{"name": f"PIT_ITEM_{index}", "currentSetting": 0,
+                     "settings": [{"text": f"option {option}"} for option in range(20)]}
+                    for index in range(60)],
+    },
+}
+# Resource that changes while driving, see update_every
+DYNAMIC_RESOURCE = "/rest/garage/UIScreen/DriverHandOffStintEnd"
+
+
+class MockRestAPI:
+    """Mock Rest API server
+
+    Args:
+        port: server port, 0 for any free port.
+        latency: response delay in seconds.
+        failure_rate: chance (fraction) to respond with server error.
+        unavailable: url paths that always respond not found.
+        update_every: number of requests between dynamic resource updates, 0 for static.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0, failure_rate: float = 0.0,
+        unavailable: tuple = (), update_every: int = 0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.unavailable = set(unavailable)
+        self.update_every = update_every
+        self.resources = json.loads(json.dumps(FIXTURES))
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.connections = 0
+        self.failures = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self.__handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def port(self) -> int:
+        """Server port"""
+        return self.server.server_port
+
+    def start(self):
+        """Start server thread"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop server"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def total_requests(self) -> int:
+        """Total requests"""
+        with self.lock:
+            return sum(self.requests.values())
+
+    def respond(self, path: str) -> tuple:
+        """Get response code & body for url path"""
+        with self.lock:
+            count = self.requests.get(path, 0) + 1
+            self.requests[path] = count
+            if path in self.unavailable or path not in self.resources:
+                return 404, b"{}"
+            if random.random() < self.failure_rate:
+                self.failures += 1
+                return 500, b"{}"
+            if path == DYNAMIC_RESOURCE and self.update_every and count % self.update_every == 0:
+                self.resources[path]["fuelInfo"]["currentVirtualEnergy"] -= 1000000.0
+            return 200, json.dumps(self.resources[path]).encode("utf-8")
+
+    def __handler(self) -> type:
+        """Create request handler bound to server instance"""
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Keep-alive request handler"""
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with mock.lock:
+                    mock.connections += 1
+
+            def do_GET(self):
+                """Respond GET request"""
+                if mock.latency:
+                    time.sleep(mock.latency)
+                code, body = mock.respond(self.path)
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                """Disable request logging"""
+
+        return Handler
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mock Rest API server")
+    parser.add_argument("--port", type=int, default=6397)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--update-every", type=int, default=10)
+    args = parser.parse_args()
+
+    mock_server = MockRestAPI(args.port, args.latency, args.failure_rate,
+                              update_every=args.update_every)
+    print(f"Serving mock Rest API on http://127.0.0.1:{mock_server.port}/rest/")
+    try:
+        mock_server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    mock_server.server.server_close()
@@ -20,8 +20,13 @@
 Calculation function
 """
 
+import array
 import math
+import random
 import statistics
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from itertools import compress
 
 
 distance = math.dist  # coordinates distance
@@ -254,6 +259,43 @@ def relative_time_gap(rel_dist, plr_speed, opt_speed):
     return 0
 
 
+# Vehicle array, process all vehicles in one call
+def lap_progress_distance_array(dist_array, length):
+    """Lap progress (distance into lap) fraction array"""
+    if length:
+        return array.array("d", [min(max(dist / length, 0), 1) for dist in dist_array])
+    return array.array("d", bytes(8 * len(dist_array)))
+
+
+def circular_relative_distance_array(circle_length, plr_dist, opt_dist_array):
+    """Relative distance array between opponents & player in a circle"""
+    half_length = circle_length * 0.5
+    return array.array("d", [
+        rel_dist - circle_length if rel_dist > half_length  # opponent is behind player
+        else rel_dist + circle_length if rel_dist < -half_length  # opponent is ahead player
+        else rel_dist
+        for rel_dist in [opt_dist - plr_dist for opt_dist in opt_dist_array]
+    ])
+
+
+def lap_difference_array(opt_laps_array, plr_laps, lap_ahead=1, lap_behind=1):
+    """Lap difference array between opponents and player, see lap_difference"""
+    return array.array("d", [
+        lap_diff if lap_diff > lap_ahead or lap_diff < -lap_behind else 0
+        for lap_diff in [opt_laps - plr_laps for opt_laps in opt_laps_array]
+    ])
+
+
+def relative_time_gap_array(rel_dist_array, plr_speed, opt_speed_array):
+    """Relative time gap array between opponents & player"""
+    return array.array("d", [
+        abs(rel_dist / speed) if speed > 1 else 0
+        for rel_dist, speed in zip(
+            rel_dist_array,
+            [max(plr_speed, opt_speed) for opt_speed in opt_speed_array])
+    ])
+
+
 def linear_interp(x, x1, y1, x2, y2):
     """Linear interpolation"""
     x_diff = x2 - x1
@@ -330,6 +372,159 @@ def ema_factor(samples: int) -> float:
     return 2 / (samples + 1)
 
 
+class RollingStats:
+    """Rolling mean & standard deviation over fixed size ring buffer
+
+    Keeps running sum & sum of squares, so each update costs the same
+    regardless of window size. Sums are recalculated from buffer once
+    every full cycle to correct accumulated floating point drift.
+    """
+
+    __slots__ = ("size", "count", "index", "total", "total_sq", "samples")
+
+    def __init__(self, size: int) -> None:
+        self.size = max(int(size), 1)
+        self.samples = array.array("d", [0] * self.size)
+        self.count = 0
+        self.index = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def reset(self) -> None:
+        """Reset samples"""
+        for idx in range(self.size):
+            self.samples[idx] = 0
+        self.count = 0
+        self.index = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def add(self, value: float) -> None:
+        """Add sample, replace oldest sample if buffer full"""
+        old_value = self.samples[self.index]
+        self.samples[self.index] = value
+        self.total += value - old_value
+        self.total_sq += value * value - old_value * old_value
+        self.index += 1
+        if self.count < self.size:
+            self.count += 1
+        if self.index >= self.size:
+            self.index = 0
+            # Drift correction
+            self.total = math.fsum(self.samples)
+            self.total_sq = math.fsum(value * value for value in self.samples)
+
+    def full(self) -> bool:
+        """Whether buffer is full"""
+        return self.count >= self.size
+
+    def mean(self) -> float:
+        """Mean of samples"""
+        if self.count < 1:
+            return 0.0
+        return self.total / self.count
+
+    def std_dev(self) -> float:
+        """Sample standard deviation"""
+        if self.count < 2:
+            return 0.0
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        if variance <= 0:
+            return 0.0
+        return math.sqrt(variance)
+
+
+class SortedWindow:
+    """Sliding window with sorted samples & interquartile mean
+
+    Samples are kept in insertion order (FIFO) and in a parallel sorted list
+    maintained by bisect. Once window is full, sum of middle half of sorted
+    samples is updated from boundary samples on each insert & remove,
+    instead of sorting and summing whole window.
+    """
+
+    __slots__ = ("size", "lower", "upper", "samples", "sorted_samples",
+                 "middle_sum", "middle_valid", "updates")
+
+    def __init__(self, size: int) -> None:
+        self.size = max(int(size), 4)
+        self.lower = int(self.size * 0.25)
+        self.upper = int(self.size * 0.75)
+        self.samples = deque([], self.size)
+        self.sorted_samples = []
+        self.middle_sum = 0.0
+        self.middle_valid = False
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def reset(self) -> None:
+        """Reset samples"""
+        self.samples.clear()
+        self.sorted_samples.clear()
+        self.middle_sum = 0.0
+        self.middle_valid = False
+        self.updates = 0
+
+    def add(self, value: float) -> None:
+        """Add sample, remove oldest sample if window full"""
+        sorted_samples = self.sorted_samples
+        if len(self.samples) < self.size:
+            # Middle range changes while filling, recalculate on demand
+            self.samples.append(value)
+            insort(sorted_samples, value)
+            self.middle_valid = False
+            return
+
+        lower = self.lower
+        upper = self.upper
+        incremental = self.middle_valid and self.updates < self.size
+        # Remove oldest
+        old_value = self.samples.popleft()
+        index = bisect_left(sorted_samples, old_value)
+        if incremental:
+            if index < lower:
+                self.middle_sum += sorted_samples[upper] - sorted_samples[lower]
+            elif index < upper:
+                self.middle_sum += sorted_samples[upper] - old_value
+        del sorted_samples[index]
+        # Insert new
+        index = bisect_right(sorted_samples, value)
+        if incremental:
+            if index < lower:
+                self.middle_sum += sorted_samples[lower - 1] - sorted_samples[upper - 1]
+            elif index < upper:
+                self.middle_sum += value - sorted_samples[upper - 1]
+            self.updates += 1
+        else:
+            self.middle_valid = False
+        sorted_samples.insert(index, value)
+        self.samples.append(value)
+
+    def full(self) -> bool:
+        """Whether window is full"""
+        return len(self.samples) >= self.size
+
+    def interquartile_mean(self) -> float:
+        """Mean of middle half of sorted samples"""
+        total_samples = len(self.sorted_samples)
+        if total_samples < 1:
+            return 0.0
+        if total_samples < 4:
+            return math.fsum(self.sorted_samples) / total_samples
+        if total_samples < self.size:
+            lower = int(total_samples * 0.25)
+            upper = int(total_samples * 0.75)
+            return math.fsum(self.sorted_samples[lower:upper]) / (upper - lower)
+        if not self.middle_valid:
+            # Full recalculation, also corrects accumulated floating point drift
+            self.middle_sum = math.fsum(self.sorted_samples[self.lower:self.upper])
+            self.middle_valid = True
+            self.updates = 0
+        return self.middle_sum / (self.upper - self.lower)
+
+
 # Search
 def search_column_key(key, column=None):
     """Search column key"""
@@ -402,6 +597,36 @@ def binary_search_higher_column(data, target, start, end, column=0):
     return end
 
 
+def spatial_grid(coords, cell_size):
+    """Create uniform spatial grid from coordinates
+
+    Returns:
+        dict, key: (x, y) cell index, value: list of coordinates index.
+    """
+    grid = {}
+    for index, (pos_x, pos_y) in enumerate(coords):
+        key = (int(pos_x // cell_size), int(pos_y // cell_size))
+        cell = grid.get(key)
+        if cell is None:
+            grid[key] = [index]
+        else:
+            cell.append(index)
+    return grid
+
+
+def spatial_grid_nearby(grid, cell_size, pos_x, pos_y, radius):
+    """Find coordinates index from spatial grid cells within radius range of position"""
+    cell_x_min = int((pos_x - radius) // cell_size)
+    cell_x_max = int((pos_x + radius) // cell_size)
+    cell_y_min = int((pos_y - radius) // cell_size)
+    cell_y_max = int((pos_y + radius) // cell_size)
+    for cell_x in range(cell_x_min, cell_x_max + 1):
+        for cell_y in range(cell_y_min, cell_y_max + 1):
+            cell = grid.get((cell_x, cell_y))
+            if cell:
+                yield from cell
+
+
 # Plot
 def zoom_map(coords, map_scale, margin=0):
     """Zoom map data to specific scale, then add margin"""
@@ -468,6 +693,115 @@ def svg_view_box(coords, margin=0):
     return f"{x1} {y1} {x2} {y2}"
 
 
+def simplify_line_index(coords, tolerance, scale_x=1, scale_y=1):
+    """Simplify line with Ramer-Douglas-Peucker algorithm
+
+    coords: ((x,y),(x,y) ...) coordinates.
+    tolerance: maximum perpendicular distance of removed nodes, in scaled unit.
+    scale_x: x coordinates scale.
+    scale_y: y coordinates scale.
+
+    Returns:
+        Tuple of retained nodes index, always includes first & last node.
+    """
+    last_index = len(coords) - 1
+    if last_index < 2:
+        return tuple(range(last_index + 1))
+    x_range = [x_pos * scale_x for x_pos, _ in coords]
+    y_range = [y_pos * scale_y for _, y_pos in coords]
+    tolerance_sq = tolerance * tolerance
+    keep = bytearray(last_index + 1)
+    keep[0] = keep[last_index] = 1
+    segments = [(0, last_index)]
+    while segments:
+        first, last = segments.pop()
+        if last - first < 2:
+            continue
+        start_x = x_range[first]
+        start_y = y_range[first]
+        seg_x = x_range[last] - start_x
+        seg_y = y_range[last] - start_y
+        seg_sq = seg_x * seg_x + seg_y * seg_y
+        max_dist_sq = -1
+        max_index = first
+        for index in range(first + 1, last):
+            pos_x = x_range[index] - start_x
+            pos_y = y_range[index] - start_y
+            if seg_sq:  # perpendicular distance to line
+                cross = pos_x * seg_y - pos_y * seg_x
+                dist_sq = cross * cross / seg_sq
+            else:  # first & last node overlapped
+                dist_sq = pos_x * pos_x + pos_y * pos_y
+            if dist_sq > max_dist_sq:
+                max_dist_sq = dist_sq
+                max_index = index
+        if max_dist_sq > tolerance_sq:
+            keep[max_index] = 1
+            segments.append((first, max_index))
+            segments.append((max_index, last))
+    return tuple(compress(range(last_index + 1), keep))
+
+
+def resample_coords(coords, dists, step):
+    """Resample coordinates at uniform distance interval
+
+    coords: ((x,y),(x,y) ...) coordinates.
+    dists: ((distance,y),(distance,y) ...) distance reference of each coordinates.
+    step: distance interval.
+
+    Returns:
+        Array of interleaved x, y coordinates, starting from 0 distance.
+    """
+    table = array.array("d")
+    total_nodes = len(coords)
+    if total_nodes < 2:
+        return table
+    index = 1
+    pos_dist = 0.0
+    end_dist = dists[-1][0]
+    while pos_dist <= end_dist:
+        while index < total_nodes - 1 and dists[index][0] < pos_dist:
+            index += 1
+        dist_a = dists[index - 1][0]
+        dist_b = dists[index][0]
+        ratio = min(max((pos_dist - dist_a) / (dist_b - dist_a), 0), 1) if dist_b > dist_a else 0
+        pos_a = coords[index - 1]
+        pos_b = coords[index]
+        table.append(pos_a[0] + (pos_b[0] - pos_a[0]) * ratio)
+        table.append(pos_a[1] + (pos_b[1] - pos_a[1]) * ratio)
+        pos_dist = len(table) * 0.5 * step
+    return table
+
+
+def distance_to_coords(table, step, distance):
+    """Look up coordinates at distance from resampled coordinates table
+
+    Returns:
+        (x, y) coordinates, or None if table is empty.
+    """
+    last_index = len(table) // 2 - 1
+    if last_index < 0:
+        return None
+    index = min(max(round(distance / step), 0), last_index) * 2
+    return table[index], table[index + 1]
+
+
+def select_lod_index(lod_levels, display_size):
+    """Select map level of detail index for display size
+
+    lod_levels: ((size, (index, ...)), ...) level of detail, sorted by size.
+    display_size: map display size in pixels.
+
+    Returns:
+        Tuple of nodes index, or None if full detail is required.
+    """
+    if lod_levels:
+        for size, lod_index in lod_levels:
+            if size >= display_size:
+                return lod_index
+    return None
+
+
 def line_intersect_coords(coord_a, coord_b, radians, length):
     """Create intersect line coordinates from 2 coordinates
 
@@ -616,6 +950,97 @@ def fuel_to_energy_ratio(fuel, energy):
     return 0
 
 
+def bootstrap_mean_samples(data, total_samples, seed=0):
+    """Bootstrap resample mean value from data, sorted in ascending order"""
+    rng = random.Random(seed)
+    data_size = len(data)
+    return sorted(mean(rng.choices(data, k=data_size)) for _ in range(total_samples))
+
+
+def solve_pit_strategy(
+    laps_remain, lap_position, fuel_in_tank, capacity_total, laptime_history,
+    consumption_history, pit_time_loss, refuel_rate, saving_time_loss, saving_max,
+    pit_stops_max, total_samples, finish_probability_min):
+    """Solve pit strategy against sampled lap time pace & fuel consumption
+
+    Strategy variants are combinations of pit stop counts, fuel saving target (0.5% step),
+    and extra refueling margin (0.1 lap step). Each variant is checked against bootstrap
+    samples of average consumption for finish probability, and the fastest variant
+    that meets minimum finish probability is selected.
+
+    Args:
+        laps_remain: remaining laps(fraction) from current position.
+        lap_position: current position in laps (completed laps + lap progress).
+        fuel_in_tank: current fuel amount.
+        capacity_total: tank capacity.
+        laptime_history: valid lap time history.
+        consumption_history: valid lap fuel consumption history.
+        pit_time_loss: time loss per pit stop, excluding refueling time.
+        refuel_rate: refueling amount per second.
+        saving_time_loss: lap time loss per 1% fuel saving.
+        saving_max: maximum fuel saving percentage.
+        pit_stops_max: maximum pit stop counts.
+        total_samples: number of bootstrap samples.
+        finish_probability_min: minimum finish probability (fraction).
+
+    Returns:
+        Total variants, pit stop counts, pit stop laps, refuel amount per stop,
+        fuel saving percentage, estimated remaining time, finish probability.
+    """
+    pace_samples = bootstrap_mean_samples(laptime_history, total_samples, 1)
+    consumption_samples = bootstrap_mean_samples(consumption_history, total_samples, 2)
+    pace_mean = mean(pace_samples)
+    consumption_mean = mean(consumption_samples)
+    total_variants = 0
+    best_key = None
+    best_plan = None
+
+    for pit_stops in range(pit_stops_max + 1):
+        for saving_step in range(int(saving_max * 2) + 1):
+            saving = saving_step * 0.5
+            saving_factor = 1 - saving * 0.01
+            consumption_plan = consumption_mean * saving_factor
+            laps_time = laps_remain * (pace_mean + saving * saving_time_loss)
+            # No refueling margin without pit stop
+            for margin_step in range(21 if pit_stops else 1):
+                total_variants += 1
+                if pit_stops:
+                    refuel_total = total_fuel_needed(
+                        laps_remain + margin_step * 0.1, consumption_plan, fuel_in_tank)
+                    # Skip pit stop without refueling, or refueling over capacity
+                    if refuel_total <= 0 or refuel_total > pit_stops * capacity_total:
+                        continue
+                else:
+                    refuel_total = 0
+                # Finish if sampled consumption not higher than fuel available per lap
+                consumption_finish = (
+                    (fuel_in_tank + refuel_total) / (laps_remain * saving_factor)
+                    if laps_remain > 0 else consumption_samples[-1])
+                finish_probability = bisect_right(
+                    consumption_samples, consumption_finish) / total_samples
+                time_total = (
+                    laps_time + pit_stops * pit_time_loss + refuel_total / refuel_rate)
+                if finish_probability >= finish_probability_min:
+                    key = (0, time_total)
+                else:
+                    key = (1, -finish_probability, time_total)
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_plan = (
+                        pit_stops, refuel_total, consumption_plan, saving,
+                        time_total, finish_probability)
+
+    pit_stops, refuel_total, consumption_plan, saving, time_total, finish_probability = best_plan
+    # Pit stop at the end of lap before fuel runs out
+    refuel_stop = refuel_total / pit_stops if pit_stops else 0
+    pit_laps = tuple(
+        math.floor(lap_position + (fuel_in_tank + stop * refuel_stop) / consumption_plan)
+        for stop in range(pit_stops)
+    ) if consumption_plan else ()
+    return (total_variants, pit_stops, pit_laps, refuel_stop, saving,
+            time_total, finish_probability)
+
+
 # Tyre
 def tyre_wear_difference(wear_curr: float, wear_prev: float, wear_total: float):
     """Tyre wear difference and accumulated total wear"""
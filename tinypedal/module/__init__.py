@@ -34,6 +34,7 @@ from . import (
     module_relative,
     module_restapi,
     module_sectors,
+    module_strategy,
     module_vehicles,
     module_wheels,
 )
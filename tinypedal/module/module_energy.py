@@ -23,11 +23,10 @@ Energy module
 import logging
 
 from ._base import DataModule
-from .module_fuel import calc_data
+from .module_fuel import ConsumptionEngine, telemetry_energy, update_fuel_energy_ratio
 from ..module_info import minfo
 from ..const import PATH_ENERGY
 from ..api_control import api
-from .. import calculation as calc
 
 MODULE_NAME = "module_energy"
 
@@ -35,7 +34,11 @@ logger = logging.getLogger(__name__)
 
 
 class Realtime(DataModule):
-    """Energy usage data"""
+    """Energy usage data
+
+    Energy usage is tracked by fuel module consumption engine while fuel module
+    is enabled, otherwise runs separate consumption engine for energy only.
+    """
     filepath = PATH_ENERGY
 
     def __init__(self, config):
@@ -45,41 +48,34 @@ class Realtime(DataModule):
         """Update module data"""
         reset = False
         update_interval = self.active_interval
+        engine = ConsumptionEngine()
 
         while not self.event.wait(update_interval):
-            if self.state.active:
+            if self.state.active and not self.cfg.user.setting["module_fuel"]["enable"]:
 
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
 
                     combo_id = api.read.check.combo_id()
-                    gen_calc_energy = calc_data(
-                        minfo.energy, telemetry_energy, self.filepath, combo_id, "energy")
-                    # Initial run to reset module output
-                    next(gen_calc_energy)
-                    gen_calc_energy.send(True)
+                    engine.reset()
+                    engine.add(
+                        minfo.energy, telemetry_energy, self.filepath, combo_id, "energy",
+                        self.energy_available)
 
                 # Run calculation if virtual energy available
-                if minfo.restapi.maxVirtualEnergy:
-                    gen_calc_energy.send(True)
-
-                    # Update fuel to energy ratio
-                    minfo.hybrid.fuelEnergyRatio = calc.fuel_to_energy_ratio(
-                        minfo.fuel.estimatedConsumption,
-                        minfo.energy.estimatedConsumption)
+                engine.update()
+                if self.energy_available():
+                    update_fuel_energy_ratio()
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
                     # Trigger save check
-                    gen_calc_energy.send(False)
-
+                    engine.save()
 
-def telemetry_energy():
-    """Telemetry energy, output in percentage"""
-    max_energy = minfo.restapi.maxVirtualEnergy
-    if max_energy:
-        return 100, minfo.restapi.currentVirtualEnergy / max_energy * 100
-    return 100, 0
+    @staticmethod
+    def energy_available():
+        """Whether virtual energy available"""
+        return minfo.restapi.maxVirtualEnergy
@@ -20,7 +20,6 @@
 Force module
 """
 
-import array
 import logging
 
 from ._base import DataModule
@@ -115,20 +114,19 @@ class Realtime(DataModule):
     def calc_max_avg_gforce(self):
         """Calc max average G force"""
         max_samples = max(int(self.mcfg["max_average_g_force_samples"]), 3)
-        g_samples = array.array("f", [0] * max_samples)
+        g_samples = calc.RollingStats(max_samples)
         g_abs = 0
         g_abs_last = 0
         g_max_avg = 0       # max average g
         g_max_avg_alt = 0   # secondary max average g
         sample_counter = 0
-        sample_idx = 0
         etime = 0
         reset_timer = 0
         reset_max = False
         while True:
             if sample_counter >= max_samples:
-                g_avg = calc.mean(g_samples)
-                g_std = calc.std_dev(g_samples, g_avg)
+                g_avg = g_samples.mean()
+                g_std = g_samples.std_dev()
                 valid_range = 0 < g_std <= self.mcfg["max_average_g_force_difference"]
                 if g_avg > g_max_avg and valid_range:
                     g_max_avg = g_avg
@@ -147,13 +145,10 @@ class Realtime(DataModule):
             if reset_timer and etime - reset_timer > self.mcfg["max_average_g_force_reset_delay"]:
                 reset_timer = 0
                 reset_max = True
-            # Reset sample index
-            if sample_idx >= max_samples:
-                sample_idx = 0
             # Update data if pos diff
             if g_abs != g_abs_last:
-                g_samples[sample_idx] = g_abs_last = g_abs
-                sample_idx += 1
+                g_samples.add(g_abs)
+                g_abs_last = g_abs
                 if sample_counter < max_samples:
                     sample_counter += 1
             # Output
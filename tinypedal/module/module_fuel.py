@@ -27,7 +27,7 @@ from math import ceil as roundup
 
 from ._base import DataModule
 from ..module_info import minfo
-from ..const import PATH_FUEL
+from ..const import PATH_ENERGY, PATH_FUEL
 from ..api_control import api
 from .. import calculation as calc
 from .. import validator as val
@@ -41,7 +41,11 @@ round6 = partial(round, ndigits=6)
 
 
 class Realtime(DataModule):
-    """Fuel usage data"""
+    """Fuel usage data
+
+    Also tracks virtual energy usage while energy module is enabled,
+    so that both share one consumption engine & telemetry reading.
+    """
     filepath = PATH_FUEL
 
     def __init__(self, config):
@@ -51,6 +55,7 @@ class Realtime(DataModule):
         """Update module data"""
         reset = False
         update_interval = self.active_interval
+        engine = ConsumptionEngine()
 
         while not self.event.wait(update_interval):
             if self.state.active:
@@ -60,14 +65,17 @@ class Realtime(DataModule):
                     update_interval = self.active_interval
 
                     combo_id = api.read.check.combo_id()
-                    gen_calc_fuel = calc_data(
+                    engine.reset()
+                    engine.add(
                         minfo.fuel, telemetry_fuel, self.filepath, combo_id, "fuel")
-                    # Initial run to reset module output
-                    next(gen_calc_fuel)
-                    gen_calc_fuel.send(True)
+                    engine.add(
+                        minfo.energy, telemetry_energy, PATH_ENERGY, combo_id, "energy",
+                        self.energy_enabled)
 
                 # Run calculation
-                gen_calc_fuel.send(True)
+                engine.update()
+                if self.energy_enabled():
+                    update_fuel_energy_ratio()
 
                 # Update consumption history
                 if (minfo.history.consumption[0][2] != minfo.delta.lapTimeLast
@@ -86,7 +94,74 @@ class Realtime(DataModule):
                     reset = False
                     update_interval = self.idle_interval
                     # Trigger save check
-                    gen_calc_fuel.send(False)
+                    engine.save()
+
+    def energy_enabled(self):
+        """Whether to track virtual energy usage"""
+        return (self.cfg.user.setting["module_energy"]["enable"]
+                and minfo.restapi.maxVirtualEnergy)
+
+
+class ConsumptionEngine:
+    """Consumption engine
+
+    Reads shared timing & position telemetry once per update,
+    then runs consumption calculation for each tracked consumable.
+    """
+
+    def __init__(self):
+        self._consumables = []
+
+    def reset(self):
+        """Reset consumables"""
+        self._consumables.clear()
+
+    def add(self, output, telemetry_func, filepath, combo_id, extension, condition=None):
+        """Add consumable
+
+        Args:
+            output: module output data.
+            telemetry_func: function returns consumable capacity, current amount.
+            filepath: consumption delta file path.
+            combo_id: track & vehicle class combo id.
+            extension: consumption delta file extension.
+            condition: optional function, only update consumable while returns True.
+        """
+        gen_calc = calc_data(output, telemetry_func, filepath, combo_id, extension)
+        # Initial run to reset module output
+        next(gen_calc)
+        gen_calc.send(read_telemetry())
+        self._consumables.append((gen_calc, condition))
+
+    def update(self):
+        """Update all consumables"""
+        telemetry = read_telemetry()
+        for gen_calc, condition in self._consumables:
+            if condition is None or condition():
+                gen_calc.send(telemetry)
+
+    def save(self):
+        """Trigger save check for all consumables"""
+        for gen_calc, _ in self._consumables:
+            gen_calc.send(None)
+
+
+def read_telemetry():
+    """Read telemetry shared by all consumables"""
+    return (
+        api.read.timing.start(),
+        max(api.read.timing.current_laptime(), 0),
+        api.read.timing.elapsed(),
+        api.read.session.remaining(),
+        api.read.session.lap_type(),
+        api.read.lap.maximum(),
+        api.read.vehicle.in_garage(),
+        api.read.vehicle.in_pits(),
+        api.read.lap.distance(),
+        api.read.vehicle.position_xyz(),
+        api.read.lap.completed_laps(),
+        api.read.lap.progress(),
+    )
 
 
 def telemetry_fuel():
@@ -96,8 +171,26 @@ def telemetry_fuel():
     return capacity, amount_curr
 
 
+def telemetry_energy():
+    """Telemetry energy, output in percentage"""
+    max_energy = minfo.restapi.maxVirtualEnergy
+    if max_energy:
+        return 100, minfo.restapi.currentVirtualEnergy / max_energy * 100
+    return 100, 0
+
+
+def update_fuel_energy_ratio():
+    """Update fuel to energy ratio"""
+    minfo.hybrid.fuelEnergyRatio = calc.fuel_to_energy_ratio(
+        minfo.fuel.estimatedConsumption,
+        minfo.energy.estimatedConsumption)
+
+
 def calc_data(output, telemetry_func, filepath, combo_id, extension):
-    """Calculate data"""
+    """Calculate data
+
+    Send shared telemetry to update, or None to trigger save check.
+    """
     recording = False
     delayed_save = False
     validating = 0
@@ -131,25 +224,19 @@ def calc_data(output, telemetry_func, filepath, combo_id, extension):
     gps_last = [0,0,0]  # last global position
 
     while True:
-        updating = yield None
+        telemetry = yield None
 
         # Save check
-        if not updating:
+        if telemetry is None:
             if delayed_save:
                 save_delta(delta_list_last, filepath, combo_id, extension)
             continue
 
         # Read telemetry
         capacity, amount_curr = telemetry_func()
-        lap_stime = api.read.timing.start()
-        laptime_curr = max(api.read.timing.current_laptime(), 0)
-        time_left = api.read.session.remaining()
-        in_garage = api.read.vehicle.in_garage()
-        pos_curr = api.read.lap.distance()
-        gps_curr = api.read.vehicle.position_xyz()
-        laps_done = api.read.lap.completed_laps()
-        lap_into = api.read.lap.progress()
-        pit_lap = bool(pit_lap + api.read.vehicle.in_pits())
+        (lap_stime, laptime_curr, time_elapsed, time_left, lap_type, laps_max,
+         in_garage, in_pits, pos_curr, gps_curr, laps_done, lap_into) = telemetry
+        pit_lap = bool(pit_lap + in_pits)
         laptime_last = minfo.delta.lapTimePace
 
         # Realtime fuel consumption
@@ -169,7 +256,7 @@ def calc_data(output, telemetry_func, filepath, combo_id, extension):
                     round6(lap_stime - last_lap_stime)
                 ))
                 delta_list_temp = delta_list_curr
-                validating = api.read.timing.elapsed()
+                validating = time_elapsed
             delta_list_curr = [DELTA_ZERO]  # reset
             pos_last = pos_curr
             used_last_raw = used_curr
@@ -191,7 +278,7 @@ def calc_data(output, telemetry_func, filepath, combo_id, extension):
 
         # Validating 1s after passing finish line
         if validating:
-            timer = api.read.timing.elapsed() - validating
+            timer = time_elapsed - validating
             if (0.3 < timer <= 3 and  # compare current time
                 api.read.timing.last_laptime() > 0):  # is valid laptime
                 used_last = used_last_raw
@@ -223,9 +310,9 @@ def calc_data(output, telemetry_func, filepath, combo_id, extension):
             used_last, delta_fuel, 0 == pit_lap < laps_done)
 
         # Total refuel = laps left * last consumption - remaining fuel
-        if api.read.session.lap_type():  # lap-type
+        if lap_type:  # lap-type
             full_laps_left = calc.lap_type_full_laps_remain(
-                api.read.lap.maximum(), laps_done)
+                laps_max, laps_done)
             laps_left = calc.lap_type_laps_remain(
                 full_laps_left, lap_into)
         elif laptime_last > 0:  # time-type race
@@ -21,7 +21,12 @@ Mapping module
 """
 
 import logging
+import os
+import struct
+import sys
 import xml.dom.minidom
+from array import array
+from bisect import bisect_right
 from functools import partial
 
 from ._base import DataModule
@@ -36,6 +41,28 @@ MODULE_NAME = "module_mapping"
 logger = logging.getLogger(__name__)
 round4 = partial(round, ndigits=4)
 
+# Binary map cache
+CACHE_EXT = "map"
+CACHE_MAGIC = b"TPMP"
+CACHE_VERSION = 2
+# magic, version, coords count, dists count, sector index x2,
+# svg mtime (ns), svg size, coords hash, dists hash, LOD levels
+CACHE_HEADER = struct.Struct("<4sHIIiiqqqqH")
+# LOD display size, nodes count
+CACHE_LOD_HEADER = struct.Struct("<II")
+CACHE_SWAP_BYTES = sys.byteorder != "little"
+
+# Map level of detail
+LOD_SIZES = (256, 512, 1024, 2048, 4096)  # display size in pixels
+LOD_TOLERANCE = 0.5  # maximum node deviation in pixels
+
+# Lap distance to coordinates table
+TABLE_STEP = 1.0  # distance interval in meters
+
+# Map recording
+MAP_BIN_SIZE = 1.0  # lap distance bin size in meters
+MAP_CONVERGED_SHIFT = 0.1  # average map position shift in meters from last lap
+
 
 class Realtime(DataModule):
     """Mapping data"""
@@ -46,7 +73,9 @@ class Realtime(DataModule):
     def update_data(self):
         """Update module data"""
         reset = False
-        recorder = MapRecorder()
+        min_laps = max(int(self.mcfg["number_of_minimum_averaging_laps"]), 1)
+        max_laps = max(int(self.mcfg["number_of_maximum_averaging_laps"]), min_laps)
+        recorder = MapRecorder(min_laps, max_laps)
         update_interval = self.active_interval
 
         while not self.event.wait(update_interval):
@@ -60,15 +89,22 @@ class Realtime(DataModule):
                     if recorder.map.exist:
                         update_interval = self.idle_interval
                         minfo.mapping.coordinates = recorder.map.raw_coords
-                        minfo.mapping.coordinatesHash = hash(minfo.mapping.coordinates)
+                        minfo.mapping.coordinatesLOD = recorder.map.coords_lod
+                        minfo.mapping.coordinatesTable = recorder.map.coords_table
+                        minfo.mapping.coordinatesTableStep = TABLE_STEP
+                        minfo.mapping.coordinatesHash = recorder.map.coords_hash
                         minfo.mapping.elevations = recorder.map.raw_dists
-                        minfo.mapping.elevationsHash = hash(minfo.mapping.elevations)
+                        minfo.mapping.elevationsLOD = recorder.map.dists_lod
+                        minfo.mapping.elevationsHash = recorder.map.dists_hash
                         minfo.mapping.sectors = recorder.map.sectors_index
                     else:
                         recorder.reset()
                         minfo.mapping.coordinates = None
+                        minfo.mapping.coordinatesLOD = None
+                        minfo.mapping.coordinatesTable = None
                         minfo.mapping.coordinatesHash = None
                         minfo.mapping.elevations = None
+                        minfo.mapping.elevationsLOD = None
                         minfo.mapping.elevationsHash = None
                         minfo.mapping.sectors = None
 
@@ -83,10 +119,19 @@ class Realtime(DataModule):
 
 
 class MapRecorder:
-    """Map data recorder"""
+    """Map data recorder
 
-    def __init__(self):
+    Samples are accumulated into fixed size lap distance bins while recording,
+    and bins from several clean laps are averaged until map position converged.
+    """
+
+    def __init__(self, min_laps, max_laps):
         self.map = MapData()
+        self._min_laps = min_laps
+        self._max_laps = max_laps
+        self._lap_bins = MapBins()  # current lap
+        self._pending_bins = MapBins()  # last lap, pending validation
+        self._average_bins = MapBins()  # averaged clean laps
         self._recording = False
         self._validating = False
         self._last_lap_stime = -1  # last lap start time
@@ -95,6 +140,9 @@ class MapRecorder:
 
     def reset(self):
         """Reset to defaults"""
+        self._lap_bins.reset()
+        self._pending_bins.reset()
+        self._average_bins.reset()
         self._recording = False
         self._validating = False
         self._last_sector_idx = -1
@@ -118,7 +166,9 @@ class MapRecorder:
         if self._validating:
             self.__validate(lap_etime, laptime_valid)
         if self._recording:
-            self.__record_sector(sector_idx)
+            if api.read.vehicle.in_pits():
+                self._lap_bins.in_pit = True
+            self.__record_sector(sector_idx, pos_curr)
             self.__record_path(pos_curr, gps_curr, elv_curr)
 
     def __start(self, lap_stime):
@@ -126,11 +176,12 @@ class MapRecorder:
         # Init reset
         if self._last_lap_stime == -1:
             self.map.reset()
+            self._lap_bins.reset(api.read.lap.track_length())
             self._last_lap_stime = lap_stime
         # New lap
         if lap_stime > self._last_lap_stime:
             self.__record_end()
-            self.map.reset()
+            self._lap_bins.reset(api.read.lap.track_length())
             self._last_lap_stime = lap_stime
             self._pos_last = 0
             self._recording = True
@@ -140,21 +191,36 @@ class MapRecorder:
         """Validate map data after crossing finish line"""
         laptime_curr = lap_etime - self._last_lap_stime
         if 1 < laptime_curr <= 8 and laptime_valid > 0:
-            self.map.save()
-            self.map.exist = True
-            self._recording = False
             self._validating = False
+            if not self._pending_bins.in_pit:
+                self.__average()
         # Switch off validating after 8s
         elif 8 < laptime_curr < 10:
             self._validating = False
 
-    def __record_sector(self, sector_idx):
-        """Record sector index"""
+    def __average(self):
+        """Average clean lap, save map if converged"""
+        map_shift = self._average_bins.merge(self._pending_bins)
+        total_laps = self._average_bins.total_laps
+        if total_laps < self._min_laps:
+            return
+        # Single lap has no shift to converge, save first lap if minimum is 1 lap
+        if (total_laps >= self._max_laps or map_shift < MAP_CONVERGED_SHIFT
+                or total_laps == self._min_laps == 1):
+            self.map.raw_coords, self.map.raw_dists, self.map.sectors_index = (
+                self._average_bins.output())
+            self.map.save()
+            self.map.exist = True
+            self._recording = False
+            #logger.info("map saved, averaged %s laps", total_laps)
+
+    def __record_sector(self, sector_idx, pos_curr):
+        """Record sector lap distance"""
         if self._last_sector_idx != sector_idx:
             if sector_idx == 1:
-                self.map.sectors_index[0] = len(self.map.raw_coords) - 1
+                self._lap_bins.sectors_dist[0] = pos_curr
             elif sector_idx == 2:
-                self.map.sectors_index[1] = len(self.map.raw_coords) - 1
+                self._lap_bins.sectors_dist[1] = pos_curr
             self._last_sector_idx = sector_idx
 
     def __record_path(self, pos_curr, gps_curr, elv_curr):
@@ -162,17 +228,123 @@ class MapRecorder:
         # Update if position value is different & positive
         if 0 <= pos_curr != self._pos_last:
             if pos_curr > self._pos_last:  # position further
-                self.map.raw_coords.append(gps_curr)
-                self.map.raw_dists.append((pos_curr, elv_curr))
+                self._lap_bins.add(pos_curr, gps_curr, elv_curr)
             self._pos_last = pos_curr  # reset last position
 
     def __record_end(self):
-        """End recording"""
-        if self.map.raw_coords:
-            self.map.copy()
+        """End recording, swap recorded lap to pending validation"""
+        if self._lap_bins.total_samples:
+            self._lap_bins, self._pending_bins = self._pending_bins, self._lap_bins
             self._validating = True
 
 
+class MapBins:
+    """Map data lap distance bins
+
+    Each bin accumulates sum of lap distance, x, y coordinates & elevation,
+    which is averaged from samples of a single lap, or from laps of averaged bins.
+    """
+
+    def __init__(self):
+        self.dist = array("d")
+        self.pos_x = array("d")
+        self.pos_y = array("d")
+        self.elevation = array("d")
+        self.count = array("I")
+        self.sectors_dist = [0, 0]
+        self.total_samples = 0
+        self.total_laps = 0
+        self.in_pit = False
+
+    def reset(self, track_length=0):
+        """Reset bins, allocate bins for track length"""
+        self.dist = array("d")
+        self.pos_x = array("d")
+        self.pos_y = array("d")
+        self.elevation = array("d")
+        self.count = array("I")
+        self.extend(int(track_length / MAP_BIN_SIZE) + 1)
+        self.sectors_dist = [0, 0]
+        self.total_samples = 0
+        self.total_laps = 0
+        self.in_pit = False
+
+    def extend(self, total_bins):
+        """Extend bins to total bins"""
+        extend = total_bins - len(self.count)
+        if extend > 0:
+            self.dist.extend(array("d", [0]) * extend)
+            self.pos_x.extend(array("d", [0]) * extend)
+            self.pos_y.extend(array("d", [0]) * extend)
+            self.elevation.extend(array("d", [0]) * extend)
+            self.count.extend(array("I", [0]) * extend)
+
+    def add(self, pos_curr, gps_curr, elv_curr):
+        """Add sample to bin"""
+        index = int(pos_curr / MAP_BIN_SIZE)
+        if index >= len(self.count):  # beyond track length
+            self.extend(index + 1)
+        self.dist[index] += pos_curr
+        self.pos_x[index] += gps_curr[0]
+        self.pos_y[index] += gps_curr[1]
+        self.elevation[index] += elv_curr
+        self.count[index] += 1
+        self.total_samples += 1
+
+    def merge(self, lap_bins):
+        """Merge lap bins average, each lap counts once per bin
+
+        Returns:
+            Average position shift of merged bins, or infinity if first lap.
+        """
+        self.extend(len(lap_bins.count))
+        total_shift = 0
+        total_shifted = 0
+        for index, samples in enumerate(lap_bins.count):
+            if not samples:
+                continue
+            lap_x = lap_bins.pos_x[index] / samples
+            lap_y = lap_bins.pos_y[index] / samples
+            laps = self.count[index]
+            if laps:
+                # Shift of bin average after adding lap = lap offset / (laps + 1)
+                total_shift += calc.distance(
+                    (lap_x, lap_y),
+                    (self.pos_x[index] / laps, self.pos_y[index] / laps)
+                ) / (laps + 1)
+                total_shifted += 1
+            self.dist[index] += lap_bins.dist[index] / samples
+            self.pos_x[index] += lap_x
+            self.pos_y[index] += lap_y
+            self.elevation[index] += lap_bins.elevation[index] / samples
+            self.count[index] = laps + 1
+        self.sectors_dist = lap_bins.sectors_dist[:]
+        self.total_samples += lap_bins.total_samples
+        self.total_laps += 1
+        if total_shifted:
+            return total_shift / total_shifted
+        return float("inf")
+
+    def output(self):
+        """Output averaged bins as raw coordinates, raw distances, sector index"""
+        raw_coords = []
+        raw_dists = []
+        for index, laps in enumerate(self.count):
+            if laps:
+                raw_coords.append((
+                    round4(self.pos_x[index] / laps),
+                    round4(self.pos_y[index] / laps)))
+                raw_dists.append((
+                    round4(self.dist[index] / laps),
+                    round4(self.elevation[index] / laps)))
+        # Sector index, last node before sector line
+        sectors_index = tuple(
+            max(bisect_right(raw_dists, (sector_dist,)) - 1, 0)
+            for sector_dist in self.sectors_dist
+        )
+        return tuple(raw_coords), tuple(raw_dists), sectors_index
+
+
 class MapData:
     """Map data"""
 
@@ -182,36 +354,47 @@ class MapData:
         self.raw_coords = None
         self.raw_dists = None
         self.sectors_index = None
+        self.coords_hash = None
+        self.dists_hash = None
+        self.coords_lod = None
+        self.dists_lod = None
+        self.coords_table = None
         # File info
         self._filepath = PATH_TRACKMAP
         self._filename = None
-        # Temp data
-        self._temp_raw_coords = None
-        self._temp_raw_dists = None
-        self._temp_sectors_index = None
 
     def reset(self):
         """Reset map data"""
         self.exist = False
-        self.raw_coords = []
-        self.raw_dists = []
-        self.sectors_index = [0,0]
-
-    def copy(self):
-        """Copy map data to temp and convert to tuple for hash"""
-        self._temp_raw_coords = tuple(self.raw_coords)
-        self._temp_raw_dists = tuple(self.raw_dists)
-        self._temp_sectors_index = tuple(self.sectors_index)
+        self.raw_coords = None
+        self.raw_dists = None
+        self.sectors_index = None
 
     def load(self, filename):
         """Load map data file"""
         self._filename = filename
-        # Load map file
-        raw_coords, raw_dists, sectors_index = load_svg_file(self._filename, self._filepath)
+        # Load binary map cache first, fall back to svg file & rebuild cache
+        map_cache = load_map_cache(self._filename, self._filepath)
+        if map_cache:
+            (raw_coords, raw_dists, sectors_index, coords_hash, dists_hash,
+             coords_lod, dists_lod) = map_cache
+        else:
+            raw_coords, raw_dists, sectors_index = load_svg_file(self._filename, self._filepath)
+            if raw_coords and raw_dists:
+                coords_lod = create_map_lod(raw_coords, True)
+                dists_lod = create_map_lod(raw_dists, False)
+                coords_hash, dists_hash = save_map_cache(
+                    self._filename, self._filepath, raw_coords, raw_dists, sectors_index,
+                    coords_lod, dists_lod)
         if raw_coords and raw_dists:
             self.raw_coords = raw_coords
             self.raw_dists = raw_dists
             self.sectors_index = sectors_index
+            self.coords_hash = coords_hash
+            self.dists_hash = dists_hash
+            self.coords_lod = coords_lod
+            self.dists_lod = dists_lod
+            self.coords_table = calc.resample_coords(raw_coords, raw_dists, TABLE_STEP)
             self.exist = True
             #logger.info("map exist")
         else:
@@ -219,10 +402,7 @@ class MapData:
             #logger.info("map not exist")
 
     def save(self):
-        """Store & convert raw coordinates to svg points data"""
-        self.raw_coords = self._temp_raw_coords
-        self.raw_dists = self._temp_raw_dists
-        self.sectors_index = self._temp_sectors_index
+        """Convert raw coordinates to svg points data & save"""
         # Save to svg file
         save_svg_file(
             self._filename,
@@ -232,9 +412,46 @@ class MapData:
             calc.svg_view_box(self.raw_coords, 20),
             self.sectors_index
         )
+        self.coords_lod = create_map_lod(self.raw_coords, True)
+        self.dists_lod = create_map_lod(self.raw_dists, False)
+        self.coords_table = calc.resample_coords(self.raw_coords, self.raw_dists, TABLE_STEP)
+        self.coords_hash, self.dists_hash = save_map_cache(
+            self._filename,
+            self._filepath,
+            self.raw_coords,
+            self.raw_dists,
+            self.sectors_index,
+            self.coords_lod,
+            self.dists_lod
+        )
         #logger.info("map saved, stopped map recording")
 
 
+def create_map_lod(raw_coords, keep_aspect_ratio):
+    """Create map level of detail
+
+    Each level is simplified for a display size in pixels,
+    with map bounding box normalized to unit size.
+
+    Args:
+        raw_coords: raw coordinates.
+        keep_aspect_ratio: whether to use same scale for x & y coordinates,
+            set False for elevation which scales each axis separately.
+
+    Returns:
+        ((size, (index, ...)), ...) retained nodes index for each display size.
+    """
+    x_range, y_range = tuple(zip(*raw_coords))
+    scale_x = 1 / max(max(x_range) - min(x_range), 0.0001)
+    scale_y = 1 / max(max(y_range) - min(y_range), 0.0001)
+    if keep_aspect_ratio:
+        scale_x = scale_y = min(scale_x, scale_y)
+    return tuple(
+        (size, calc.simplify_line_index(raw_coords, LOD_TOLERANCE / size, scale_x, scale_y))
+        for size in LOD_SIZES
+    )
+
+
 def load_svg_file(filename, pathname):
     """Load svg file"""
     try:
@@ -323,3 +540,96 @@ def save_svg_file(filename, pathname, raw_coords, raw_dists, view_box, sector_in
     # Save svg
     with open(f"{pathname}{filename}.svg", "w", encoding="utf-8") as svgfile:
         new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
+
+
+def load_map_cache(filename, pathname):
+    """Load binary map cache
+
+    Cache is only valid if svg file size & modified time match cache header,
+    so that any edit to or removal of the svg file invalidates the cache.
+
+    Returns:
+        Raw coordinates, raw distances, sector index, coordinates hash, distances hash,
+        coordinates LOD, distances LOD, or None if cache is missing or outdated.
+    """
+    try:
+        svg_stat = os.stat(f"{pathname}{filename}.svg")
+        with open(f"{pathname}{filename}.{CACHE_EXT}", "rb") as cache_file:
+            (magic, version, coords_size, dists_size, sector_x, sector_y,
+             svg_mtime, svg_size, coords_hash, dists_hash, lod_levels
+             ) = CACHE_HEADER.unpack(cache_file.read(CACHE_HEADER.size))
+            if (magic != CACHE_MAGIC or version != CACHE_VERSION
+                or svg_mtime != svg_stat.st_mtime_ns or svg_size != svg_stat.st_size):
+                return None
+            coords = array("d")
+            coords.fromfile(cache_file, coords_size * 2)
+            dists = array("d")
+            dists.fromfile(cache_file, dists_size * 2)
+            coords_lod = read_lod_cache(cache_file, lod_levels)
+            dists_lod = read_lod_cache(cache_file, lod_levels)
+    except (OSError, EOFError, struct.error):
+        return None
+    if CACHE_SWAP_BYTES:
+        coords.byteswap()
+        dists.byteswap()
+    raw_coords = tuple(zip(coords[0::2], coords[1::2]))
+    raw_dists = tuple(zip(dists[0::2], dists[1::2]))
+    return (raw_coords, raw_dists, (sector_x, sector_y), coords_hash, dists_hash,
+            coords_lod, dists_lod)
+
+
+def save_map_cache(filename, pathname, raw_coords, raw_dists, sector_index,
+                   coords_lod, dists_lod):
+    """Save binary map cache next to svg file
+
+    Coordinates are stored as packed little-endian doubles,
+    which keeps values identical to svg points data.
+
+    Returns:
+        Coordinates hash, distances hash.
+    """
+    coords_hash = hash(raw_coords)
+    dists_hash = hash(raw_dists)
+    coords = array("d", (value for coords in raw_coords for value in coords))
+    dists = array("d", (value for dists in raw_dists for value in dists))
+    if CACHE_SWAP_BYTES:
+        coords.byteswap()
+        dists.byteswap()
+    try:
+        svg_stat = os.stat(f"{pathname}{filename}.svg")
+        with open(f"{pathname}{filename}.{CACHE_EXT}", "wb") as cache_file:
+            cache_file.write(CACHE_HEADER.pack(
+                CACHE_MAGIC, CACHE_VERSION, len(raw_coords), len(raw_dists),
+                sector_index[0], sector_index[1],
+                svg_stat.st_mtime_ns, svg_stat.st_size, coords_hash, dists_hash,
+                len(coords_lod)))
+            coords.tofile(cache_file)
+            dists.tofile(cache_file)
+            write_lod_cache(cache_file, coords_lod)
+            write_lod_cache(cache_file, dists_lod)
+    except OSError:
+        logger.info("FAILED: saving track map cache")
+    return coords_hash, dists_hash
+
+
+def read_lod_cache(cache_file, lod_levels):
+    """Read map level of detail from cache file"""
+    lod_data = []
+    for _ in range(lod_levels):
+        size, total_nodes = CACHE_LOD_HEADER.unpack(cache_file.read(CACHE_LOD_HEADER.size))
+        lod_index = array("I")
+        lod_index.fromfile(cache_file, total_nodes)
+        if CACHE_SWAP_BYTES:
+            lod_index.byteswap()
+        lod_data.append((size, tuple(lod_index)))
+    return tuple(lod_data)
+
+
+def write_lod_cache(cache_file, lod_data):
+    """Write map level of detail to cache file"""
+    for size, lod_index in lod_data:
+        cache_file.write(CACHE_LOD_HEADER.pack(size, len(lod_index)))
+        lod_index = array("I", lod_index)
+        if CACHE_SWAP_BYTES:
+            lod_index.byteswap()
+        lod_index.tofile(cache_file)
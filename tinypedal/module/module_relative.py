@@ -20,18 +20,19 @@
 Relative module
 """
 
+import array
 import logging
 from functools import lru_cache
 from itertools import chain
 from operator import itemgetter
 
 from ._base import DataModule
-from ..module_info import minfo
+from ..module_info import minfo, MAX_VEHICLES
 from ..api_control import api
 from .. import calculation as calc
 
 MODULE_NAME = "module_relative"
-ALL_PLACES = list(range(1, 129))
+ALL_PLACES = list(range(1, MAX_VEHICLES + 1))
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,11 @@ class Realtime(DataModule):
         update_interval = self.active_interval
         setting_relative = self.cfg.user.setting["relative"]
         setting_standings = self.cfg.user.setting["standings"]
+        rel_order = RelativeOrder()
+        last_class_hash = None
+        last_standings_hash = None
+        class_pos_list = place_index_list = stand_idx_list = None
+        is_multi_class = False
 
         while not self.event.wait(update_interval):
             if self.state.active:
@@ -55,6 +61,9 @@ class Realtime(DataModule):
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
+                    rel_order.reset()
+                    last_class_hash = None
+                    last_standings_hash = None
 
                 # Check setting
                 show_garage_in_race = setting_relative["show_vehicle_in_garage_for_race"]
@@ -76,16 +85,25 @@ class Realtime(DataModule):
                 plr_place = api.read.vehicle.place()
 
                 # Create relative list, reverse-sort by relative distance
-                rel_dist_list = sorted(
-                    get_relative_distance(veh_total, show_garage_in_race), reverse=True)
+                rel_order.update(veh_total, plr_index, show_garage_in_race)
                 rel_idx_list = create_relative_index(
-                    rel_dist_list, plr_index, max_rel_veh, add_front, add_behind)
-
-                # Create standings list
-                class_pos_list, place_index_list, is_multi_class = create_class_position(veh_total)
-                stand_idx_list = create_standings_index(
-                    min_top_veh, veh_limit, veh_total, plr_index, plr_place,
-                    class_pos_list, place_index_list, is_split_mode and is_multi_class)
+                    rel_order.order, rel_order.player_pos, max_rel_veh, add_front, add_behind)
+
+                # Create standings list, only if scoring data or setting changed
+                veh_class_data = tuple(get_vehicle_class_data(veh_total))
+                class_hash = hash(veh_class_data)
+                if last_class_hash != class_hash:
+                    last_class_hash = class_hash
+                    class_pos_list, place_index_list, is_multi_class = create_class_position(
+                        veh_class_data)
+
+                standings_hash = hash((
+                    class_hash, plr_index, plr_place, min_top_veh, veh_limit, is_split_mode))
+                if last_standings_hash != standings_hash:
+                    last_standings_hash = standings_hash
+                    stand_idx_list = create_standings_index(
+                        min_top_veh, veh_limit, veh_total, plr_index, plr_place,
+                        class_pos_list, place_index_list, is_split_mode and is_multi_class)
 
                 # Output data
                 minfo.relative.classes = class_pos_list
@@ -98,19 +116,119 @@ class Realtime(DataModule):
                     update_interval = self.idle_interval
 
 
-def get_relative_distance(veh_total: int, show_garage_in_race: bool):
-    """Get relative distance data"""
-    track_length = api.read.lap.track_length()  # track length
-    plr_dist = api.read.lap.distance()
-    race_check = not show_garage_in_race and api.read.session.in_race()
-    for index in range(veh_total):
-        in_garage = api.read.vehicle.in_garage(index)
-        opt_dist = api.read.lap.distance(index)
-        # Whether to hide vehicle in garage during race (ex. retired)
-        if not race_check or not in_garage:
-            rel_dist = calc.circular_relative_distance(
-                track_length, plr_dist, opt_dist)
-            yield (rel_dist, index)  # relative distance, player index
+class RelativeOrder:
+    """Relative order
+
+    Vehicle index list reverse-sorted by relative distance.
+    Order barely changes between updates, so existing list is repaired
+    with insertion sort (close to O(N) on nearly sorted list),
+    and player position is tracked while sorting instead of searched.
+    Full sort only happens if vehicle in list changed.
+    """
+
+    __slots__ = (
+        "order",
+        "player_pos",
+        "_player_index",
+        "_veh_total",
+        "_distance",
+        "_visible",
+    )
+
+    def __init__(self):
+        self.order = []  # vehicle index list
+        self.player_pos = 0  # player position in vehicle index list
+        self._player_index = -1
+        self._veh_total = 0
+        self._distance = array.array("d", [0] * MAX_VEHICLES)
+        self._visible = bytearray(MAX_VEHICLES)
+
+    def reset(self):
+        """Reset order"""
+        self.order = []
+        self.player_pos = 0
+        self._player_index = -1
+        self._veh_total = 0
+        self._visible = bytearray(MAX_VEHICLES)
+
+    def update(self, veh_total: int, plr_index: int, show_garage_in_race: bool):
+        """Update relative distance & order"""
+        veh_total = min(veh_total, MAX_VEHICLES)
+        visible = self._visible
+
+        if self.__update_distance(veh_total, show_garage_in_race):
+            self.order = sort_relative_order(veh_total, self._distance, visible)
+        else:
+            self.__insertion_sort(plr_index)
+            if plr_index == self._player_index:
+                return
+
+        # Locate player position in list
+        if 0 <= plr_index < veh_total and visible[plr_index]:
+            self.player_pos = self.order.index(plr_index)
+        else:
+            self.player_pos = 0  # prevent index not found in list error
+        self._player_index = plr_index
+
+    def __update_distance(self, veh_total: int, show_garage_in_race: bool) -> bool:
+        """Update relative distance, return True if visible vehicle changed"""
+        distance = self._distance
+        visible = self._visible
+        track_length = api.read.lap.track_length()  # track length
+        plr_dist = api.read.lap.distance()
+        race_check = not show_garage_in_race and api.read.session.in_race()
+        is_changed = veh_total != self._veh_total
+        if is_changed:
+            self._veh_total = veh_total
+            visible[veh_total:] = bytes(MAX_VEHICLES - veh_total)
+
+        veh_range = range(veh_total)
+        distance[:veh_total] = calc.circular_relative_distance_array(
+            track_length, plr_dist, [api.read.lap.distance(index) for index in veh_range])
+
+        for index in veh_range:
+            # Whether to hide vehicle in garage during race (ex. retired)
+            in_view = not race_check or not api.read.vehicle.in_garage(index)
+            if visible[index] != in_view:
+                visible[index] = in_view
+                is_changed = True
+        return is_changed
+
+    def __insertion_sort(self, plr_index: int):
+        """Repair order with insertion sort, and track player position
+
+        Order is same as reverse-sorted (relative distance, index) tuple.
+        """
+        order = self.order
+        distance = self._distance
+        plr_pos = self.player_pos
+        for pos in range(1, len(order)):
+            index = order[pos]
+            dist = distance[index]
+            prev = pos - 1
+            while prev >= 0:
+                prev_index = order[prev]
+                prev_dist = distance[prev_index]
+                if prev_dist > dist or (prev_dist == dist and prev_index > index):
+                    break
+                order[prev + 1] = prev_index  # shift backward
+                if prev_index == plr_index:
+                    plr_pos = prev + 1
+                prev -= 1
+            if prev + 1 != pos:
+                order[prev + 1] = index
+                if index == plr_index:
+                    plr_pos = prev + 1
+        self.player_pos = plr_pos
+
+
+def sort_relative_order(veh_total: int, distance: array.array, visible: bytearray) -> list:
+    """Full sort vehicle index by relative distance"""
+    return sorted(
+        (index for index in range(veh_total) if visible[index]),
+        key=lambda index: (distance[index], index),
+        reverse=True,
+    )
 
 
 def get_vehicle_class_data(veh_total: int):
@@ -128,21 +246,20 @@ def get_vehicle_class_data(veh_total: int):
 
 
 def create_relative_index(
-    rel_dist_list: list, plr_index: int, max_rel_veh: int, add_front: int, add_behind: int):
-    """Create player-centered relative index list"""
-    if not rel_dist_list:
-        return rel_dist_list
-    # Extract vehicle index to create new sorted vehicle list
-    sorted_veh_list = [_dist[1] for _dist in rel_dist_list]
-    # Locate player index position in list
-    if plr_index in sorted_veh_list:
-        plr_pos = sorted_veh_list.index(plr_index)
-    else:
-        plr_pos = 0  # prevent index not found in list error
+    rel_veh_list: list, plr_pos: int, max_rel_veh: int, add_front: int, add_behind: int):
+    """Create player-centered relative index list
+
+    rel_veh_list: vehicle index list reverse-sorted by relative distance.
+    plr_pos: player position in vehicle index list.
+    """
+    if not rel_veh_list:
+        return []
     # Append with -1 if less than max number of vehicles
-    num_diff = max_rel_veh - len(sorted_veh_list)
+    num_diff = max_rel_veh - len(rel_veh_list)
     if num_diff > 0:
-        sorted_veh_list += [-1] * num_diff
+        sorted_veh_list = rel_veh_list + [-1] * num_diff
+    else:
+        sorted_veh_list = rel_veh_list
     # Slice: max number of front players -> player index position
     front_cut = sorted_veh_list[max(plr_pos - 3 - add_front, 0):plr_pos]
     # Find number of missing front players (which is located at the end of list)
@@ -158,17 +275,16 @@ def create_relative_index(
     return front_list
 
 
-def create_class_position(veh_total: int):
+def create_class_position(veh_class_data: tuple):
     """Create vehicle class position list"""
-    raw_veh_class = list(get_vehicle_class_data(veh_total))
-    split_veh_list = tuple(zip(*raw_veh_class))
+    split_veh_list = tuple(zip(*veh_class_data))
     # Multi-class check
     is_multi_class = len(set(split_veh_list[0])) > 1
     # Create overall vehicle place, player index list
     place_index_list = sorted(zip(split_veh_list[1], split_veh_list[2]))
     # Create class position list
-    raw_veh_class.sort()  # sort by vehicle class
-    class_pos_list = sorted(create_position_in_class(raw_veh_class))
+    sorted_veh_class = sorted(veh_class_data)  # sort by vehicle class
+    class_pos_list = sorted(create_position_in_class(sorted_veh_class))
     return class_pos_list, place_index_list, is_multi_class
 
 
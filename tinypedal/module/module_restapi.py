@@ -22,11 +22,14 @@ RestAPI module
 
 from __future__ import annotations
 import asyncio
+import hashlib
 import logging
 import json
 import re
 import socket
-from urllib.request import urlopen
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
+from urllib.parse import urlsplit
 
 from ._base import DataModule
 from ..module_info import minfo
@@ -39,6 +42,8 @@ MODULE_NAME = "module_restapi"
 
 logger = logging.getLogger(__name__)
 
+MAX_FETCH_WORKERS = 4
+
 # Define output set
 # 0 - minfo, 1 - output, 2 - default value, 3 - key, 4 - sub key, 5 - function
 SET_TIMESCALE = (
@@ -60,7 +65,8 @@ SET_WEATHERFORECAST = (
     (minfo.restapi, "forecastRace", wthr.DEFAULT, "RACE", None, wthr.forecast_rf2),
 )
 # Define task set
-# 0 - regex pattern (sim name), 1 - url path, 2 - output set
+# 0 - regex pattern (sim name), 1 - url path, 2 - output set,
+# 3 - extract output keys only (optional), for large resource with unique output keys
 TASK_RUNONCE = (
     ("LMU|RF2", "sessions/setting/SESSSET_race_timescale", SET_TIMESCALE),
     ("LMU|RF2", "sessions/setting/SESSSET_private_qual", SET_PRIVATEQUALIFY),
@@ -68,8 +74,9 @@ TASK_RUNONCE = (
     ("LMU", "garage/chassis", SET_CHASSIS),
 )
 TASK_REPEATS = (
-    ("LMU", "garage/UIScreen/DriverHandOffStintEnd", SET_CONSUMPTION),
+    ("LMU", "garage/UIScreen/DriverHandOffStintEnd", SET_CONSUMPTION, True),
 )
+JSON_DECODER = json.JSONDecoder()
 
 
 class Realtime(DataModule):
@@ -78,6 +85,10 @@ class Realtime(DataModule):
     def __init__(self, config):
         super().__init__(config, MODULE_NAME)
         self.task_delete = set()
+        self.connections = {}
+        self.fetch_pool = None
+        self.digests = {}
+        self.extract_keys = {}
 
     def update_data(self):
         """Update module data"""
@@ -85,6 +96,10 @@ class Realtime(DataModule):
         update_interval = self.active_interval
         sorted_task_runonce = {}
         sorted_task_repeats = {}
+        # Long-lived event loop & fetch threads, reused for all tasks
+        loop = asyncio.new_event_loop()
+        self.fetch_pool = ThreadPoolExecutor(
+            max_workers=MAX_FETCH_WORKERS, thread_name_prefix="RestAPI")
 
         while not self.event.wait(update_interval):
             if self.state.active:
@@ -93,33 +108,41 @@ class Realtime(DataModule):
                     reset = True
                     update_interval = self.active_interval
                     self.task_delete.clear()
+                    self.digests.clear()
 
                     (sim_name, url_rest, time_out, retry, retry_delay
                      ) = self.__connection_setup()
                     sorted_task_runonce = sort_tasks(sim_name, TASK_RUNONCE)
                     sorted_task_repeats = sort_tasks(sim_name, TASK_REPEATS)
+                    self.extract_keys = sort_extract_keys(sim_name, TASK_REPEATS)
+                    self.connections = create_connections(
+                        url_rest, time_out, (*sorted_task_runonce, *sorted_task_repeats))
                     # Run all tasks once per garage out, and check availability
                     if sorted_task_runonce:
-                        asyncio.run(self.__task_runonce(
-                            sorted_task_runonce, url_rest, time_out, retry, retry_delay))
+                        loop.run_until_complete(self.__task_runonce(
+                            sorted_task_runonce, url_rest, retry, retry_delay))
                         self.__remove_unavailable_task(sorted_task_runonce)
                     if sorted_task_repeats:
-                        asyncio.run(self.__task_runonce(
-                            sorted_task_repeats, url_rest, time_out, retry, retry_delay))
+                        loop.run_until_complete(self.__task_runonce(
+                            sorted_task_repeats, url_rest, retry, retry_delay))
                         self.__remove_unavailable_task(sorted_task_repeats)
 
                 # Run repeatedly while on track
                 if sorted_task_repeats:
-                    asyncio.run(self.__task_repeats(sorted_task_repeats, url_rest, time_out))
+                    loop.run_until_complete(self.__task_repeats(sorted_task_repeats, url_rest))
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
                     reset_to_default((sorted_task_runonce, sorted_task_repeats))
+                    close_connections(self.connections)
 
         # Reset to default on close
         reset_to_default((sorted_task_runonce, sorted_task_repeats))
+        close_connections(self.connections)
+        self.fetch_pool.shutdown(wait=True)
+        loop.close()
 
     def __remove_unavailable_task(self, active_task: dict) -> None:
         """Remove unavailable task"""
@@ -148,36 +171,49 @@ class Realtime(DataModule):
         return sim_name, url_rest, time_out, retry, retry_delay
 
     async def __task_runonce(self, active_task: dict, url: str,
-        time_out: int, retry: int, retry_delay: float) -> any:
+        retry: int, retry_delay: float) -> any:
         """Update task runonce"""
         if not url:
             return None
-        tasks = (self.__fetch_retry(url, time_out, retry, retry_delay, resource_name, active_task[resource_name])
+        tasks = (self.__fetch_retry(url, retry, retry_delay, resource_name, active_task[resource_name])
                  for resource_name in active_task)
         return await asyncio.gather(*tasks)
 
-    async def __task_repeats(self, active_task: dict, url: str, time_out: int) -> any:
+    async def __task_repeats(self, active_task: dict, url: str) -> any:
         """Update task repeatedly"""
         if not url:
             return None
-        tasks = (self.__fetch(url, time_out, resource_name, active_task[resource_name])
+        tasks = (self.__fetch(url, resource_name, active_task[resource_name])
                  for resource_name in active_task)
         return await asyncio.gather(*tasks)
 
-    async def __fetch(self, url_rest: str, time_out: int,
-        resource_name: str, output_set: tuple) -> None:
-        """Fetch data without retry"""
-        resource_output = get_resource(f"{url_rest}{resource_name}", time_out)
+    async def __get_resource(self, url_rest: str, resource_name: str,
+        fetch_func: object = None) -> (dict | bytes | str):
+        """Get resource in fetch thread, using resource's own persistent connection"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self.fetch_pool, fetch_func or get_resource,
+            self.connections[resource_name], f"{url_rest}{resource_name}")
+
+    async def __fetch(self, url_rest: str, resource_name: str, output_set: tuple) -> None:
+        """Fetch data without retry, skip decoding if resource unchanged"""
+        raw_resource = await self.__get_resource(url_rest, resource_name, get_raw_resource)
+        if not isinstance(raw_resource, bytes):
+            return None
+        digest = hashlib.blake2b(raw_resource, digest_size=16).digest()
+        if self.digests.get(resource_name) == digest:
+            return None
+        resource_output = decode_resource(raw_resource, self.extract_keys.get(resource_name))
         if isinstance(resource_output, dict):
+            self.digests[resource_name] = digest
             for output in output_set:
                 get_value(resource_output, *output)
+        return None
 
-    async def __fetch_retry(self, url_rest: str, time_out: int, retry: int,
+    async def __fetch_retry(self, url_rest: str, retry: int,
         retry_delay: float, resource_name: str, output_set: tuple) -> None:
         """Fetch data with retry"""
-        full_url = f"{url_rest}{resource_name}"
         while not self.event.wait(0) and retry >= 0:
-            resource_output = get_resource(full_url, time_out)
+            resource_output = await self.__get_resource(url_rest, resource_name)
             # Verify & retry
             if not isinstance(resource_output, dict):
                 logger.info("Rest API: %s %s, %s retry",
@@ -204,17 +240,90 @@ def reset_to_default(task_dict_list: tuple):
                 setattr(output[0], output[1], output[2])
 
 
-def get_resource(url: str, time_out: int) -> (dict | str):
+def create_connections(url_rest: str, time_out: int, resource_names: tuple) -> dict:
+    """Create persistent (keep-alive) connection for each resource
+
+    Connection is only opened on first request, and reopened automatically
+    after closed. Each resource has its own connection, as tasks are fetched
+    concurrently from separate threads.
+    """
+    if not url_rest:
+        return {}
+    url_split = urlsplit(url_rest)
+    return {resource_name: HTTPConnection(url_split.hostname, url_split.port, timeout=time_out)
+            for resource_name in resource_names}
+
+
+def close_connections(connections: dict):
+    """Close all connections"""
+    for connection in connections.values():
+        connection.close()
+    connections.clear()
+
+
+def request_resource(connection: HTTPConnection, url: str) -> bytes:
+    """Request resource with persistent connection, return raw response body
+
+    Retry once with new connection if kept-alive connection has been closed by server.
+    """
+    url_path = urlsplit(url).path
+    for stale_retry in (True, False):
+        try:
+            connection.request("GET", url_path)
+            response = connection.getresponse()
+            raw_resource = response.read()  # always read full body to reuse connection
+            break
+        except (RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            if not stale_retry:
+                raise
+    if response.status != 200:
+        raise ValueError
+    return raw_resource
+
+
+def get_raw_resource(connection: HTTPConnection, url: str) -> (bytes | str):
+    """Get raw (undecoded) resource from REST API"""
+    try:
+        return request_resource(connection, url)
+    except ValueError:
+        return "data not found"
+    except (OSError, TimeoutError, socket.timeout, HTTPException):
+        connection.close()
+        return "connection failed"
+
+
+def get_resource(connection: HTTPConnection, url: str) -> (dict | str):
     """Get resource from REST API"""
+    raw_resource = get_raw_resource(connection, url)
+    if not isinstance(raw_resource, bytes):
+        return raw_resource
+    return decode_resource(raw_resource)
+
+
+def decode_resource(raw_resource: bytes, key_patterns: tuple | None = None) -> (dict | str):
+    """Decode resource, or extract selected keys only if key patterns available"""
     try:
-        with urlopen(url, timeout=time_out) as raw_resource:
-            if raw_resource.getcode() != 200:
-                raise ValueError
-            return json.loads(raw_resource.read().decode("utf-8"))
+        raw_text = raw_resource.decode("utf-8")
+        if key_patterns:
+            return extract_resource(raw_text, key_patterns)
+        return json.loads(raw_text)
     except (TypeError, AttributeError, KeyError, ValueError):
         return "data not found"
-    except (OSError, TimeoutError, socket.timeout):
-        return "connection failed"
+
+
+def extract_resource(raw_text: str, key_patterns: tuple) -> dict:
+    """Extract selected keys from JSON text, without decoding entire document
+
+    Only value of each selected key is decoded. Key must be unique in document,
+    as first occurrence is used regardless of nesting level.
+    """
+    data = {}
+    for key, pattern in key_patterns:
+        matched = pattern.search(raw_text)
+        if matched:
+            data[key] = JSON_DECODER.raw_decode(raw_text, matched.end())[0]
+    return data
 
 
 def get_value(
@@ -245,3 +354,18 @@ def sort_tasks(sim_name: str, task_set: tuple) -> dict:
     """Sort task set into dictionary, key - resource_name, value - output_set"""
     return {task[1]:task[2] for task in task_set
             if re.search(task[0], sim_name)}
+
+
+def sort_extract_keys(sim_name: str, task_set: tuple) -> dict:
+    """Sort key extraction patterns into dictionary, key - resource_name, value - key patterns
+
+    Only for tasks that enabled key extraction, and all outputs read from a key.
+    """
+    return {
+        task[1]: tuple(
+            (key, re.compile(rf'"{re.escape(key)}"\s*:\s*'))
+            for key in dict.fromkeys(output[3] for output in task[2]))
+        for task in task_set
+        if len(task) > 3 and task[3] and re.search(task[0], sim_name)
+        and all(output[3] is not None for output in task[2])
+    }
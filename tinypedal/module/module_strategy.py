@@ -0,0 +1,158 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Strategy module
+"""
+
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil as roundup
+
+from ._base import DataModule
+from ..module_info import minfo
+from ..api_control import api
+from .. import calculation as calc
+
+MODULE_NAME = "module_strategy"
+
+logger = logging.getLogger(__name__)
+
+
+class Realtime(DataModule):
+    """Pit strategy data
+
+    Strategy is solved in a separate process once per lap (and again after
+    consumption history updated), and result is published while solving finished.
+    Worker process is spawned instead of forked, as forking multi-threaded GUI process is unsafe.
+    """
+
+    def __init__(self, config):
+        super().__init__(config, MODULE_NAME)
+
+    def update_data(self):
+        """Update module data"""
+        reset = False
+        update_interval = self.active_interval
+        output = minfo.strategy
+
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            while not self.event.wait(update_interval):
+                if self.state.active:
+
+                    if not reset:
+                        reset = True
+                        update_interval = self.active_interval
+
+                        solving = None
+                        last_solve_key = None
+                        reset_output(output)
+
+                    # Publish finished strategy
+                    if solving and solving.done():
+                        if solving.exception() is None:
+                            update_output(output, solving.result())
+                        else:
+                            logger.error("STRATEGY: %s", solving.exception())
+                        solving = None
+
+                    # Solve strategy once per lap or consumption history update
+                    laps_done = api.read.lap.completed_laps()
+                    solve_key = (laps_done, minfo.history.consumption[0])
+                    if not solving and last_solve_key != solve_key:
+                        last_solve_key = solve_key
+                        strategy_args = self.strategy_arguments(laps_done)
+                        if strategy_args:
+                            try:
+                                solving = executor.submit(
+                                    calc.solve_pit_strategy, *strategy_args)
+                            except RuntimeError as error:  # include broken process pool
+                                logger.error("STRATEGY: %s", error)
+
+                else:
+                    if reset:
+                        reset = False
+                        update_interval = self.idle_interval
+
+    def strategy_arguments(self, laps_done):
+        """Strategy arguments, None if not enough valid lap history"""
+        history = tuple(
+            (data[2], data[3]) for data in minfo.history.consumption
+            if data[1] and data[2] > 0 and data[3] > 0
+        )[:max(int(self.mcfg["number_of_history_laps"]), 2)]
+        if len(history) < 2 or minfo.fuel.capacity <= 0:
+            return None
+
+        laptime_history, consumption_history = zip(*history)
+        laptime_pace = calc.mean(laptime_history)
+        lap_into = api.read.lap.progress()
+
+        # Remaining laps from current position
+        if api.read.session.lap_type():  # lap-type
+            laps_remain = calc.lap_type_laps_remain(
+                calc.lap_type_full_laps_remain(api.read.lap.maximum(), laps_done),
+                lap_into)
+        else:  # time-type race
+            laps_remain = calc.time_type_laps_remain(
+                roundup(calc.end_timer_laps_remain(
+                    lap_into, laptime_pace, api.read.session.remaining())),
+                lap_into)
+        if laps_remain <= 0:
+            return None
+
+        return (
+            laps_remain,
+            laps_done + lap_into,
+            minfo.fuel.amountCurrent,
+            minfo.fuel.capacity,
+            laptime_history,
+            consumption_history,
+            max(self.mcfg["pit_stop_time_loss"], 0),
+            max(self.mcfg["refueling_rate"], 0.01),
+            max(self.mcfg["fuel_saving_time_loss"], 0),
+            min(max(self.mcfg["maximum_fuel_saving"], 0), 50),
+            min(max(int(self.mcfg["number_of_maximum_pit_stops"]), 0), 20),
+            min(max(int(self.mcfg["number_of_strategy_samples"]), 100), 100000),
+            min(max(self.mcfg["minimum_finish_probability"], 0), 1),
+        )
+
+
+def reset_output(output):
+    """Reset module output"""
+    output.totalVariants = 0
+    output.numPitStops = 0
+    output.pitStopLaps = ()
+    output.refuelAmount = 0
+    output.fuelSaving = 0
+    output.estimatedTime = 0
+    output.finishProbability = 0
+    output.updateVersion += 1
+
+
+def update_output(output, result):
+    """Update module output from strategy result"""
+    (output.totalVariants,
+     output.numPitStops,
+     output.pitStopLaps,
+     output.refuelAmount,
+     output.fuelSaving,
+     output.estimatedTime,
+     output.finishProbability) = result
+    output.updateVersion += 1
@@ -20,15 +20,18 @@
 Vehicles module
 """
 
+import array
 import logging
-from collections import namedtuple
+from operator import is_not
 
 from ._base import DataModule
-from ..module_info import minfo
+from ..module_info import minfo, MAX_VEHICLES, VehiclesInfo
 from ..api_control import api
 from .. import calculation as calc
 
 MODULE_NAME = "module_vehicles"
+EMPTY_CLASS_POSITION = (-1, 0, "", 99999, 99999, -1, -1)
+ROSTER_COLUMNS = ("driverName", "vehicleName", "vehicleClass")
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,12 @@ class Realtime(DataModule):
         """Update module data"""
         reset = False
         update_interval = self.active_interval
+        roster = VehicleRoster()
+        stale_position = StalePosition()
+        # Double buffer, new data set is written while last data set stays published
+        output = VehiclesInfo()
+        output.pitTimer = minfo.vehicles.pitTimer
+        force_update = False
 
         while not self.event.wait(update_interval):
             if self.state.active:
@@ -50,269 +59,414 @@ class Realtime(DataModule):
                 if not reset:
                     reset = True
                     update_interval = self.active_interval
-                    minfo.vehicles.dataSetVersion = -1
-
-                vehicles_data = tuple(self.__update_vehicle_data(minfo.relative.classes))
-                nearest_timegap, nearest_yellow = nearest_distance_data(vehicles_data)
-
-                # Output
-                minfo.vehicles.dataSet = vehicles_data
-                minfo.vehicles.dataSetVersion += 1
-                minfo.vehicles.nearestTraffic = nearest_timegap
-                minfo.vehicles.nearestYellow = nearest_yellow
+                    force_update = True  # update all columns
+                    roster.reset()
+                    stale_position.reset()
+
+                last = minfo.vehicles
+                self.__update_vehicle_data(
+                    output, last, roster, stale_position, minfo.relative.classes, force_update)
+                force_update = False
+                # Publish all columns in one assignment, swap buffer,
+                # last data set is rewritten on next update, see VehiclesInfo
+                minfo.vehicles = output
+                output = last
 
             else:
                 if reset:
                     reset = False
                     update_interval = self.idle_interval
 
-    def __update_vehicle_data(self, class_pos_list):
-        """Update vehicle data"""
+    def __update_vehicle_data(
+        self, output, last, roster, stale_position, class_pos_list, force_update=False):
+        """Update vehicle data
+
+        Columns are written in place into output (unpublished data set),
+        and compared against last published data set for version counters.
+
+        Returns:
+            True if any column changed.
+        """
         # Additional data
-        veh_total = max(api.read.vehicle.total_vehicles(), 1)
+        veh_total = min(max(api.read.vehicle.total_vehicles(), 1), MAX_VEHICLES)
         track_length = api.read.lap.track_length()
         in_race = api.read.session.in_race()
         class_list_size = len(class_pos_list)
+        veh_range = range(veh_total)
 
         # Local player data
         plr_laps_done = api.read.lap.completed_laps()
         plr_lap_distance = api.read.lap.distance()
         plr_lap_progress = calc.lap_progress_distance(plr_lap_distance, track_length)
         plr_speed = api.read.vehicle.speed()
-        plr_pos_xz = (api.read.vehicle.position_longitudinal(),
-                      api.read.vehicle.position_lateral())
+        plr_pos_x = api.read.vehicle.position_longitudinal()
+        plr_pos_z = api.read.vehicle.position_lateral()
         plr_ori_rad = api.read.vehicle.orientation_yaw_radians()
-
-        # Generate data list from all vehicles in current session
-        for index in range(veh_total):
-            is_player = api.read.vehicle.is_player(index)
-            slot_id = api.read.vehicle.slot_id(index)
-            position = api.read.vehicle.place(index)
-            driver_name = api.read.vehicle.driver_name(index)
-            vehicle_name = api.read.vehicle.vehicle_name(index)
-            vehicle_class = api.read.vehicle.class_name(index)
-
-            if index < class_list_size:
-                position_in_class = class_pos_list[index][1]
-                laptime_session_best = class_pos_list[index][3]
-                laptime_class_best = class_pos_list[index][4]
-                opt_index_ahead = class_pos_list[index][5]
-            else:
-                position_in_class = 0
-                laptime_session_best = 99999
-                laptime_class_best = 99999
-                opt_index_ahead = -1
-
-            laptime_best = api.read.timing.best_laptime(index)
-            laptime_last = api.read.timing.last_laptime(index)
-            lap_etime = api.read.timing.elapsed(index)
-            speed = api.read.vehicle.speed(index)
-
-            # Distance & time
-            laps_done = api.read.lap.completed_laps(index)
-            lap_distance = api.read.lap.distance(index)
-
-            lap_progress = calc.lap_progress_distance(lap_distance, track_length)
-            relative_distance = calc.circular_relative_distance(
-                track_length, plr_lap_distance, lap_distance
-                ) if not is_player else 0
-            relative_time_gap = calc.relative_time_gap(
-                relative_distance, speed, plr_speed
-                ) if not is_player else 0
-
-            gap_behind_next_in_class = self.__calc_gap_behind_next_in_class(
-                opt_index_ahead, track_length, speed, laps_done, lap_progress)
-            gap_behind_next = self.__calc_gap_behind_next(index)
-            gap_behind_leader = self.__calc_gap_behind_leader(index)
-
-            is_lapped = 0 if is_player or not in_race else calc.lap_difference(
-                laps_done + lap_progress,
+        rot_rad = plr_ori_rad - 3.14159265  # plr_ori_rad, rotate view
+
+        # Vehicle state
+        slot_id = output.slotID
+        is_player = output.isPlayer
+        is_not_player = output.isNotPlayer
+        in_garage = output.inGarage
+        in_pit = output.inPit
+        for index in veh_range:
+            slot_id[index] = api.read.vehicle.slot_id(index)
+            is_player[index] = state = api.read.vehicle.is_player(index)
+            is_not_player[index] = not state
+            in_garage[index] = api.read.vehicle.in_garage(index)
+            in_pit[index] = api.read.vehicle.in_pits(index)
+
+        # Static data, only re-read if roster changed
+        is_roster_changed = roster.update(tuple(slot_id[:veh_total]), in_pit)
+        if is_roster_changed:
+            stale_position.update_roster(roster.data)
+        roster_data = roster.data
+        driver_name = output.driverName
+        vehicle_name = output.vehicleName
+        vehicle_class = output.vehicleClass
+        for index in veh_range:
+            (driver_name[index], vehicle_name[index], vehicle_class[index]
+             ) = roster_data[slot_id[index]]
+
+        # Distance & time
+        speed = array.array("d", [api.read.vehicle.speed(index) for index in veh_range])
+        laps_done = array.array("l", [api.read.lap.completed_laps(index) for index in veh_range])
+        lap_dist = array.array("d", [api.read.lap.distance(index) for index in veh_range])
+        lap_progress = calc.lap_progress_distance_array(lap_dist, track_length)
+        rel_dist = calc.circular_relative_distance_array(
+            track_length, plr_lap_distance, lap_dist)
+        rel_time_gap = calc.relative_time_gap_array(rel_dist, plr_speed, speed)
+        if in_race:
+            lap_diff = calc.lap_difference_array(
+                [laps + progress for laps, progress in zip(laps_done, lap_progress)],
                 plr_laps_done + plr_lap_progress,
                 self.mcfg["lap_difference_ahead_threshold"],
                 self.mcfg["lap_difference_behind_threshold"]
+            )
+        else:
+            lap_diff = bytes(veh_total)
+        output.lapProgress[:veh_total] = lap_progress
+
+        # Track coordinates table for stale position
+        coords_table = minfo.mapping.coordinatesTable
+        stale_threshold = self.mcfg["stale_position_distance_threshold"]
+        if not coords_table or stale_threshold <= 0:
+            coords_table = None
+
+        # Dynamic data
+        position = output.position
+        position_in_class = output.positionInClass
+        session_best_laptime = output.sessionBestLapTime
+        class_best_laptime = output.classBestLapTime
+        best_laptime = output.bestLapTime
+        last_laptime = output.lastLapTime
+        relative_distance = output.relativeDistance
+        relative_time_gap = output.relativeTimeGap
+        gap_behind_next_in_class = output.gapBehindNextInClass
+        gap_behind_next = output.gapBehindNext
+        gap_behind_leader = output.gapBehindLeader
+        is_lapped = output.isLapped
+        is_yellow = output.isYellow
+        num_pit_stops = output.numPitStops
+        pit_state = output.pitState
+        pit_time = output.pitTime
+        pit_timer = output.pitTimer
+        tire_compound = output.tireCompound
+        pos_xz = output.posXZ
+        rel_ori_rad = output.relativeOrientationXZRadians
+        rel_rot_pos_xz = output.relativeRotatedPosXZ
+        rel_straight_dist = output.relativeStraightDistance
+        for index in veh_range:
+            class_pos = (class_pos_list[index] if index < class_list_size
+                         else EMPTY_CLASS_POSITION)
+            pos_x = api.read.vehicle.position_longitudinal(index)
+            pos_z = api.read.vehicle.position_lateral(index)
+            if coords_table and is_not_player[index]:
+                pos_x, pos_z = stale_position.correct(
+                    slot_id[index], pos_x, pos_z, lap_dist[index], track_length,
+                    stale_threshold, coords_table, minfo.mapping.coordinatesTableStep)
+            pos_xz[index] = (pos_x, pos_z)
+            position[index] = api.read.vehicle.place(index)
+            position_in_class[index] = class_pos[1]
+            session_best_laptime[index] = class_pos[3]
+            class_best_laptime[index] = class_pos[4]
+            best_laptime[index] = api.read.timing.best_laptime(index)
+            last_laptime[index] = api.read.timing.last_laptime(index)
+            gap_behind_next_in_class[index] = calc_gap_behind_next_in_class(
+                class_pos[5], index, track_length, speed, laps_done, lap_progress)
+            gap_behind_next[index] = calc_gap_behind_next(index)
+            gap_behind_leader[index] = calc_gap_behind_leader(index)
+            is_yellow[index] = speed[index] < 8
+            num_pit_stops[index] = api.read.vehicle.number_pitstops(index)
+            pit_state[index] = api.read.vehicle.pit_state(index)
+            pit_time[index] = calc_pit_time(
+                pit_timer[index], in_pit[index], in_garage[index],
+                api.read.timing.elapsed(index), in_pit[index] * 1000 + slot_id[index])
+            tire_compound[index] = api.read.tyre.compound(index)
+            if is_not_player[index]:
+                relative_distance[index] = rel_dist[index]
+                relative_time_gap[index] = rel_time_gap[index]
+                is_lapped[index] = lap_diff[index]
+                rel_ori_rad[index] = api.read.vehicle.orientation_yaw_radians(index) - plr_ori_rad
+                rel_rot_pos_xz[index] = calc.rotate_pos(
+                    rot_rad,
+                    pos_x - plr_pos_x,  # x position related to player
+                    pos_z - plr_pos_z,  # y position related to player
                 )
-            is_yellow = speed < 8
-
-            # Pit
-            in_garage = api.read.vehicle.in_garage(index)
-            in_pit = api.read.vehicle.in_pits(index)
-            num_pit_stops = api.read.vehicle.number_pitstops(index)
-            pit_state = api.read.vehicle.pit_state(index)
-            pit_time = self.__calc_pit_time(
-                minfo.vehicles.pitTimer[index], in_pit, in_garage, lap_etime,
-                in_pit * 1000 + slot_id)
-            tire_compound = api.read.tyre.compound(index)
-
-            # Position data
-            pos_xz = (api.read.vehicle.position_longitudinal(index),
-                      api.read.vehicle.position_lateral(index))
-            orientation_xz_radians = api.read.vehicle.orientation_yaw_radians(index)
-            relative_rotated_pos_xz = calc.rotate_pos(
-                plr_ori_rad - 3.14159265,   # plr_ori_rad, rotate view
-                pos_xz[0] - plr_pos_xz[0],  # x position related to player
-                pos_xz[1] - plr_pos_xz[1]   # y position related to player
-                ) if not is_player else (0,0)
-            relative_orientation_xz_radians = (
-                orientation_xz_radians - plr_ori_rad
-                ) if not is_player else 0
-            relative_straight_distance = calc.distance(
-                plr_pos_xz, pos_xz
-                ) if not is_player else 0
-
-            yield DataSet(
-                position = position,
-                driverName = driver_name,
-                vehicleName = vehicle_name,
-                vehicleClass = vehicle_class,
-                positionInClass = position_in_class,
-                sessionBestLapTime = laptime_session_best,
-                classBestLapTime = laptime_class_best,
-                bestLapTime = laptime_best,
-                lastLapTime = laptime_last,
-                isPlayer = is_player,
-                isNotPlayer = not is_player,
-                lapProgress = lap_progress,
-                relativeDistance = relative_distance,
-                relativeTimeGap = relative_time_gap,
-                gapBehindNextInClass = gap_behind_next_in_class,
-                gapBehindNext = gap_behind_next,
-                gapBehindLeader = gap_behind_leader,
-                isLapped = is_lapped,
-                isYellow = is_yellow,
-                inGarage = in_garage,
-                inPit = in_pit,
-                numPitStops = num_pit_stops,
-                pitState = pit_state,
-                pitTime = pit_time,
-                tireCompound = tire_compound,
-                posXZ = pos_xz,
-                relativeOrientationXZRadians = relative_orientation_xz_radians,
-                relativeRotatedPosXZ = relative_rotated_pos_xz,
-                relativeStraightDistance = relative_straight_distance,
-                #slotID = slot_id,
-                #speed = speed,
-                #totalLaps = total_laps,
-                #lapDistance = lap_distance,
-                #orientationXZRadians = orientation_xz_radians,
+                rel_straight_dist[index] = calc.distance((plr_pos_x, plr_pos_z), (pos_x, pos_z))
+            else:
+                relative_distance[index] = 0
+                relative_time_gap[index] = 0
+                is_lapped[index] = 0
+                rel_ori_rad[index] = 0
+                rel_rot_pos_xz[index] = (0, 0)
+                rel_straight_dist[index] = 0
+
+        # Version
+        output.total = veh_total
+        is_total_changed = force_update or veh_total != last.total
+        is_changed = False
+        column_version = output.columnVersion
+        for name, version in last.columnVersion.items():
+            if is_total_changed or (
+                (is_roster_changed or name not in ROSTER_COLUMNS)
+                and is_column_changed(getattr(output, name), getattr(last, name), veh_total)):
+                version += 1
+                is_changed = True
+            column_version[name] = version
+        output.dataSetVersion = last.dataSetVersion + is_changed
+        output.rosterVersion = last.rosterVersion + is_roster_changed
+
+        # Spatial index, sort vehicle index by lap distance
+        output.spatialGrid = calc.spatial_grid(pos_xz[:veh_total], output.spatialGridSize)
+        output.lapDistanceOrder = sorted(veh_range, key=lap_dist.__getitem__)
+        output.nearestTraffic, output.nearestYellow = nearest_distance_data(
+            output, api.read.vehicle.player_index(), plr_speed, max(speed))
+
+        # Sort vehicle index by drawing priority (for track map display, reverse sort)
+        if is_changed:
+            output.drawOrder = sorted(
+                veh_range,
+                key=lambda index: (
+                    is_not_player[index], in_garage[index], in_pit[index],
+                    position[index], index),
+                reverse=True,
             )
-
-    @staticmethod
-    def __calc_pit_time(pit_timer, in_pit, in_garage, lap_etime, pit_status):
-        """Calculate lap & pit time
-
-        Index:
-            0 = in pit state
-            1 = pit start time
-            2 = pit timer
-        """
-        # Pit status check
-        if pit_status != pit_timer[0]:
-            pit_timer[0] = pit_status  # last pit status
-            pit_timer[1] = lap_etime  # last etime stamp
-            if in_pit:  # reset pit time if just entered pit
-                pit_timer[2] = 0
-        # Ignore pit timer in garage
-        if in_garage:
-            pit_timer[1] = -1
+        else:
+            output.drawOrder = last.drawOrder
+        return is_changed
+
+
+class VehicleRoster:
+    """Vehicle roster
+
+    Static vehicle data keyed by slot id, see ROSTER_COLUMNS.
+    Fully re-read only if slot id list changed (vehicle joined, left, or re-ordered);
+    otherwise only re-read vehicles in pit, where driver swap happens.
+    """
+
+    __slots__ = ("data", "_slot_id")
+
+    def __init__(self):
+        self.data = {}  # slot id: static data
+        self._slot_id = None
+
+    def reset(self):
+        """Reset roster"""
+        self.data = {}
+        self._slot_id = None
+
+    def update(self, slot_id: tuple, in_pit: list) -> bool:
+        """Update roster, return True if changed"""
+        if slot_id != self._slot_id:
+            self._slot_id = slot_id
+            self.data = {_id: get_static_data(index) for index, _id in enumerate(slot_id)}
+            return True
+        is_changed = False
+        for index, _id in enumerate(slot_id):
+            if in_pit[index]:
+                static_data = get_static_data(index)
+                if self.data[_id] != static_data:
+                    self.data[_id] = static_data
+                    is_changed = True
+        return is_changed
+
+
+class StalePosition:
+    """Stale vehicle position correction
+
+    World position (from telemetry) of remote vehicles may stop updating,
+    while lap distance (from scoring) keeps moving. If world position is unchanged
+    while lap distance moved more than threshold, position is looked up from
+    track coordinates table at current lap distance instead.
+    """
+
+    __slots__ = ("_last",)
+
+    def __init__(self):
+        self._last = {}  # slot id: (last world x, y, lap distance while world position changed)
+
+    def reset(self):
+        """Reset last positions"""
+        self._last.clear()
+
+    def update_roster(self, roster_data: dict):
+        """Remove vehicles that left session"""
+        self._last = {_id: data for _id, data in self._last.items() if _id in roster_data}
+
+    def correct(
+        self, slot_id: int, pos_x: float, pos_z: float, lap_dist: float,
+        track_length: float, threshold: float, coords_table, coords_table_step: float
+        ) -> tuple:
+        """Correct vehicle position, return (x, y) position"""
+        last = self._last.get(slot_id)
+        if last is None or last[0] != pos_x or last[1] != pos_z:
+            self._last[slot_id] = (pos_x, pos_z, lap_dist)
+            return pos_x, pos_z
+        if abs(calc.circular_relative_distance(track_length, last[2], lap_dist)) > threshold:
+            coords = calc.distance_to_coords(coords_table, coords_table_step, lap_dist)
+            if coords is not None:
+                return coords
+        return pos_x, pos_z
+
+
+def get_static_data(index: int) -> tuple:
+    """Get vehicle static data, see ROSTER_COLUMNS"""
+    return (
+        api.read.vehicle.driver_name(index),
+        api.read.vehicle.vehicle_name(index),
+        api.read.vehicle.class_name(index),
+    )
+
+
+def is_column_changed(column, last_column, total: int) -> bool:
+    """Check whether first total rows of vehicle data column changed"""
+    if isinstance(column, array.array):
+        return memoryview(column)[:total] != memoryview(last_column)[:total]
+    # List column, also compare type for mixed type data, such as int laps & float seconds
+    values = column[:total]
+    last_values = last_column[:total]
+    return values != last_values or any(map(is_not, map(type, values), map(type, last_values)))
+
+
+def calc_pit_time(pit_timer, in_pit, in_garage, lap_etime, pit_status):
+    """Calculate lap & pit time
+
+    Index:
+        0 = in pit state
+        1 = pit start time
+        2 = pit timer
+    """
+    # Pit status check
+    if pit_status != pit_timer[0]:
+        pit_timer[0] = pit_status  # last pit status
+        pit_timer[1] = lap_etime  # last etime stamp
+        if in_pit:  # reset pit time if just entered pit
             pit_timer[2] = 0
-            return 0
-        # Calculating pit time while in pit
-        if in_pit:
-            if pit_timer[1] >= 0:
-                pit_timer[2] = min(max(lap_etime - pit_timer[1], 0), 999.9)
-        return pit_timer[2]
-
-    @staticmethod
-    def __calc_gap_behind_next_in_class(
-        opt_index, track_length, speed, laps_done, lap_progress):
-        """Calculate interval behind next in class"""
-        if opt_index < 0:
-            return 0.0
-        opt_laps_done = api.read.lap.completed_laps(opt_index)
-        opt_lap_distance = api.read.lap.distance(opt_index)
-        opt_lap_progress = calc.lap_progress_distance(opt_lap_distance, track_length)
-        lap_diff = abs(opt_laps_done + opt_lap_progress - laps_done - lap_progress)
-        if lap_diff > 1:
-            return int(lap_diff)
-        return calc.relative_time_gap(
-            lap_diff * track_length, api.read.vehicle.speed(opt_index), speed
-        )
-
-    @staticmethod
-    def __calc_gap_behind_next(index):
-        """Calculate interval behind next"""
-        laps_behind_next = api.read.lap.behind_next(index)
-        if laps_behind_next > 0:
-            return laps_behind_next
-        return api.read.timing.behind_next(index)
-
-    @staticmethod
-    def __calc_gap_behind_leader(index):
-        """Calculate interval behind leader"""
-        laps_behind_leader = api.read.lap.behind_leader(index)
-        if laps_behind_leader > 0:
-            return laps_behind_leader
-        return api.read.timing.behind_leader(index)
+    # Ignore pit timer in garage
+    if in_garage:
+        pit_timer[1] = -1
+        pit_timer[2] = 0
+        return 0
+    # Calculating pit time while in pit
+    if in_pit:
+        if pit_timer[1] >= 0:
+            pit_timer[2] = min(max(lap_etime - pit_timer[1], 0), 999.9)
+    return pit_timer[2]
+
+
+def calc_gap_behind_next_in_class(
+    opt_index, index, track_length, speed, laps_done, lap_progress):
+    """Calculate interval behind next in class"""
+    if not 0 <= opt_index < len(speed):
+        return 0.0
+    lap_diff = abs(
+        laps_done[opt_index] + lap_progress[opt_index]
+        - laps_done[index] - lap_progress[index]
+    )
+    if lap_diff > 1:
+        return int(lap_diff)
+    return calc.relative_time_gap(
+        lap_diff * track_length, speed[opt_index], speed[index]
+    )
+
+
+def calc_gap_behind_next(index):
+    """Calculate interval behind next"""
+    laps_behind_next = api.read.lap.behind_next(index)
+    if laps_behind_next > 0:
+        return laps_behind_next
+    return api.read.timing.behind_next(index)
+
+
+def calc_gap_behind_leader(index):
+    """Calculate interval behind leader"""
+    laps_behind_leader = api.read.lap.behind_leader(index)
+    if laps_behind_leader > 0:
+        return laps_behind_leader
+    return api.read.timing.behind_leader(index)
 
 
 def nearest_distance_data(
-    vehicle_data: tuple,
+    output,
+    plr_index: int,
+    plr_speed: float,
+    max_speed: float,
     nearest_timegap: int = 999999,
     nearest_yellow: int = 999999):
-    """Calculate nearest distance data"""
-    for data in vehicle_data:
-        # Find nearest straight line distance
-        #if not data.isPlayer and data.relativeStraightDistance < nearest_dist:
-        #    nearest_dist = data.relativeStraightDistance
+    """Calculate nearest distance data
+
+    Scan vehicles in lap distance order outward from player,
+    stop once remaining vehicles are too far to be nearer than found ones.
+    Scan all vehicles if player index is not valid.
+    """
+    ring = output.lapDistanceOrder
+    total = len(ring)
+    in_pit = output.inPit
+    is_yellow = output.isYellow
+    rel_dist = output.relativeDistance
+    rel_time_gap = output.relativeTimeGap
+
+    if not 0 <= plr_index < total:
+        for index in ring:
+            # Find nearest traffic time gap
+            if 0 == in_pit[index] > rel_dist[index] and rel_time_gap[index] < nearest_timegap:
+                nearest_timegap = rel_time_gap[index]
+            # Find nearest yellow flag (on track) distance
+            if is_yellow[index] and abs(rel_dist[index]) < nearest_yellow:
+                nearest_yellow = abs(rel_dist[index])
+        return nearest_timegap, nearest_yellow
+
+    plr_pos = ring.index(plr_index)
+    # Time gap can only be pruned if player is moving (see relative_time_gap)
+    max_speed = max(max_speed, plr_speed) if plr_speed > 1 else 0
+
+    if is_yellow[plr_index]:
+        nearest_yellow = 0
+
+    # Behind player
+    for step in range(1, total):
+        index = ring[plr_pos - step]
+        dist = -rel_dist[index]
+        if dist < 0:  # over half track, ahead player
+            break
+        if dist >= nearest_yellow and max_speed and dist >= nearest_timegap * max_speed:
+            break
         # Find nearest traffic time gap
-        if 0 == data.inPit > data.relativeDistance and data.relativeTimeGap < nearest_timegap:
-            nearest_timegap = data.relativeTimeGap
+        if 0 == in_pit[index] < dist and rel_time_gap[index] < nearest_timegap:
+            nearest_timegap = rel_time_gap[index]
         # Find nearest yellow flag (on track) distance
-        if data.isYellow:
-            rel_dist = abs(data.relativeDistance)
-            if rel_dist < nearest_yellow:
-                nearest_yellow = rel_dist
+        if is_yellow[index] and dist < nearest_yellow:
+            nearest_yellow = dist
+
+    # Ahead player
+    for step in range(1, total):
+        index = ring[(plr_pos + step) % total]
+        dist = rel_dist[index]
+        if dist < 0 or dist >= nearest_yellow:
+            break
+        if is_yellow[index]:
+            nearest_yellow = dist
+            break
     return nearest_timegap, nearest_yellow
-
-
-DataSet = namedtuple(
-    "DataSet",
-    [
-    # Sorting priority section (for track map display, set reverse sort)
-    "isNotPlayer",
-    "inGarage",
-    "inPit",
-    "position",
-    # End of sorting priority section
-    "driverName",
-    "vehicleName",
-    "vehicleClass",
-    "positionInClass",
-    "sessionBestLapTime",
-    "classBestLapTime",
-    "bestLapTime",
-    "lastLapTime",
-    "isPlayer",
-    "lapProgress",
-    "relativeDistance",
-    "relativeTimeGap",
-    "gapBehindNextInClass",
-    "gapBehindNext",
-    "gapBehindLeader",
-    "isLapped",
-    "isYellow",
-    "numPitStops",
-    "pitState",
-    "pitTime",
-    "tireCompound",
-    "posXZ",
-    "relativeOrientationXZRadians",
-    "relativeRotatedPosXZ",
-    "relativeStraightDistance",
-    #"slotID",
-    #"speed",
-    #"totalLaps",
-    #"lapDistance",
-    #"orientationXZRadians",
-    ]
-)
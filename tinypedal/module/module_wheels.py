@@ -20,7 +20,6 @@
 Wheels module
 """
 
-from collections import deque
 import logging
 
 from ._base import DataModule
@@ -97,10 +96,8 @@ class Realtime(DataModule):
             min_samples_f = 20
             min_samples_r = 20
 
-        samples_slice_f = sample_slice_indices(min_samples_f)
-        samples_slice_r = sample_slice_indices(min_samples_r)
-        list_radius_f = deque([], 160)
-        list_radius_r = deque([], 160)
+        list_radius_f = calc.SortedWindow(160)
+        list_radius_r = calc.SortedWindow(160)
         speed = 0
         wheel_rot = 0,0,0,0
 
@@ -112,31 +109,20 @@ class Realtime(DataModule):
                 diff_rot_r = calc.min_vs_avg(wheel_rot[2:4])
                 # Record radius value for targeted rotation difference
                 if 0 < diff_rot_f < 0.1:
-                    list_radius_f.append(
+                    list_radius_f.add(
                         calc.rot2radius(speed, calc.mean(wheel_rot[0:2])))
                 if 0 < diff_rot_r < 0.1:
-                    list_radius_r.append(
+                    list_radius_r.add(
                         calc.rot2radius(speed, calc.mean(wheel_rot[2:4])))
                 # Front average wheel radius
                 if len(list_radius_f) >= min_samples_f:
-                    radius_front = round(
-                        calc.mean(sorted(list_radius_f)[samples_slice_f])
-                        , 3)
+                    radius_front = round(list_radius_f.interquartile_mean(), 3)
                     if min_samples_f < 160:
                         min_samples_f *= 2  # double sample counts
-                        samples_slice_f = sample_slice_indices(min_samples_f)
                 # Rear average wheel radius
                 if len(list_radius_r) >= min_samples_r:
-                    radius_rear = round(
-                        calc.mean(sorted(list_radius_r)[samples_slice_r])
-                        , 3)
+                    radius_rear = round(list_radius_r.interquartile_mean(), 3)
                     if min_samples_r < 160:
                         min_samples_r *= 2
-                        samples_slice_r = sample_slice_indices(min_samples_r)
             # Output
             speed, wheel_rot = yield radius_front, radius_rear
-
-
-def sample_slice_indices(min_samples):
-    """Calculate sample slice indices from minimum samples"""
-    return slice(int(min_samples * 0.25), int(min_samples * 0.75))
@@ -25,6 +25,28 @@ import array
 
 from dataclasses import dataclass, field
 from collections import deque
+from functools import partial
+
+MAX_VEHICLES = 128
+# Vehicles module output columns, see VehiclesInfo
+VEHICLE_DATA_COLUMNS = (
+    "slotID", "isNotPlayer", "inGarage", "inPit", "position", "driverName", "vehicleName",
+    "vehicleClass", "positionInClass", "sessionBestLapTime", "classBestLapTime", "bestLapTime",
+    "lastLapTime", "isPlayer", "lapProgress", "relativeDistance", "relativeTimeGap",
+    "gapBehindNextInClass", "gapBehindNext", "gapBehindLeader", "isLapped", "isYellow",
+    "numPitStops", "pitState", "pitTime", "tireCompound", "posXZ", "relativeOrientationXZRadians",
+    "relativeRotatedPosXZ", "relativeStraightDistance",
+)
+
+
+def array_column(typecode: str) -> array.array:
+    """Create fixed size vehicle data array column"""
+    return array.array(typecode, [0] * MAX_VEHICLES)
+
+
+def list_column(default) -> list:
+    """Create fixed size vehicle data list column"""
+    return [default] * MAX_VEHICLES
 
 
 @dataclass
@@ -120,6 +142,10 @@ class MappingInfo:
     elevations: tuple | None = None
     elevationsHash: int | None = None
     sectors: tuple | None = None
+    coordinatesLOD: tuple | None = None
+    coordinatesTable: array.array | None = None
+    coordinatesTableStep: float = 1.0
+    elevationsLOD: tuple | None = None
 
 
 @dataclass
@@ -148,6 +174,19 @@ class SectorsInfo:
     noDeltaSector: bool = True
 
 
+@dataclass
+class StrategyInfo:
+    """Strategy module output data"""
+    updateVersion: int = 0
+    totalVariants: int = 0
+    numPitStops: int = 0
+    pitStopLaps: tuple = ()
+    refuelAmount: float = 0
+    fuelSaving: float = 0
+    estimatedTime: float = 0
+    finishProbability: float = 0
+
+
 @dataclass
 class RestAPIInfo:
     """Rest API module output data"""
@@ -165,19 +204,89 @@ class RestAPIInfo:
 class VehiclesInfo:
     """Vehicles module output data
 
+    Column-oriented data set, each column is a fixed size array
+    (or list for text & mixed type data) indexed by vehicle index.
+    Only first "total" number of rows are valid.
+
+    Vehicles module writes new data into a second data set, and publishes it
+    by replacing minfo.vehicles in one assignment, so columns, total and drawOrder
+    of a published data set are always from same update. Read minfo.vehicles
+    once per update (or paint) into a local reference, and read all data from it.
+    A local reference is only valid for one vehicles module update: once
+    minfo.vehicles is replaced, old data set is rewritten on next update,
+    so do not keep reference across updates (such as in widget attribute).
+    Column names are listed in VEHICLE_DATA_COLUMNS.
+
+    dataSetVersion:
+        increased if any column changed.
+    rosterVersion:
+        increased if static data (driver, vehicle, class name) changed,
+        such as vehicle joined, left, or driver swapped.
+    columnVersion dict:
+        column name: version counter, increased only if column data changed.
+    drawOrder list:
+        vehicle index sorted by drawing priority (player & leader last).
+    spatialGrid dict:
+        uniform grid of world XZ position, key: (x, y) cell, value: vehicle index list.
+        Grid cell size equals spatialGridSize (meters).
+    lapDistanceOrder list:
+        vehicle index sorted by lap distance.
+
     pitTimer list:
         0 = in pit state
         1 = pit start time
         2 = pit timer
     """
-    dataSet: tuple = field(default_factory=tuple)
+    total: int = 0
     dataSetVersion: int = -1
+    rosterVersion: int = 0
+    columnVersion: dict = field(default_factory=dict)
+    drawOrder: list = field(default_factory=list)
+    spatialGrid: dict = field(default_factory=dict)
+    spatialGridSize: float = 50
+    lapDistanceOrder: list = field(default_factory=list)
     pitTimer: tuple = field(default_factory=tuple)
     nearestTraffic: float = 999999
     nearestYellow: float = 999999
+    # Columns
+    slotID: array.array = field(default_factory=partial(array_column, "i"))
+    isNotPlayer: array.array = field(default_factory=partial(array_column, "b"))
+    inGarage: array.array = field(default_factory=partial(array_column, "b"))
+    inPit: array.array = field(default_factory=partial(array_column, "b"))
+    position: array.array = field(default_factory=partial(array_column, "i"))
+    driverName: list = field(default_factory=partial(list_column, ""))
+    vehicleName: list = field(default_factory=partial(list_column, ""))
+    vehicleClass: list = field(default_factory=partial(list_column, ""))
+    positionInClass: array.array = field(default_factory=partial(array_column, "i"))
+    sessionBestLapTime: array.array = field(default_factory=partial(array_column, "d"))
+    classBestLapTime: array.array = field(default_factory=partial(array_column, "d"))
+    bestLapTime: array.array = field(default_factory=partial(array_column, "d"))
+    lastLapTime: array.array = field(default_factory=partial(array_column, "d"))
+    isPlayer: array.array = field(default_factory=partial(array_column, "b"))
+    lapProgress: array.array = field(default_factory=partial(array_column, "d"))
+    relativeDistance: array.array = field(default_factory=partial(array_column, "d"))
+    relativeTimeGap: array.array = field(default_factory=partial(array_column, "d"))
+    gapBehindNextInClass: list = field(default_factory=partial(list_column, 0))
+    gapBehindNext: list = field(default_factory=partial(list_column, 0))
+    gapBehindLeader: list = field(default_factory=partial(list_column, 0))
+    isLapped: array.array = field(default_factory=partial(array_column, "d"))
+    isYellow: array.array = field(default_factory=partial(array_column, "b"))
+    numPitStops: array.array = field(default_factory=partial(array_column, "i"))
+    pitState: array.array = field(default_factory=partial(array_column, "i"))
+    pitTime: array.array = field(default_factory=partial(array_column, "d"))
+    tireCompound: list = field(default_factory=partial(list_column, (0, 0)))
+    posXZ: list = field(default_factory=partial(list_column, (0, 0)))
+    relativeOrientationXZRadians: array.array = field(default_factory=partial(array_column, "d"))
+    relativeRotatedPosXZ: list = field(default_factory=partial(list_column, (0, 0)))
+    relativeStraightDistance: array.array = field(default_factory=partial(array_column, "d"))
 
     def __post_init__(self):
-        self.pitTimer = tuple(array.array("f", [0,-1,0]) for _ in range(128))
+        self.pitTimer = tuple(array.array("f", [0,-1,0]) for _ in range(MAX_VEHICLES))
+        self.columnVersion = dict.fromkeys(VEHICLE_DATA_COLUMNS, 0)
+
+    def version(self, columns: tuple) -> int:
+        """Combined version of selected columns, changes if any column changed"""
+        return sum(map(self.columnVersion.__getitem__, columns))
 
 
 @dataclass
@@ -205,6 +314,7 @@ class ModuleInfo:
         self.relative = RelativeInfo()
         self.restapi = RestAPIInfo()
         self.sectors = SectorsInfo()
+        self.strategy = StrategyInfo()
         self.vehicles = VehiclesInfo()
         self.wheels = WheelsInfo()
 
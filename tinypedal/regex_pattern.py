@@ -84,6 +84,7 @@ CFG_INTEGER = (
     "^parts_max_width$|"
     "^position_x$|"
     "^position_y$|"
+    "^render_frame_rate$|"
     "^stint_history_count$|"
     # Partial match
     "area_margin|"
@@ -36,6 +36,7 @@ APPLICATION_DEFAULT = {
         "global_bkg_color": "#000000",
         "grid_move_size": 8,
         "minimum_update_interval": 10,
+        "render_frame_rate": 0,
         "maximum_saving_attempts": 10,
     },
     "overlay": {
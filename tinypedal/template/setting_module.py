@@ -60,6 +60,8 @@ MODULE_DEFAULT = {
         "enable": True,
         "update_interval": 10,
         "idle_update_interval": 400,
+        "number_of_minimum_averaging_laps": 2,
+        "number_of_maximum_averaging_laps": 5,
     },
     "module_relative": {
         "enable": True,
@@ -83,12 +85,26 @@ MODULE_DEFAULT = {
         "idle_update_interval": 400,
         "enable_all_time_best_sectors": True,
     },
+    "module_strategy": {
+        "enable": True,
+        "update_interval": 100,
+        "idle_update_interval": 400,
+        "pit_stop_time_loss": 30,
+        "refueling_rate": 2,
+        "fuel_saving_time_loss": 0.05,
+        "maximum_fuel_saving": 10,
+        "minimum_finish_probability": 0.95,
+        "number_of_maximum_pit_stops": 5,
+        "number_of_history_laps": 20,
+        "number_of_strategy_samples": 1000,
+    },
     "module_vehicles": {
         "enable": True,
         "update_interval": 20,
         "idle_update_interval": 400,
         "lap_difference_ahead_threshold": 0.9,
         "lap_difference_behind_threshold": 0.9,
+        "stale_position_distance_threshold": 20,
     },
     "module_wheels": {
         "enable": True,
@@ -920,6 +920,7 @@ WIDGET_DEFAULT = {
         "show_circle_vehicle_shape": False,
         "vehicle_size": 20,
         "vehicle_offset": 0.8,
+        "enable_vehicle_motion_interpolation": False,
         "vehicle_color_player": "#FF4422",
         "vehicle_color_leader": "#88FF00",
         "vehicle_color_same_lap": "#FFFFFF",
@@ -1002,6 +1003,45 @@ WIDGET_DEFAULT = {
         "column_index_brake": 3,
         "column_index_throttle": 4,
     },
+    "pit_strategy": {
+        "enable": False,
+        "update_interval": 100,
+        "position_x": 57,
+        "position_y": 400,
+        "opacity": 0.9,
+        "layout": 0,
+        "font_name": "Consolas",
+        "font_size": 15,
+        "font_weight": "bold",
+        "bar_padding": 0.2,
+        "bar_gap": 2,
+        "bar_width": 5,
+        "show_pit_stops": True,
+        "prefix_pit_stops": "STOP",
+        "font_color_pit_stops": "#FFFFFF",
+        "bkg_color_pit_stops": "#222222",
+        "show_next_pit_lap": True,
+        "prefix_next_pit_lap": "PIT ",
+        "font_color_next_pit_lap": "#000000",
+        "bkg_color_next_pit_lap": "#FFFFFF",
+        "show_refuel": True,
+        "prefix_refuel": "FUEL",
+        "font_color_refuel": "#FFFFFF",
+        "bkg_color_refuel": "#222222",
+        "show_fuel_saving": True,
+        "prefix_fuel_saving": "SAVE",
+        "font_color_fuel_saving": "#FFFFFF",
+        "bkg_color_fuel_saving": "#222222",
+        "show_finish_probability": True,
+        "prefix_finish_probability": "FIN ",
+        "font_color_finish_probability": "#FFFFFF",
+        "bkg_color_finish_probability": "#222222",
+        "column_index_pit_stops": 1,
+        "column_index_next_pit_lap": 2,
+        "column_index_refuel": 3,
+        "column_index_fuel_saving": 4,
+        "column_index_finish_probability": 5,
+    },
     "radar": {
         "enable": True,
         "update_interval": 20,
@@ -1013,6 +1053,7 @@ WIDGET_DEFAULT = {
         "vehicle_length": 4.6,
         "vehicle_width": 2.2,
         "vehicle_border_radius": 2,
+        "enable_vehicle_motion_interpolation": False,
         "vehicle_color_player": "#FF4422",
         "vehicle_color_leader": "#88FF00",
         "vehicle_color_same_lap": "#FFFFFF",
@@ -1099,6 +1140,7 @@ WIDGET_DEFAULT = {
         "font_weight": "bold",
         "bar_padding": 0.2,
         "bar_gap": 1,
+        "enable_painter_table_mode": False,
         "show_player_highlighted": True,
         "show_lap_difference": True,
         "font_color_same_lap": "#FFFFFF",
@@ -1274,6 +1316,7 @@ WIDGET_DEFAULT = {
         "font_weight": "bold",
         "bar_padding": 0.2,
         "bar_gap": 1,
+        "enable_painter_table_mode": False,
         "show_position": True,
         "font_color_position": "#FFFFFF",
         "bkg_color_position": "#333333",
@@ -1454,6 +1497,7 @@ WIDGET_DEFAULT = {
         "font_weight": "bold",
         "bar_padding": 0.2,
         "bar_gap": 1,
+        "enable_painter_table_mode": False,
         "max_vehicles_combined_mode": 12,
         "max_vehicles_split_mode": 50,
         "min_top_vehicles": 3,
@@ -1735,6 +1779,7 @@ WIDGET_DEFAULT = {
         "sector_line_width": 3,
         "sector_line_length": 7,
         "show_vehicle_standings": True,
+        "enable_vehicle_motion_interpolation": False,
         "vehicle_color_player": "#FF4422",
         "vehicle_color_leader": "#88FF00",
         "vehicle_color_same_lap": "#FFFFFF",
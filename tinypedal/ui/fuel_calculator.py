@@ -49,6 +49,7 @@ from .. import calculation as calc
 from .. import formatter as fmt
 
 PANEL_LEFT_WIDTH = 350
+STRATEGY_CHECK_INTERVAL = 500  # ms
 READ_ONLY_COLOR = QPalette().window().color().name(QColor.HexRgb)
 HIGHLIGHT_COLOR = "#F40"
 
@@ -106,6 +107,14 @@ class FuelCalculator(QDialog):
         self.setLayout(layout_main)
         self.setFixedWidth(self.sizeHint().width())
 
+        # Refresh live pit strategy on strategy module update
+        self.startTimer(STRATEGY_CHECK_INTERVAL)
+
+    def timerEvent(self, event):
+        """Check live pit strategy update"""
+        if self.output_strategy.last_version != minfo.strategy.updateVersion:
+            self.output_strategy.update_strategy(minfo.strategy)
+
     def toggle_history_panel(self):
         """Toggle history data panel"""
         if self.panel_table.isHidden():
@@ -166,6 +175,8 @@ class FuelCalculator(QDialog):
             self.input_fuel.fuel_used.setValue(fuel_units(fuel_used))
             energy_used = self.history_data[0][4]
             self.input_fuel.energy_used.setValue(energy_used)
+        # Load live pit strategy
+        self.output_strategy.update_strategy(minfo.strategy)
 
     def refresh_table(self):
         """Refresh history data table"""
@@ -254,6 +265,10 @@ class FuelCalculator(QDialog):
         frame_output_start_energy = QFrame()
         frame_output_start_energy.setFrameShape(QFrame.StyledPanel)
 
+        frame_output_strategy = QFrame()
+        frame_output_strategy.setFrameShape(QFrame.StyledPanel)
+        frame_output_strategy.setFixedWidth(PANEL_LEFT_WIDTH)
+
         self.input_laptime = InputLapTime(self, frame_laptime)
         self.input_fuel = InputFuel(self, frame_fuel)
         self.input_race = InputRace(self, frame_race)
@@ -262,6 +277,7 @@ class FuelCalculator(QDialog):
         self.usage_energy = OutputUsage(frame_output_energy, "Energy")
         self.refill_fuel = OutputRefill(self, frame_output_start_fuel, "Fuel")
         self.refill_energy = OutputRefill(self, frame_output_start_energy, "Energy")
+        self.output_strategy = OutputStrategy(frame_output_strategy)
 
         button_reload = QPushButton("Reload")
         button_reload.clicked.connect(self.reload_data)
@@ -286,6 +302,7 @@ class FuelCalculator(QDialog):
         layout_calculator.addWidget(frame_race)
         layout_calculator.addLayout(layout_split1)
         layout_calculator.addLayout(layout_split2)
+        layout_calculator.addWidget(frame_output_strategy)
 
         layout_button = QHBoxLayout()
         layout_button.addWidget(button_reload, stretch=1)
@@ -746,3 +763,57 @@ class OutputRefill():
         layout_output.addWidget(QLabel(unit_text), 3, 1)
 
         frame.setLayout(layout_output)
+
+
+class OutputStrategy():
+    """Output live pit strategy display"""
+
+    def __init__(self, frame) -> None:
+        """Set output display"""
+        self.pit_stops = QLineEdit("0")
+        self.pit_laps = QLineEdit("-")
+        self.refuel = QLineEdit("0.000")
+        self.fuel_saving = QLineEdit("0.0")
+        self.finish_probability = QLineEdit("0")
+        self.last_version = None
+
+        for line_edit in (
+            self.pit_stops, self.pit_laps, self.refuel,
+            self.fuel_saving, self.finish_probability):
+            line_edit.setAlignment(Qt.AlignRight)
+            line_edit.setReadOnly(True)
+            set_read_only_style(line_edit)
+
+        layout_output = QGridLayout()
+
+        layout_output.addWidget(QLabel("Strategy Pit Stops:"), 0, 0, 1, 2)
+        layout_output.addWidget(self.pit_stops, 1, 0)
+        layout_output.addWidget(QLabel("pit"), 1, 1)
+
+        layout_output.addWidget(QLabel("Pit At End Of Lap:"), 0, 2, 1, 2)
+        layout_output.addWidget(self.pit_laps, 1, 2)
+        layout_output.addWidget(QLabel("lap"), 1, 3)
+
+        layout_output.addWidget(QLabel("Refilling Per Stop:"), 2, 0, 1, 2)
+        layout_output.addWidget(self.refuel, 3, 0)
+        layout_output.addWidget(QLabel(fuel_unit_text()), 3, 1)
+
+        layout_output.addWidget(QLabel("Fuel Saving:"), 2, 2, 1, 2)
+        layout_output.addWidget(self.fuel_saving, 3, 2)
+        layout_output.addWidget(QLabel("%"), 3, 3)
+
+        layout_output.addWidget(QLabel("Finish Probability:"), 4, 0, 1, 2)
+        layout_output.addWidget(self.finish_probability, 5, 0)
+        layout_output.addWidget(QLabel("%"), 5, 1)
+
+        frame.setLayout(layout_output)
+
+    def update_strategy(self, strategy):
+        """Update strategy output"""
+        self.last_version = strategy.updateVersion
+        self.pit_stops.setText(f"{strategy.numPitStops}")
+        self.pit_laps.setText(
+            ", ".join(map(str, strategy.pitStopLaps)) if strategy.pitStopLaps else "-")
+        self.refuel.setText(f"{fuel_units(strategy.refuelAmount):.3f}")
+        self.fuel_saving.setText(f"{strategy.fuelSaving:.1f}")
+        self.finish_probability.setText(f"{strategy.finishProbability * 100:.0f}")
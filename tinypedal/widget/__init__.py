@@ -50,6 +50,7 @@ from . import (
     navigation,
     p2p,
     pedal,
+    pit_strategy,
     radar,
     rake_angle,
     relative,
@@ -22,17 +22,25 @@ Overlay base window, events.
 
 from __future__ import annotations
 
+import logging
 import re
-from dataclasses import dataclass
-
-from PySide2.QtCore import Qt, Slot, QBasicTimer
-from PySide2.QtGui import QPalette, QFont, QFontMetrics
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from math import ceil
+from operator import attrgetter
+
+from PySide2.QtCore import Qt, Slot, QBasicTimer, QObject, QPointF, QRect, QRectF
+from PySide2.QtGui import (
+    QColor, QPalette, QFont, QFontMetrics, QGuiApplication, QPainter, QPixmap)
 from PySide2.QtWidgets import QWidget, QLabel, QLayout
 
+from ..api_control import api
 from ..const import APP_NAME
 from ..regex_pattern import FONT_WEIGHT_LIST
 from ..overlay_control import octrl
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class FontMetrics:
@@ -44,6 +52,310 @@ class FontMetrics:
     descent: int = 0
 
 
+class FrameAPI:
+    """Per-frame API reading cache for widgets, GUI thread only
+
+    Mirrors api.read, such as frame_api.read.timing.elapsed(). Each reading
+    (with same arguments) is only read from API once per render clock tick,
+    and shared by all widgets updated on same tick.
+    """
+
+    def __init__(self):
+        self._cache = {}
+        self._source = None
+        self._reader = None
+
+    @property
+    def read(self) -> FrameReader:
+        """Cached API reader, rebuilt if API reader changed (API restarted)"""
+        source = api.read
+        if source is not self._source:
+            self._source = source
+            self._reader = FrameReader(source, self._cache)
+            self._cache.clear()
+        return self._reader
+
+    def next_frame(self):
+        """Clear cached readings for next frame"""
+        self._cache.clear()
+
+
+class FrameReader:
+    """Cached API reader, create cached data section on first access"""
+
+    def __init__(self, source: object, cache: dict):
+        self._source = source
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> FrameSection:
+        section = FrameSection(getattr(self._source, name), self._cache, name)
+        setattr(self, name, section)
+        return section
+
+
+class FrameSection:
+    """Cached API data section, create cached reading method on first access"""
+
+    def __init__(self, source: object, cache: dict, section_name: str):
+        self._source = source
+        self._cache = cache
+        self._section_name = section_name
+
+    def __getattr__(self, name: str) -> callable:
+        method = getattr(self._source, name)
+        cache = self._cache
+        method_key = f"{self._section_name}.{name}"
+
+        def cached_method(*args):
+            key = (method_key, args) if args else method_key
+            try:
+                return cache[key]
+            except KeyError:
+                value = cache[key] = method(*args)
+                return value
+
+        setattr(self, name, cached_method)
+        return cached_method
+
+
+frame_api = FrameAPI()
+
+
+class RenderClock(QObject):
+    """Shared render clock
+
+    Ticks all overlay widgets in one batch from a single timer aligned to
+    target frame rate, instead of separate timer for each widget, so widget
+    updates land on same frame. Each widget keeps its own update interval
+    by accumulating frame time, and only updates on frames that reach it.
+
+    Frame rate is set once by first registered widget, and stays same for
+    all widgets until all widgets are unregistered (such as widget reload).
+    If fastest widget update interval is shorter than frame interval,
+    clock ticks at that update interval instead.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QBasicTimer()
+        self._frame_interval = 1000 / 60
+        self._tick_interval = 0
+        self._widgets = {}  # key: widget, value: [update interval, accumulated time]
+
+    def register(self, widget: Overlay, update_interval: int, frame_rate: int = 0):
+        """Register widget to render clock
+
+        Args:
+            widget: overlay widget, updated via timerEvent.
+            update_interval: widget update interval in milliseconds.
+            frame_rate: target frame rate, 0 for display refresh rate.
+                Only applied while no widget is registered.
+        """
+        if not self._widgets:
+            if frame_rate <= 0:
+                screen = QGuiApplication.primaryScreen()
+                frame_rate = screen.refreshRate() if screen else 60
+            self._frame_interval = 1000 / max(frame_rate, 1)
+        # Set accumulated time to interval to update on next tick
+        self._widgets[widget] = [update_interval, update_interval]
+        self.__set_tick_interval()
+
+    def unregister(self, widget: Overlay):
+        """Unregister widget from render clock"""
+        self._widgets.pop(widget, None)
+        self.__set_tick_interval()
+
+    def __set_tick_interval(self):
+        """Set tick interval to multiple of frame interval, up to fastest widget interval"""
+        if not self._widgets:
+            self._timer.stop()
+            self._tick_interval = 0
+            return
+        min_interval = min(timing[0] for timing in self._widgets.values())
+        if min_interval < self._frame_interval:
+            tick_interval = min_interval  # faster than frame rate
+        else:
+            tick_interval = self._frame_interval * int(min_interval / self._frame_interval)
+        if tick_interval != self._tick_interval or not self._timer.isActive():
+            self._tick_interval = tick_interval
+            self._timer.start(round(tick_interval), Qt.PreciseTimer, self)
+
+    def timerEvent(self, event):
+        """Update widgets that reached update interval"""
+        frame_api.next_frame()
+        tick_interval = self._tick_interval
+        half_tick = tick_interval * 0.5
+        error = None
+        for widget, timing in tuple(self._widgets.items()):
+            timing[1] += tick_interval
+            # Round to nearest tick, keep average update interval
+            if timing[1] + half_tick >= timing[0]:
+                timing[1] = min(timing[1] - timing[0], half_tick)
+                try:
+                    if widget.input_changed():
+                        widget.timerEvent(event)
+                except Exception as exc:  # update other widgets before raising error
+                    logger.error("RENDER: %s update failed", widget.widget_name)
+                    if error is None:
+                        error = exc
+        if error is not None:
+            raise error
+
+
+render_clock = RenderClock()
+
+
+class StyleCache:
+    """Style cache, GUI thread only
+
+    Converts color-only qt style sheet, such as from Overlay.set_qss() with
+    fg_color & bg_color, to prebuilt QPalette. Applying palette skips
+    style sheet parsing & repolish on every color change.
+    """
+
+    __slots__ = ("_styles",)
+
+    def __init__(self):
+        self._styles = {}
+
+    def get(self, qss: str) -> tuple[QPalette, bool] | None:
+        """Get palette & whether fill background, None if not color-only style sheet"""
+        if qss in self._styles:
+            return self._styles[qss]
+        style = self._styles[qss] = self.parse(qss)
+        return style
+
+    @staticmethod
+    def parse(qss: str) -> tuple[QPalette, bool] | None:
+        """Parse color-only style sheet to palette"""
+        palette = QPalette()
+        fill_bkg = False
+        for declaration in qss.split(";"):
+            if not declaration.strip():
+                continue
+            name, _, value = declaration.partition(":")
+            color = QColor(value.strip())
+            if not color.isValid():
+                return None
+            name = name.strip()
+            if name == "color":
+                palette.setColor(QPalette.WindowText, color)
+            elif name in ("background", "background-color"):
+                palette.setColor(QPalette.Window, color)
+                fill_bkg = True
+            else:
+                return None
+        return palette, fill_bkg
+
+
+style_cache = StyleCache()
+
+
+class StyleLabel(QLabel):
+    """QLabel that applies color-only style sheet with cached palette
+
+    Other style sheet is applied as normal style sheet.
+    """
+
+    def __init__(self, *args):
+        self._style = None
+        self._has_qss = False
+        super().__init__(*args)
+
+    def setStyleSheet(self, qss: str):
+        """Set style sheet"""
+        if qss == self._style:
+            return
+        self._style = qss
+        style = style_cache.get(qss)
+        if style is None:
+            self.setAutoFillBackground(False)
+            # Restore inherited palette from cached palette
+            parent = self.parentWidget()
+            self.setPalette(parent.palette() if parent is not None else QPalette())
+            self._has_qss = True
+            super().setStyleSheet(qss)
+            return
+        if self._has_qss:
+            self._has_qss = False
+            super().setStyleSheet("")
+        self.setPalette(style[0])
+        self.setAutoFillBackground(style[1])
+
+
+class TextCache:
+    """Pre-rendered text pixmap cache, GUI thread only
+
+    Text is rendered to pixmap once for each font, color, text, alignment
+    & area size, and drawn as pixmap afterwards. Shared by all widgets,
+    least recently used pixmap is removed while cache is full.
+
+    Args:
+        max_size: maximum number of cached pixmaps.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._max_size = max_size
+        self._pixmaps = OrderedDict()
+        self._font_keys = {}  # key: font id, value: (font, font key)
+
+    def draw_text(
+        self, painter: QPainter, rect: QRect | QRectF, align: Qt.Alignment,
+        text: str, font: QFont, color: str):
+        """Draw text, same as QPainter.drawText(rect, align, text) with font & color
+
+        Args:
+            painter: target painter.
+            rect: text area.
+            align: text alignment in area.
+            text: text string.
+            font: text font, should not be modified after first draw.
+            color: text color string.
+        """
+        if not text:
+            return
+        font_key = self._font_keys.get(id(font))
+        if font_key is None or font_key[0] is not font:
+            if len(self._font_keys) >= 64:  # remove fonts from closed widgets
+                self._font_keys.clear()
+            font_key = self._font_keys[id(font)] = (font, font.key())
+        pixel_ratio = painter.device().devicePixelRatioF()
+        key = (font_key[1], color, text, int(align), rect.width(), rect.height(), pixel_ratio)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self._pixmaps[key] = self.render_text(
+                rect, align, text, font, color, pixel_ratio)
+            if len(self._pixmaps) > self._max_size:
+                self._pixmaps.popitem(last=False)
+        else:
+            self._pixmaps.move_to_end(key)
+        # Align to device pixel grid, avoid blurry text while smooth pixmap transform is enabled
+        painter.drawPixmap(
+            QPointF(round(rect.x() * pixel_ratio) / pixel_ratio,
+                    round(rect.y() * pixel_ratio) / pixel_ratio),
+            pixmap)
+
+    @staticmethod
+    def render_text(
+        rect: QRect | QRectF, align: Qt.Alignment, text: str, font: QFont, color: str,
+        pixel_ratio: float = 1.0) -> QPixmap:
+        """Render text to transparent pixmap of area size, at device pixel ratio"""
+        width = rect.width()
+        height = rect.height()
+        pixmap = QPixmap(ceil(width * pixel_ratio), ceil(height * pixel_ratio))
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(QRectF(0, 0, width, height), align, text)
+        painter.end()
+        return pixmap
+
+
+text_cache = TextCache()
+
+
 class Overlay(QWidget):
     """Overlay window"""
 
@@ -68,12 +380,15 @@ class Overlay(QWidget):
         self._mouse_pressed = 0
         self._move_size = max(self.cfg.compatibility["grid_move_size"], 1)
 
-        # Set update timer
-        self._update_timer = QBasicTimer()
+        # Set update interval, updated from shared render clock
         self._update_interval = max(
             self.wcfg["update_interval"],
             self.cfg.compatibility["minimum_update_interval"])
 
+        # Input sources, skip update if unchanged, see set_update_sources()
+        self._update_sources = ()
+        self._last_input_versions = None
+
     def start(self):
         """Set initial widget state in orders, and start update"""
         self.__connect_signal()
@@ -81,15 +396,43 @@ class Overlay(QWidget):
         self.__set_window_attributes()  # 1
         self.__set_window_flags()       # 2
         #self.show()                     # 3 show before starting update
-        self._update_timer.start(self._update_interval, self)
+        render_clock.register(
+            self, self._update_interval, self.cfg.compatibility["render_frame_rate"])
 
     def stop(self):
         """Stop and close widget"""
-        self._update_timer.stop()
+        render_clock.unregister(self)
         self.__break_signal()
         self.unload_resource()
         self.closed = self.close()
 
+    def set_update_sources(self, *sources: object):
+        """Set input sources that widget update depends on
+
+        Widget update (timerEvent) is skipped while overlay state and all
+        input sources are unchanged since last update. Only set for widget
+        that displays nothing else, such as timer based effects.
+
+        Args:
+            sources: module info data object (minfo dataclass), compared by all field values;
+                or callable that returns input value or version counter, such as api reading.
+                Mutable field (list, array) must be replaced instead of modified in place,
+                otherwise use a version counter.
+        """
+        self._update_sources = tuple(
+            create_source_reader(source) for source in sources)
+        self._last_input_versions = None
+
+    def input_changed(self) -> bool:
+        """Check whether overlay state or any input source changed since last update"""
+        if not self._update_sources:
+            return True
+        input_versions = (self.state.active, *(read() for read in self._update_sources))
+        if input_versions == self._last_input_versions:
+            return False
+        self._last_input_versions = input_versions
+        return True
+
     def unload_resource(self):
         """Unload resource (such as images) on close, can re-implement in widget"""
         instance_var_list = dir(self)
@@ -296,9 +639,9 @@ class Overlay(QWidget):
             QLabel instance.
         """
         if text is not None:
-            bar_temp = QLabel(text)
+            bar_temp = StyleLabel(text)
         else:
-            bar_temp = QLabel()  # empty label
+            bar_temp = StyleLabel()  # empty label
 
         if style is not None:
             bar_temp.setStyleSheet(style)
@@ -362,3 +705,13 @@ class Overlay(QWidget):
                 self.layout().addWidget(target, 0, column)
             else:
                 self.layout().addLayout(target, 0, column)
+
+
+def create_source_reader(source: object) -> callable:
+    """Create input source reader, returns all field values for dataclass source"""
+    if is_dataclass(source):
+        field_getter = attrgetter(*(data_field.name for data_field in fields(source)))
+        return lambda: field_getter(source)
+    if callable(source):
+        return source
+    raise TypeError(f"invalid update source: {source!r}")
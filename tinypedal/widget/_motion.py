@@ -0,0 +1,139 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Vehicle motion interpolation for map widgets.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+MAX_SPEED = 200  # meters per second, larger position change is treated as teleport
+MAX_SAMPLE_GAP = 1  # seconds, reset motion if vehicle data not updated for longer
+MAX_EXTRAPOLATION = 2  # maximum extrapolation time relative to sample interval
+PI = 3.14159265
+PI2 = 6.28318531
+
+
+class MotionInterpolator:
+    """Vehicle motion interpolator
+
+    Keeps last sample of each vehicle (by slot ID), and estimates position &
+    yaw at display time from velocity & yaw rate of last two samples, so
+    vehicle markers move smoothly between vehicle data updates.
+
+    Estimation extrapolates up to two sample intervals from last sample,
+    and stops moving if vehicle data is not updated. Prediction error
+    of previous sample is blended out over next sample interval,
+    instead of jumping to new position.
+
+    Position is in meters, yaw in radians.
+    """
+
+    def __init__(self):
+        # key: slot id, value: [x, y, yaw, velocity x, y, yaw, prediction error x, y, yaw]
+        self._samples = {}
+        self._sample_time = 0.0
+        self._interval = 0.0  # smoothed sample interval
+
+    def reset(self):
+        """Reset samples"""
+        self._samples.clear()
+        self._sample_time = 0.0
+        self._interval = 0.0
+
+    def update(self, slot_ids, positions, yaws, total: int):
+        """Add new samples, call only while vehicle data updated
+
+        Args:
+            slot_ids: vehicle slot ID column.
+            positions: vehicle (x, y) position column.
+            yaws: vehicle yaw radians column, or None if not used.
+            total: total vehicles.
+        """
+        now = perf_counter()
+        sample_gap = now - self._sample_time
+        self._sample_time = now
+        last_interval = self._interval
+        if sample_gap > MAX_SAMPLE_GAP:
+            self._samples.clear()
+            self._interval = 0.0
+        elif last_interval:
+            self._interval += (sample_gap - last_interval) * 0.2
+        else:
+            self._interval = sample_gap
+
+        interval = self._interval
+        max_step = MAX_SPEED * sample_gap
+        last_samples = self._samples
+        samples = {}
+        for index in range(total):
+            pos_x, pos_y = positions[index]
+            yaw = yaws[index] if yaws else 0.0
+            last = last_samples.get(slot_ids[index])
+            if last is None or not last_interval:
+                samples[slot_ids[index]] = [pos_x, pos_y, yaw, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                continue
+            delta_x = pos_x - last[0]
+            delta_y = pos_y - last[1]
+            if abs(delta_x) > max_step or abs(delta_y) > max_step:
+                samples[slot_ids[index]] = [pos_x, pos_y, yaw, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                continue
+            # Prediction error of last sample, which is blended out over next interval
+            est_x, est_y, est_yaw = self.__estimate(last, sample_gap / last_interval, sample_gap)
+            delta_yaw = (yaw - last[2] + PI) % PI2 - PI
+            samples[slot_ids[index]] = [
+                pos_x, pos_y, yaw,
+                delta_x / interval, delta_y / interval, delta_yaw / interval,
+                est_x - pos_x, est_y - pos_y, (est_yaw - yaw + PI) % PI2 - PI,
+            ]
+        self._samples = samples
+
+    def position(
+        self, slot_id: int, now: float, pos_x: float, pos_y: float, yaw: float = 0.0
+        ) -> tuple[float, float, float]:
+        """Estimated (x, y, yaw) of vehicle at time
+
+        Args:
+            slot_id: vehicle slot ID.
+            now: display time from perf_counter().
+            pos_x, pos_y, yaw: current vehicle data, returned if vehicle has no sample.
+        """
+        sample = self._samples.get(slot_id)
+        if sample is None:
+            return pos_x, pos_y, yaw
+        if not self._interval:
+            return sample[0], sample[1], sample[2]
+        elapsed = now - self._sample_time
+        return self.__estimate(sample, elapsed / self._interval, elapsed)
+
+    @staticmethod
+    def __estimate(sample: list, progress: float, elapsed: float) -> tuple[float, float, float]:
+        """Estimate (x, y, yaw) from sample, progress is elapsed time over sample interval"""
+        if progress >= 1:
+            if progress > MAX_EXTRAPOLATION:
+                elapsed *= MAX_EXTRAPOLATION / progress
+            blend = 0.0
+        else:
+            blend = 1 - max(progress, 0)
+        return (
+            sample[0] + sample[3] * elapsed + sample[6] * blend,
+            sample[1] + sample[4] * elapsed + sample[7] * blend,
+            sample[2] + sample[5] * elapsed + sample[8] * blend,
+        )
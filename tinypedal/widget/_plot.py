@@ -0,0 +1,97 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Ring buffer plot for trace & time-series widgets.
+"""
+
+from __future__ import annotations
+
+from PySide2.QtCore import QPointF
+from PySide2.QtGui import QPainter
+
+
+class PlotBuffer:
+    """Ring buffer plot
+
+    Samples are stored in preallocated list of double size, each sample is
+    written at ring index & ring index + size, so last samples are always
+    a contiguous slice that is drawn with one drawPolyline or drawPoints call.
+    Adding sample does not shift or rewrite previous samples.
+
+    For time-series plot (x_step set), sample x position is fixed by storage index,
+    and plot is scrolled with painter translate (see scroll_offset), so that
+    newest sample is drawn at x = 0, and older samples at x_step, x_step * 2, etc.
+
+    Args:
+        size: max samples.
+        x_step: x distance between samples for time-series plot, 0 for 2D plot.
+    """
+
+    __slots__ = ("_size", "_x_step", "_points", "_index", "_count")
+
+    def __init__(self, size: int, x_step: float = 0):
+        self._size = max(int(size), 1)
+        self._x_step = x_step
+        self._points = [QPointF() for _ in range(self._size * 2)]
+        self._index = 0  # storage index of newest sample in lower half
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        """Clear samples"""
+        self._index = 0
+        self._count = 0
+
+    def append(self, y: float):
+        """Append time-series sample"""
+        index = self.__next_index()
+        size = self._size
+        x_step = self._x_step
+        self._points[index] = QPointF(-index * x_step, y)
+        self._points[index + size] = QPointF(-(index + size) * x_step, y)
+
+    def append_point(self, point: QPointF):
+        """Append 2D sample"""
+        index = self.__next_index()
+        self._points[index] = self._points[index + self._size] = point
+
+    def samples(self) -> list:
+        """Last samples in order from oldest to newest, as contiguous slice"""
+        end = self._index + self._size + 1
+        return self._points[end - self._count:end]
+
+    def scroll_offset(self) -> float:
+        """Time-series plot x translation, which places newest sample at x = 0"""
+        return (self._index + self._size) * self._x_step
+
+    def draw(self, painter: QPainter, points_only: bool = False):
+        """Draw samples as polyline or points, painter must be translated for time-series plot"""
+        if points_only:
+            painter.drawPoints(self.samples())
+        else:
+            painter.drawPolyline(self.samples())
+
+    def __next_index(self) -> int:
+        """Advance ring index & sample count, return storage index for new sample"""
+        self._index = (self._index + 1) % self._size
+        if self._count < self._size:
+            self._count += 1
+        return self._index
@@ -0,0 +1,275 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Painter table, draws table cells with QPainter instead of QLabel grid.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+
+from PySide2.QtCore import QPointF, QRect, QTimer
+from PySide2.QtGui import QColor, QFont, QFontMetrics, QPainter, QPixmap, QStaticText, QTransform
+from PySide2.QtWidgets import QWidget
+
+MAX_CACHED_TEXT = 4096
+DEFAULT_STYLE = (None, None, 0, -1)  # font color, background color, margin top, max height
+
+
+class PainterTableCell:
+    """Painter table cell
+
+    Provides same text, pixmap, style & visibility methods as QLabel
+    that are used by table widgets, so cell can replace QLabel directly.
+    Changes only mark cell area for repaint, or table for relayout.
+    """
+
+    __slots__ = ("table", "row", "column", "width", "text", "pixmap", "style", "hidden", "rect")
+
+    def __init__(self, table: PainterTable, row: int, column: int, width: int, style: tuple):
+        self.table = table
+        self.row = row
+        self.column = column
+        self.width = width
+        self.text = ""
+        self.pixmap = None
+        self.style = style
+        self.hidden = False
+        self.rect = QRect()
+
+    def setText(self, text: str):
+        """Set cell text, clear pixmap"""
+        if text != self.text or self.pixmap is not None:
+            self.text = text
+            self.pixmap = None
+            self.table.update_cell(self)
+
+    def setPixmap(self, pixmap: QPixmap):
+        """Set cell pixmap, clear text"""
+        if pixmap is not self.pixmap:
+            self.text = ""
+            self.pixmap = pixmap
+            self.table.update_cell(self)
+
+    def setStyleSheet(self, qss: str):
+        """Set cell style from qt style sheet"""
+        style = self.table.parse_style(qss)
+        if style is not self.style:
+            last_style = self.style
+            self.style = style
+            if style[2:] != last_style[2:]:  # height changed
+                self.table.relayout()
+            else:
+                self.table.update_cell(self)
+
+    def isHidden(self) -> bool:
+        """Whether cell is hidden"""
+        return self.hidden
+
+    def hide(self):
+        """Hide cell"""
+        if not self.hidden:
+            self.hidden = True
+            self.table.relayout()
+
+    def show(self):
+        """Show cell"""
+        if self.hidden:
+            self.hidden = False
+            self.table.relayout()
+
+    def height(self, row_height: int) -> int:
+        """Cell height, including top margin"""
+        _, _, margin_top, max_height = self.style
+        if max_height >= 0:
+            return margin_top + min(row_height, max_height)
+        return margin_top + row_height
+
+
+class PainterTable(QWidget):
+    """Painter table
+
+    Cells are laid out in grid same as QGridLayout with zero horizontal spacing,
+    rows that have no visible cells are collapsed. Only changed cells are repainted,
+    and text layout is cached with QStaticText.
+
+    Cell style supports a subset of qt style sheet, see parse_style.
+    All cells use table font, and text & pixmap are always center aligned.
+
+    Args:
+        font: text font.
+        row_gap: vertical gap between rows in pixel.
+        font_color: default font color if not set in cell style.
+    """
+
+    def __init__(self, font: QFont, row_gap: int = 0, font_color: str = "#FFFFFF"):
+        super().__init__()
+        self._font = font
+        self._row_height = QFontMetrics(font).height()
+        self._row_gap = row_gap
+        self._font_color = QColor(font_color)
+        self._rows = {}  # key: row index, value: list of cells
+        self._column_widths = {}  # key: column index, value: column width
+        self._row_top = []  # top position of visible rows, for finding rows to repaint
+        self._row_bottom = []
+        self._row_cells = []  # cells of visible rows
+        self._styles = {"": DEFAULT_STYLE}
+        self._static_text = {}
+        self._layout_pending = False
+
+    def add_cell(self, row: int, column: int, width: int, qss: str = "") -> PainterTableCell:
+        """Add cell to table
+
+        Args:
+            row: row index.
+            column: column index.
+            width: cell minimum width in pixel, column uses widest cell width.
+            qss: qt style sheet.
+
+        Returns:
+            PainterTableCell instance.
+        """
+        cell = PainterTableCell(self, row, column, width, self.parse_style(qss))
+        self._rows.setdefault(row, []).append(cell)
+        self._column_widths[column] = max(self._column_widths.get(column, 0), width)
+        self.relayout()
+        return cell
+
+    def parse_style(self, qss: str) -> tuple:
+        """Parse & cache cell style from qt style sheet, same style sheet returns same object
+
+        Supported declarations: color, background, margin-top (px), max-height (px).
+        Other declarations (such as font-size, font-weight, padding) are ignored.
+        """
+        style = self._styles.get(qss)
+        if style is None:
+            font_color = bkg_color = None
+            margin_top = 0
+            max_height = -1
+            for declaration in qss.split(";"):
+                name, _, value = declaration.partition(":")
+                name = name.strip()
+                value = value.strip()
+                if name == "color":
+                    font_color = QColor(value)
+                elif name == "background":
+                    bkg_color = QColor(value)
+                elif name == "margin-top":
+                    margin_top = int(value.rstrip("px") or 0)
+                elif name == "max-height":
+                    max_height = int(value.rstrip("px") or 0)
+            style = self._styles[qss] = (font_color, bkg_color, margin_top, max_height)
+        return style
+
+    def static_text(self, text: str) -> QStaticText:
+        """Get cached static text"""
+        static_text = self._static_text.get(text)
+        if static_text is None:
+            if len(self._static_text) >= MAX_CACHED_TEXT:
+                self._static_text.clear()
+            static_text = QStaticText(text)
+            static_text.prepare(QTransform(), self._font)
+            self._static_text[text] = static_text
+        return static_text
+
+    def update_cell(self, cell: PainterTableCell):
+        """Mark cell area for repaint"""
+        if not cell.hidden and not self._layout_pending:
+            self.update(cell.rect)
+
+    def relayout(self):
+        """Schedule relayout, all changes in same update are laid out once"""
+        if not self._layout_pending:
+            self._layout_pending = True
+            QTimer.singleShot(0, self.__set_layout)
+
+    def __set_layout(self):
+        """Set cell position & table size"""
+        self._layout_pending = False
+        column_left = {}
+        table_width = 0
+        for column in sorted(self._column_widths):
+            column_left[column] = table_width
+            table_width += self._column_widths[column]
+
+        self._row_top.clear()
+        self._row_bottom.clear()
+        self._row_cells.clear()
+        position_y = 0
+        row_height = self._row_height
+        for row in sorted(self._rows):
+            cells = [cell for cell in self._rows[row] if not cell.hidden]
+            if not cells:
+                continue
+            height = max(cell.height(row_height) for cell in cells)
+            for cell in cells:
+                cell.rect = QRect(
+                    column_left[cell.column], position_y,
+                    self._column_widths[cell.column], height)
+            self._row_top.append(position_y)
+            self._row_bottom.append(position_y + height)
+            self._row_cells.append(cells)
+            position_y += height + self._row_gap
+
+        self.setFixedSize(table_width, max(position_y - self._row_gap, 0))
+        self.update()
+
+    def paintEvent(self, event):
+        """Draw cells in repaint area"""
+        area = event.rect()
+        row_first = bisect_right(self._row_bottom, area.top())
+        row_last = bisect_left(self._row_top, area.bottom() + 1)
+        if row_first >= row_last:
+            return None
+        region = event.region()
+        painter = QPainter(self)
+        painter.setFont(self._font)
+        for cells in self._row_cells[row_first:row_last]:
+            for cell in cells:
+                if region.intersects(cell.rect):
+                    self.draw_cell(painter, cell)
+        return None
+
+    def draw_cell(self, painter: QPainter, cell: PainterTableCell):
+        """Draw cell background & content"""
+        font_color, bkg_color, margin_top, max_height = cell.style
+        rect = QRect(cell.rect)
+        if margin_top:
+            rect.setTop(rect.top() + margin_top)
+        if max_height >= 0:
+            rect.setHeight(min(rect.height(), max_height))
+        if rect.height() <= 0:
+            return None
+        if bkg_color is not None:
+            painter.fillRect(rect, bkg_color)
+        if cell.pixmap is not None:
+            if not cell.pixmap.isNull():
+                painter.drawPixmap(
+                    rect.x() + (rect.width() - cell.pixmap.width()) // 2,
+                    rect.y() + (rect.height() - cell.pixmap.height()) // 2,
+                    cell.pixmap)
+        elif cell.text:
+            static_text = self.static_text(cell.text)
+            text_size = static_text.size()
+            painter.setPen(font_color if font_color is not None else self._font_color)
+            painter.drawStaticText(
+                QPointF(rect.x() + (rect.width() - text_size.width()) * 0.5,
+                        rect.y() + (rect.height() - text_size.height()) * 0.5),
+                static_text)
+        return None
@@ -23,9 +23,8 @@ Brake bias Widget
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "brake_bias"
 
@@ -116,14 +115,14 @@ class Realtime(Overlay):
                 self.checked = True
 
             # Brake bias
-            bbias = api.read.brake.bias_front() * 100
+            bbias = frame_api.read.brake.bias_front() * 100
             self.update_bbias(bbias, self.last_bbias)
             self.last_bbias = bbias
 
             # Brake migration
             if self.wcfg["show_brake_migration"]:
-                raw_brake = api.read.input.brake_raw()
-                bpres = api.read.brake.pressure()
+                raw_brake = frame_api.read.input.brake_raw()
+                bpres = frame_api.read.brake.pressure()
                 bpres_sum = sum(bpres)
 
                 if self.bpres_max < bpres_sum:
@@ -23,9 +23,8 @@ Brake performance Widget
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "brake_performance"
 
@@ -183,14 +182,14 @@ class Realtime(Overlay):
 
             # Wheel lock duration
             if self.wcfg["show_front_wheel_lock_duration"] or self.wcfg["show_rear_wheel_lock_duration"]:
-                lap_stime = api.read.timing.start()
-                lap_etime = api.read.timing.elapsed()
+                lap_stime = frame_api.read.timing.start()
+                lap_etime = frame_api.read.timing.elapsed()
 
                 if lap_stime != self.last_lap_stime:  # reset on new lap
                     self.last_lap_stime = lap_stime
                     self.reset_lock_duration = True  # trigger reset on next braking
 
-                if api.read.input.brake_raw() > 0.03:
+                if frame_api.read.input.brake_raw() > 0.03:
                     if self.reset_lock_duration:
                         self.lock_time_f = 0
                         self.lock_time_r = 0
@@ -23,8 +23,7 @@ Brake pressure Widget
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "brake_pressure"
 
@@ -107,7 +106,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Brake pressure
-            self.bpres = tuple(map(self.brake_pressure_units, api.read.brake.pressure()))
+            self.bpres = tuple(map(self.brake_pressure_units, frame_api.read.brake.pressure()))
             self.update_bpres(self.bpres, self.last_bpres)
             self.last_bpres = self.bpres
 
@@ -25,9 +25,8 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import heatmap as hmp
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "brake_temperature"
 
@@ -129,14 +128,14 @@ class Realtime(Overlay):
                 self.checked = True
 
             # Brake temperature
-            btemp = api.read.brake.temperature()
+            btemp = frame_api.read.brake.temperature()
             for idx in range(4):
                 self.update_btemp(self.bar_btemp[idx], btemp[idx], self.last_btemp[idx])
             self.last_btemp = btemp
 
             # Brake average temperature
             if self.wcfg["show_average"]:
-                lap_stime = api.read.timing.start()
+                lap_stime = frame_api.read.timing.start()
 
                 if lap_stime != self.last_lap_stime:  # time stamp difference
                     self.last_lap_stime = lap_stime  # reset time stamp counter
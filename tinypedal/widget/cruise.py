@@ -26,9 +26,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "cruise"
 
@@ -152,19 +151,19 @@ class Realtime(Overlay):
                     time_scale = self.wcfg["track_clock_time_scale"]
 
                 track_time = calc.clock_time(
-                    api.read.session.elapsed(), api.read.session.start(), time_scale)
+                    frame_api.read.session.elapsed(), frame_api.read.session.start(), time_scale)
                 self.update_track_clock(track_time, self.last_track_time)
                 self.last_track_time = track_time
 
             # Compass
             if self.wcfg["show_compass"]:
-                orientation = api.read.vehicle.orientation_yaw_radians()
+                orientation = frame_api.read.vehicle.orientation_yaw_radians()
                 self.update_compass(orientation, self.last_orientation)
                 self.last_orientation = orientation
 
             # Elevation
             if self.wcfg["show_elevation"]:
-                elevation = api.read.vehicle.position_vertical()
+                elevation = frame_api.read.vehicle.position_vertical()
                 self.update_elevation(elevation, self.last_elevation)
                 self.last_elevation = elevation
 
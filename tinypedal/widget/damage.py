@@ -23,8 +23,7 @@ Damage Widget
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen, QBrush
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "damage"
 
@@ -140,12 +139,12 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Damage body
-            self.damage_body = api.read.vehicle.damage_severity()
+            self.damage_body = frame_api.read.vehicle.damage_severity()
             self.update_damage(self.damage_body, self.last_damage_body)
             self.last_damage_body = self.damage_body
 
             # Damage wheel
-            self.damage_wheel = api.read.wheel.is_detached()
+            self.damage_wheel = frame_api.read.wheel.is_detached()
             self.update_damage(self.damage_wheel, self.last_damage_wheel)
             self.last_damage_wheel = self.damage_wheel
 
@@ -21,11 +21,11 @@ Deltabest Widget
 """
 
 from PySide2.QtCore import Qt, QRectF
-from PySide2.QtGui import QPainter, QPen, QBrush
+from PySide2.QtGui import QPainter, QBrush
 
 from .. import calculation as calc
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, text_cache
 
 WIDGET_NAME = "deltabest"
 
@@ -80,7 +80,6 @@ class Realtime(Overlay):
         else:
             self.resize(self.delta_width, self.delta_height)
 
-        self.pen = QPen()
         self.brush = QBrush(Qt.SolidPattern)
 
         # Last data
@@ -150,10 +149,10 @@ class Realtime(Overlay):
     def draw_readings(self, painter, delta_pos):
         """Draw readings"""
         if self.wcfg["swap_style"]:
-            self.pen.setColor(self.wcfg["bkg_color_deltabest"])
+            font_color = self.wcfg["bkg_color_deltabest"]
             self.brush.setColor(self.color_delta(self.delta_best))
         else:
-            self.pen.setColor(self.color_delta(self.delta_best))
+            font_color = self.color_delta(self.delta_best)
             self.brush.setColor(self.wcfg["bkg_color_deltabest"])
 
         if self.wcfg["show_delta_bar"] and self.wcfg["show_animated_deltabest"]:
@@ -171,12 +170,13 @@ class Realtime(Overlay):
         painter.setBrush(self.brush)
         painter.drawRect(self.rect_delta)
 
-        painter.setFont(self.font)
-        painter.setPen(self.pen)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_delta,
             Qt.AlignCenter,
-            f"{calc.sym_range(self.delta_best, self.wcfg['delta_display_range']):+.3f}"[:7]
+            f"{calc.sym_range(self.delta_best, self.wcfg['delta_display_range']):+.3f}"[:7],
+            self.font,
+            font_color
         )
 
     # Additional methods
@@ -23,8 +23,7 @@ DRS Widget
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen, QBrush
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "drs"
 
@@ -71,8 +70,8 @@ class Realtime(Overlay):
         if self.state.active:
 
             # DRS update
-            self.drs_state = (api.read.switch.drs(),
-                              api.read.switch.drs_status())
+            self.drs_state = (frame_api.read.switch.drs(),
+                              frame_api.read.switch.drs_status())
             self.update_drs(self.drs_state, self.last_drs_state)
             self.last_drs_state = self.drs_state
 
@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "electric_motor"
 
@@ -161,32 +160,32 @@ class Realtime(Overlay):
 
             # Motor temperature
             if self.wcfg["show_motor_temperature"]:
-                temp_motor = round(api.read.emotor.motor_temperature(), 2)
+                temp_motor = round(frame_api.read.emotor.motor_temperature(), 2)
                 self.update_motor(temp_motor, self.last_temp_motor)
                 self.last_temp_motor = temp_motor
 
             # Water temperature
             if self.wcfg["show_water_temperature"]:
-                temp_water = round(api.read.emotor.water_temperature(), 2)
+                temp_water = round(frame_api.read.emotor.water_temperature(), 2)
                 self.update_water(temp_water, self.last_temp_water)
                 self.last_temp_water = temp_water
 
             # Motor rpm
             if self.wcfg["show_rpm"]:
-                rpm = int(api.read.emotor.rpm())
+                rpm = int(frame_api.read.emotor.rpm())
                 self.update_rpm(rpm, self.last_rpm)
                 self.last_rpm = rpm
 
             # Motor torque
             if self.wcfg["show_torque"]:
-                torque = round(api.read.emotor.torque(), 2)
+                torque = round(frame_api.read.emotor.torque(), 2)
                 self.update_torque(torque, self.last_torque)
                 self.last_torque = torque
 
             # Motor power
             if self.wcfg["show_power"]:
                 power = round(calc.engine_power(
-                    api.read.emotor.torque(), api.read.emotor.rpm()), 2)
+                    frame_api.read.emotor.torque(), frame_api.read.emotor.rpm()), 2)
                 self.update_power(power, self.last_power)
                 self.last_power = power
 
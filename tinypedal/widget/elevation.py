@@ -24,9 +24,8 @@ from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "elevation"
 
@@ -101,9 +100,9 @@ class Realtime(Overlay):
 
             # Vehicle position
             self.veh_pos = (
-                api.read.lap.distance(),
-                api.read.vehicle.position_vertical(),
-                self.display_width * api.read.lap.progress()
+                frame_api.read.lap.distance(),
+                frame_api.read.vehicle.position_vertical(),
+                self.display_width * frame_api.read.lap.progress()
             )
             self.update_vehicle(self.veh_pos, self.last_veh_pos)
             self.last_veh_pos = self.veh_pos
@@ -163,21 +162,26 @@ class Realtime(Overlay):
             # Set boundary start node
             map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
 
+            # Select simplified elevation nodes for display size
+            if self.display_detail_level:
+                lod_index = calc.select_lod_index(
+                    minfo.mapping.elevationsLOD,
+                    max(self.display_width,
+                        self.display_height - self.display_margin_top - self.display_margin_bottom
+                        ) / self.display_detail_level)
+            else:
+                lod_index = None
+            if lod_index:
+                map_nodes = map(self.map_scaled.__getitem__, lod_index)
+            else:
+                map_nodes = self.map_scaled
+
             # Set middle nodes
-            total_nodes = len(self.map_scaled)
-            skip_node = total_nodes // self.display_width * self.display_detail_level
-            skipped_last_node = (total_nodes - 1) % skip_node if skip_node else 0
             last_dist = 0
-            last_skip = 0
-            for coords in self.map_scaled:
-                if coords[0] > last_dist and last_skip >= skip_node:
+            for coords in map_nodes:
+                if coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                 last_dist = coords[0]
-                last_skip += 1
-
-            if skipped_last_node:  # set last node if skipped
-                map_path.lineTo(*self.map_scaled[-1])
 
             # Set boundary end node
             map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
@@ -329,7 +333,7 @@ class Realtime(Overlay):
             painter.drawText(
                 self.rect_text_elevation,
                 self.elevation_text_alignment,
-                self.format_elevation(api.read.vehicle.position_vertical())
+                self.format_elevation(frame_api.read.vehicle.position_vertical())
             )
         if self.wcfg["show_elevation_scale"]:
             painter.drawText(
@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "engine"
 
@@ -195,44 +194,44 @@ class Realtime(Overlay):
 
             # Oil temperature
             if self.wcfg["show_oil_temperature"]:
-                temp_oil = round(api.read.engine.oil_temperature(), 2)
+                temp_oil = round(frame_api.read.engine.oil_temperature(), 2)
                 self.update_oil(temp_oil, self.last_temp_oil)
                 self.last_temp_oil = temp_oil
 
             # Water temperature
             if self.wcfg["show_water_temperature"]:
-                temp_water = round(api.read.engine.water_temperature(), 2)
+                temp_water = round(frame_api.read.engine.water_temperature(), 2)
                 self.update_water(temp_water, self.last_temp_water)
                 self.last_temp_water = temp_water
 
             # Turbo pressure
             if self.wcfg["show_turbo_pressure"]:
-                turbo = int(api.read.engine.turbo())
+                turbo = int(frame_api.read.engine.turbo())
                 self.update_turbo(turbo, self.last_turbo)
                 self.last_turbo = turbo
 
             # Engine RPM
             if self.wcfg["show_rpm"]:
-                rpm = int(api.read.engine.rpm())
+                rpm = int(frame_api.read.engine.rpm())
                 self.update_rpm(rpm, self.last_rpm)
                 self.last_rpm = rpm
 
             # Engine RPM maximum
             if self.wcfg["show_rpm_maximum"]:
-                rpm_max = int(api.read.engine.rpm_max())
+                rpm_max = int(frame_api.read.engine.rpm_max())
                 self.update_rpm_max(rpm_max, self.last_rpm_max)
                 self.last_rpm_max = rpm_max
 
             # Engine torque
             if self.wcfg["show_torque"]:
-                torque = round(api.read.engine.torque(), 2)
+                torque = round(frame_api.read.engine.torque(), 2)
                 self.update_torque(torque, self.last_torque)
                 self.last_torque = torque
 
             # Engine power
             if self.wcfg["show_power"]:
                 power = round(calc.engine_power(
-                    api.read.engine.torque(), api.read.engine.rpm()), 2)
+                    frame_api.read.engine.torque(), frame_api.read.engine.rpm()), 2)
                 self.update_power(power, self.last_power)
                 self.last_power = power
 
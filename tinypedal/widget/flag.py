@@ -24,9 +24,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "flag"
 
@@ -250,9 +249,9 @@ class Realtime(Overlay):
                 self.checked = True
 
             # Read state data
-            lap_etime = api.read.timing.elapsed()
-            in_pits = api.read.vehicle.in_pits()
-            in_race = api.read.session.in_race()
+            lap_etime = frame_api.read.timing.elapsed()
+            in_pits = frame_api.read.vehicle.in_pits()
+            in_race = frame_api.read.session.in_race()
 
             # Pit timer
             if self.wcfg["show_pit_timer"]:
@@ -268,7 +267,7 @@ class Realtime(Overlay):
 
             # Pit limiter
             if self.wcfg["show_speed_limiter"]:
-                limiter_state = api.read.switch.speed_limiter()
+                limiter_state = frame_api.read.switch.speed_limiter()
                 self.update_limiter(limiter_state, self.last_limiter_state)
                 self.last_limiter_state = limiter_state
 
@@ -304,7 +303,7 @@ class Realtime(Overlay):
 
             # Finish state
             if self.wcfg["show_finish_state"]:
-                finish_state = api.read.vehicle.finish_state()
+                finish_state = frame_api.read.vehicle.finish_state()
                 self.update_finish_state(finish_state, self.last_finish_state)
                 self.last_finish_state = finish_state
 
@@ -324,7 +323,7 @@ class Realtime(Overlay):
                 if curr[1]:  # finished pits
                     color = self.bar_style_pit_timer[1]
                     state = "F " + f"{min(curr[0], 999.99):.2f}"[:5].rjust(5)
-                elif api.read.session.pit_open():
+                elif frame_api.read.session.pit_open():
                     color = self.bar_style_pit_timer[0]
                     state = "P " + f"{min(curr[0], 999.99):.2f}"[:5].rjust(5)
                 else:  # pit closed
@@ -465,27 +464,28 @@ class Realtime(Overlay):
             self.pitout_timer_start = 0
 
         if self.wcfg["traffic_low_speed_threshold"]:
-            is_low_speed = api.read.vehicle.speed() < self.wcfg["traffic_low_speed_threshold"]
+            is_low_speed = frame_api.read.vehicle.speed() < self.wcfg["traffic_low_speed_threshold"]
         else:
             is_low_speed = False
 
+        nearest_traffic = minfo.vehicles.nearestTraffic
         any_traffic = bool(
-            0 < minfo.vehicles.nearestTraffic < self.wcfg["traffic_maximum_time_gap"]
+            0 < nearest_traffic < self.wcfg["traffic_maximum_time_gap"]
             and (is_low_speed or in_pits or self.pitout_timer_start))
 
         if any_traffic:
-            return round(minfo.vehicles.nearestTraffic, 1), any_traffic
+            return round(nearest_traffic, 1), any_traffic
         return 99999, any_traffic
 
     def pit_in_countdown(self):
         """Pit in countdown(laps)"""
-        pit_state = api.read.vehicle.pit_state()
+        pit_state = frame_api.read.vehicle.pit_state()
         if pit_state:
             if minfo.restapi.maxVirtualEnergy:
                 est_laps = min(minfo.fuel.estimatedLaps, minfo.energy.estimatedLaps)
             else:
                 est_laps = minfo.fuel.estimatedLaps
-            cd_laps = calc.pit_in_countdown_laps(est_laps, api.read.lap.progress())
+            cd_laps = calc.pit_in_countdown_laps(est_laps, frame_api.read.lap.progress())
             return pit_state, round(cd_laps, 2), round(est_laps, 2)
         return pit_state, 99999, 99999
 
@@ -510,9 +510,9 @@ class Realtime(Overlay):
 
     def green_flag_state(self, lap_etime):
         """Green flag state"""
-        if api.read.session.in_countdown():
-            self.last_lap_stime = api.read.timing.start()
-            start_lights = api.read.session.start_lights()
+        if frame_api.read.session.in_countdown():
+            self.last_lap_stime = frame_api.read.timing.start()
+            start_lights = frame_api.read.session.start_lights()
         else:
             start_lights = 0
 
@@ -529,18 +529,19 @@ class Realtime(Overlay):
         """Yellow flag state"""
         hide_yellow = self.wcfg["show_yellow_flag_for_race_only"] and not in_race
         if not hide_yellow:
+            nearest_yellow = minfo.vehicles.nearestYellow
             any_yellow = (
-                api.read.session.yellow_flag() and
-                minfo.vehicles.nearestYellow < self.wcfg["yellow_flag_maximum_range"])
+                frame_api.read.session.yellow_flag() and
+                nearest_yellow < self.wcfg["yellow_flag_maximum_range"])
             if any_yellow:
-                return round(minfo.vehicles.nearestYellow), any_yellow
+                return round(nearest_yellow), any_yellow
         return 99999, False
 
     def blue_flag_state(self, in_race, lap_etime):
         """Blue flag state"""
         hide_blue = self.wcfg["show_blue_flag_for_race_only"] and not in_race
         if not hide_blue:
-            any_blue = api.read.session.blue_flag()
+            any_blue = frame_api.read.session.blue_flag()
             if any_blue:
                 if self.last_blue_state[1] != any_blue:
                     self.blue_flag_timer_start = lap_etime
@@ -20,14 +20,13 @@
 Friction circle Widget
 """
 
-from collections import deque
-
 from PySide2.QtCore import Qt, QPointF, QRectF
 from PySide2.QtGui import QPainter, QPixmap, QRadialGradient, QPen, QBrush, QColor
 
 from .. import calculation as calc
 from ..module_info import minfo
 from ._base import Overlay
+from ._plot import PlotBuffer
 
 WIDGET_NAME = "friction_circle"
 
@@ -113,7 +112,7 @@ class Realtime(Overlay):
 
         self.gforce_raw = 0,0
         self.last_gforce_raw = None
-        self.data_gforce = deque([], max(self.wcfg["trace_max_samples"], 5))
+        self.data_gforce = PlotBuffer(max(self.wcfg["trace_max_samples"], 5))
         self.last_x = self.scale_position(0)
         self.last_y = self.scale_position(0)
 
@@ -145,7 +144,7 @@ class Realtime(Overlay):
             self.last_x = self.scale_position(self.gforce_raw[1])
             self.last_y = self.scale_position(self.gforce_raw[0])
             if self.wcfg["show_trace"]:
-                self.data_gforce.append(QPointF(self.last_x, self.last_y))
+                self.data_gforce.append_point(QPointF(self.last_x, self.last_y))
                 self.draw_trace()
             self.update()
 
@@ -292,10 +291,7 @@ class Realtime(Overlay):
         self.pen.setStyle(Qt.SolidLine)
         painter.setPen(self.pen)
         painter.setBrush(Qt.NoBrush)
-        if self.wcfg["trace_style"]:
-            painter.drawPoints(self.data_gforce)
-        else:
-            painter.drawPolyline(self.data_gforce)
+        self.data_gforce.draw(painter, self.wcfg["trace_style"])
 
     def draw_dot(self):
         """Draw dot"""
@@ -288,6 +288,9 @@ class Realtime(Overlay):
         self.last_est_pits_end = None
         self.last_level_state = None
 
+        # Skip update while fuel data unchanged
+        self.set_update_sources(minfo.fuel)
+
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
@@ -26,9 +26,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "fuel_energy_saver"
 MAGIC_NUM = 99999
@@ -176,9 +175,9 @@ class Realtime(Overlay):
 
     def update_predication(self):
         """Update predication"""
-        in_pits = api.read.vehicle.in_pits()
-        tyre_life = sum(api.read.tyre.wear())
-        lap_num = api.read.lap.number()
+        in_pits = frame_api.read.vehicle.in_pits()
+        tyre_life = sum(frame_api.read.tyre.wear())
+        lap_num = frame_api.read.lap.number()
         energy_type = minfo.restapi.maxVirtualEnergy
 
         if energy_type:
@@ -198,7 +197,7 @@ class Realtime(Overlay):
             self.last_tyre_life = tyre_life
         # Reset stint if changed tyre or refueled or back in garage
         elif (self.last_tyre_life < tyre_life or
-            self.last_fuel_curr < fuel_curr or api.read.vehicle.in_garage()):
+            self.last_fuel_curr < fuel_curr or frame_api.read.vehicle.in_garage()):
             self.reset_stint = True
 
         if self.reset_stint:
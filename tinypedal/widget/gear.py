@@ -26,9 +26,8 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import formatter as fmt
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api, text_cache
 
 WIDGET_NAME = "gear"
 
@@ -179,13 +178,13 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read gauge data
-            limiter = api.read.switch.speed_limiter()
-            rpm = api.read.engine.rpm()
-            rpm_max = api.read.engine.rpm_max()
-            speed = api.read.vehicle.speed()
-            gear = api.read.engine.gear()
-            gear_max = api.read.engine.gear_max()
-            lap_etime = api.read.timing.elapsed()
+            limiter = frame_api.read.switch.speed_limiter()
+            rpm = frame_api.read.engine.rpm()
+            rpm_max = frame_api.read.engine.rpm_max()
+            speed = frame_api.read.vehicle.speed()
+            gear = frame_api.read.engine.gear()
+            gear_max = frame_api.read.engine.gear_max()
+            lap_etime = frame_api.read.timing.elapsed()
 
             if self.last_rpm_max != rpm_max:
                 self.last_rpm_max = rpm_max
@@ -261,22 +260,23 @@ class Realtime(Overlay):
         painter = QPainter(pixmap)
 
         # Update gauge text
-        self.pen.setColor(gauge_data[2])  # fg color
-        painter.setPen(self.pen)
-
-        painter.setFont(self.font_gear)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_gear,
             Qt.AlignCenter,
-            f"{gauge_data[0]}"
+            f"{gauge_data[0]}",
+            self.font_gear,
+            gauge_data[2]  # fg color
         )
 
         if self.wcfg["show_speed"]:
-            painter.setFont(self.font_speed)
-            painter.drawText(
+            text_cache.draw_text(
+                painter,
                 self.rect_text_speed,
                 Qt.AlignCenter,
-                f"{gauge_data[1]:03.0f}"
+                f"{gauge_data[1]:03.0f}",
+                self.font_speed,
+                gauge_data[2]
             )
 
         canvas.setPixmap(pixmap)
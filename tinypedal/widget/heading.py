@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt, QPointF, QRectF
 from PySide2.QtGui import QPainter, QPixmap, QPen, QBrush
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api, text_cache
 
 WIDGET_NAME = "heading"
 
@@ -115,12 +114,12 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read speed, position data
-            speed = api.read.vehicle.speed()
-            pos_curr = (api.read.vehicle.position_longitudinal(),
-                        api.read.vehicle.position_lateral())
+            speed = frame_api.read.vehicle.speed()
+            pos_curr = (frame_api.read.vehicle.position_longitudinal(),
+                        frame_api.read.vehicle.position_lateral())
 
             # Vehicle orientation yaw
-            self.veh_ori_yaw = calc.rad2deg(api.read.vehicle.orientation_yaw_radians()) + 180
+            self.veh_ori_yaw = calc.rad2deg(frame_api.read.vehicle.orientation_yaw_radians()) + 180
 
             # Direction of travel yaw angle
             if self.last_pos != pos_curr and speed > 1:
@@ -134,7 +133,7 @@ class Realtime(Overlay):
             # Slip angle
             if speed > 1:
                 self.slip_angle = calc.rad2deg(
-                    (api.read.wheel.slip_angle_fl() + api.read.wheel.slip_angle_fr()) * 0.5)
+                    (frame_api.read.wheel.slip_angle_fl() + frame_api.read.wheel.slip_angle_fr()) * 0.5)
             else:
                 self.slip_angle = 0
 
@@ -289,24 +288,24 @@ class Realtime(Overlay):
 
     def draw_yaw_readings(self, painter):
         """Draw yaw readings"""
-        painter.setFont(self.font)
-        self.pen.setColor(self.wcfg["font_color_yaw_angle"])
-        painter.setPen(self.pen)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_yaw_angle,
             Qt.AlignCenter,
-            self.format_angle(self.display_yaw_angle(self.yaw_angle))
+            self.format_angle(self.display_yaw_angle(self.yaw_angle)),
+            self.font,
+            self.wcfg["font_color_yaw_angle"]
         )
 
     def draw_slip_angle_readings(self, painter):
         """Draw slip angle readings"""
-        painter.setFont(self.font)
-        self.pen.setColor(self.wcfg["font_color_slip_angle"])
-        painter.setPen(self.pen)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_slip_angle,
             Qt.AlignCenter,
-            self.format_angle(self.slip_angle)
+            self.format_angle(self.slip_angle),
+            self.font,
+            self.wcfg["font_color_slip_angle"]
         )
 
     # Additional methods
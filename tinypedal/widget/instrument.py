@@ -24,9 +24,8 @@ from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPixmap, QPainter, QPen
 from PySide2.QtWidgets import QLabel, QGridLayout
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "instrument"
 
@@ -140,12 +139,12 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read instrument data
-            headlights = api.read.switch.headlights()
-            ignition = (api.read.switch.ignition_starter(),
-                        api.read.engine.rpm())
-            clutch = (api.read.switch.auto_clutch(),
-                      api.read.input.clutch())
-            is_braking = api.read.input.brake() > 0
+            headlights = frame_api.read.switch.headlights()
+            ignition = (frame_api.read.switch.ignition_starter(),
+                        frame_api.read.engine.rpm())
+            clutch = (frame_api.read.switch.auto_clutch(),
+                      frame_api.read.input.clutch())
+            is_braking = frame_api.read.input.brake() > 0
 
             self.flicker = not self.flicker
 
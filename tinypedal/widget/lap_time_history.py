@@ -26,9 +26,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "lap_time_history"
 
@@ -184,9 +183,9 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read laps data
-            lap_stime = api.read.timing.start()
-            lap_etime = api.read.timing.elapsed()
-            wear_avg = 100 - (sum(api.read.tyre.wear()) * 25)
+            lap_stime = frame_api.read.timing.start()
+            lap_etime = frame_api.read.timing.elapsed()
+            wear_avg = 100 - (sum(frame_api.read.tyre.wear()) * 25)
 
             # Check if virtual energy available
             if self.wcfg["show_virtual_energy_if_available"] and minfo.restapi.maxVirtualEnergy:
@@ -204,13 +203,13 @@ class Realtime(Overlay):
                     self.laps_data[2] = minfo.delta.isValidLap
                     self.laps_data[3] = temp_fuel_last
                     # Update lap time history while on track
-                    if not api.read.vehicle.in_garage():
+                    if not frame_api.read.vehicle.in_garage():
                         self.history_data.appendleft(self.laps_data.copy())
                         for index in range(self.laps_count):
                             self.update_laps_history(self.history_data[index], index + 1)
 
             # Current laps data
-            self.laps_data[0] = api.read.lap.number()
+            self.laps_data[0] = frame_api.read.lap.number()
             self.laps_data[1] = minfo.delta.lapTimeEstimated
             self.laps_data[3] = temp_fuel_est
             self.laps_data[4] = max(wear_avg - self.last_wear, 0)
@@ -20,15 +20,28 @@
 Navigation Widget
 """
 
+from time import perf_counter
+
 from PySide2.QtCore import Qt, QRectF, QPointF
 from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QRadialGradient, QPen, QBrush, QPolygonF
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api, text_cache
+from ._motion import MotionInterpolator
 
 WIDGET_NAME = "navigation"
+VEHICLE_COLUMNS = (
+    "isPlayer",
+    "inGarage",
+    "inPit",
+    "position",
+    "isYellow",
+    "isLapped",
+    "relativeOrientationXZRadians",
+    "relativeRotatedPosXZ",
+    "relativeStraightDistance",
+)
 POLYGON_NONE = QPolygonF((QPointF(-99999,-99999),QPointF(-99999,-99999)))
 
 
@@ -102,6 +115,13 @@ class Realtime(Overlay):
         # Last data
         self.vehicles_data = None
         self.last_veh_data_version = None
+        self.last_veh_pos_version = None
+
+        # Vehicle motion interpolation
+        if self.wcfg["enable_vehicle_motion_interpolation"]:
+            self.motion = MotionInterpolator()
+        else:
+            self.motion = None
 
         self.last_coords_hash = -1
         self.map_scaled = None
@@ -118,20 +138,36 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Vehicles
-            veh_data_version = minfo.vehicles.dataSetVersion
-            self.update_vehicle(veh_data_version, self.last_veh_data_version)
+            veh_info = minfo.vehicles
+            veh_data_version = veh_info.version(VEHICLE_COLUMNS)
+            self.update_vehicle(veh_data_version, self.last_veh_data_version, veh_info)
             self.last_veh_data_version = veh_data_version
 
+            # Vehicle motion
+            if self.motion:
+                veh_pos_version = veh_info.columnVersion["relativeRotatedPosXZ"]
+                self.update_motion(veh_pos_version, self.last_veh_pos_version, veh_info)
+                self.last_veh_pos_version = veh_pos_version
+
             # Map
             coords_hash = minfo.mapping.coordinatesHash
             self.update_map(coords_hash, self.last_coords_hash)
             self.last_coords_hash = coords_hash
 
     # GUI update methods
-    def update_vehicle(self, curr, last):
+    def update_vehicle(self, curr, last, veh_info):
         """Vehicle sort & update"""
         if curr != last:
-            self.vehicles_data = sorted(minfo.vehicles.dataSet, reverse=True)
+            self.vehicles_data = bool(veh_info.total)
+            self.update()
+
+    def update_motion(self, curr, last, veh_info):
+        """Vehicle motion sample & update, redraw interpolated position on every update"""
+        if curr != last:
+            self.motion.update(
+                veh_info.slotID, veh_info.relativeRotatedPosXZ,
+                veh_info.relativeOrientationXZRadians, veh_info.total)
+        if self.vehicles_data:
             self.update()
 
     def update_map(self, curr, last):
@@ -198,11 +234,16 @@ class Realtime(Overlay):
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             (self.map_scaled, self.map_size, self.map_offset
              ) = calc.zoom_map(raw_coords, self.global_scale, self.map_margin)
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                else:
-                    map_path.lineTo(*coords)
+            # Select simplified map nodes for zoomed map size
+            lod_index = calc.select_lod_index(
+                minfo.mapping.coordinatesLOD, max(self.map_size))
+            if lod_index:
+                map_nodes = map(self.map_scaled.__getitem__, lod_index)
+            else:
+                map_nodes = iter(self.map_scaled)
+            map_path.moveTo(*next(map_nodes))
+            for coords in map_nodes:
+                map_path.lineTo(*coords)
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
                 map_path.closeSubpath()
@@ -239,12 +280,12 @@ class Realtime(Overlay):
         """Draw map image"""
         # Transform map coordinates
         # Player vehicle orientation yaw radians + 180 deg rotation correction
-        plr_ori_rad = api.read.vehicle.orientation_yaw_radians() + 3.14159265
+        plr_ori_rad = frame_api.read.vehicle.orientation_yaw_radians() + 3.14159265
         # x, y position & offset relative to player
         rot_pos_x, rot_pos_y = calc.rotate_pos(
             plr_ori_rad,   # plr_ori_rad, rotate view
-            api.read.vehicle.position_longitudinal() * self.global_scale - self.map_offset[0],
-            api.read.vehicle.position_lateral() * self.global_scale - self.map_offset[1]
+            frame_api.read.vehicle.position_longitudinal() * self.global_scale - self.map_offset[0],
+            frame_api.read.vehicle.position_lateral() * self.global_scale - self.map_offset[1]
         )
         plr_ori_deg = calc.rad2deg(plr_ori_rad)
         center_offset_x = self.area_center - rot_pos_x
@@ -288,41 +329,48 @@ class Realtime(Overlay):
     def draw_vehicle(self, painter):
         """Draw vehicles"""
         painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
-        if self.wcfg["show_vehicle_standings"]:
-            painter.setFont(self.font)
-            self.pen.setColor(self.wcfg["font_color"])
-            painter.setPen(self.pen)
 
         # Draw vehicle within view range
-        for veh_info in self.vehicles_data:
+        veh_info = minfo.vehicles
+        motion = self.motion
+        now = perf_counter()
+        for index in veh_info.drawOrder:
             # Draw player vehicle
-            if veh_info.isPlayer:
+            if veh_info.isPlayer[index]:
                 painter.translate(self.area_center, self.veh_offset_y)
                 painter.drawPixmap(-self.veh_size, -self.veh_size, self.pixmap_veh_player)
-                if self.wcfg["show_vehicle_standings"]:
-                    self.draw_text_standings(painter, veh_info.position)
                 painter.resetTransform()
+                if self.wcfg["show_vehicle_standings"]:
+                    self.draw_text_standings(
+                        painter, self.area_center, self.veh_offset_y, veh_info.position[index])
 
             # Draw opponent vehicle in view range
-            elif veh_info.relativeStraightDistance < self.view_range:
+            elif veh_info.relativeStraightDistance[index] < self.view_range:
                 # Rotated position relative to player
-                pos_x = self.scale_veh_pos(veh_info.relativeRotatedPosXZ[0], self.area_center)
-                pos_y = self.scale_veh_pos(veh_info.relativeRotatedPosXZ[1], self.veh_offset_y)
+                raw_pos_x, raw_pos_y = veh_info.relativeRotatedPosXZ[index]
+                ori_rad = veh_info.relativeOrientationXZRadians[index]
+                if motion:
+                    raw_pos_x, raw_pos_y, ori_rad = motion.position(
+                        veh_info.slotID[index], now, raw_pos_x, raw_pos_y, ori_rad)
+                pos_x = self.scale_veh_pos(raw_pos_x, self.area_center)
+                pos_y = self.scale_veh_pos(raw_pos_y, self.veh_offset_y)
 
                 painter.translate(pos_x, pos_y)
                 if not self.wcfg["show_circle_vehicle_shape"]:
-                    painter.rotate(calc.rad2deg(-veh_info.relativeOrientationXZRadians))
-                painter.drawPixmap(-self.veh_size, -self.veh_size, self.color_veh_pixmap(veh_info))
-
-                if self.wcfg["show_vehicle_standings"]:
-                    painter.resetTransform()
-                    painter.translate(pos_x, pos_y)
-                    self.draw_text_standings(painter, veh_info.position)
+                    painter.rotate(calc.rad2deg(-ori_rad))
+                painter.drawPixmap(
+                    -self.veh_size, -self.veh_size, self.color_veh_pixmap(veh_info, index))
                 painter.resetTransform()
-
-    def draw_text_standings(self, painter, veh_pos):
-        """Draw vehicles standings text"""
-        painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{veh_pos}")
+                if self.wcfg["show_vehicle_standings"]:
+                    self.draw_text_standings(painter, pos_x, pos_y, veh_info.position[index])
+
+    def draw_text_standings(self, painter, pos_x, pos_y, veh_pos):
+        """Draw vehicles standings text, align to pixel grid for cached text pixmap"""
+        painter.translate(round(pos_x), round(pos_y))
+        text_cache.draw_text(
+            painter, self.veh_text_shape, Qt.AlignCenter, f"{veh_pos}",
+            self.font, self.wcfg["font_color"])
+        painter.resetTransform()
 
     def draw_map_mask_pixmap(self):
         """Map mask pixmap"""
@@ -372,17 +420,17 @@ class Realtime(Overlay):
         """Scale vehicle position coordinate to global scale"""
         return position * self.global_scale + offset
 
-    def color_veh_pixmap(self, veh_info):
+    def color_veh_pixmap(self, veh_info, index):
         """Compare lap differences & set color"""
-        if veh_info.position == 1:
+        if veh_info.position[index] == 1:
             return self.pixmap_veh_leader
-        if veh_info.inPit:
+        if veh_info.inPit[index]:
             return self.pixmap_veh_in_pit
-        if veh_info.isYellow and not veh_info.inPit + veh_info.inGarage:
+        if veh_info.isYellow[index] and not veh_info.inPit[index] + veh_info.inGarage[index]:
             return self.pixmap_veh_yellow
-        if veh_info.isLapped > 0:
+        if veh_info.isLapped[index] > 0:
             return self.pixmap_veh_laps_ahead
-        if veh_info.isLapped < 0:
+        if veh_info.isLapped[index] < 0:
             return self.pixmap_veh_laps_behind
         return self.pixmap_veh_same_lap
 
@@ -23,9 +23,8 @@ P2P Widget
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "p2p"
 
@@ -101,9 +100,9 @@ class Realtime(Overlay):
             # Battery charge
             if self.wcfg["show_battery_charge"]:
                 alt_active_state = (
-                    api.read.engine.gear() >= self.wcfg["activation_threshold_gear"] and
-                    api.read.vehicle.speed() * 3.6 > self.wcfg["activation_threshold_speed"] and
-                    api.read.input.throttle_raw() >= self.wcfg["activation_threshold_throttle"] and
+                    frame_api.read.engine.gear() >= self.wcfg["activation_threshold_gear"] and
+                    frame_api.read.vehicle.speed() * 3.6 > self.wcfg["activation_threshold_speed"] and
+                    frame_api.read.input.throttle_raw() >= self.wcfg["activation_threshold_throttle"] and
                     minfo.hybrid.motorState
                 )
                 battery_charge = (
@@ -21,11 +21,10 @@ Pedal Widget
 """
 
 from PySide2.QtCore import Qt, QRectF, QSize
-from PySide2.QtGui import QPixmap, QPainter, QPen
+from PySide2.QtGui import QPixmap, QPainter
 from PySide2.QtWidgets import QLabel, QGridLayout
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api, text_cache
 
 WIDGET_NAME = "pedal"
 
@@ -92,8 +91,6 @@ class Realtime(Overlay):
         self.rect_max = QRectF(*max_size)
         self.rect_readings = QRectF(*reading_size)
 
-        self.pen = QPen()
-
         # Create layout
         layout = QGridLayout()
         layout.setContentsMargins(0,0,0,0)  # remove border
@@ -182,9 +179,9 @@ class Realtime(Overlay):
 
             # Throttle
             if self.wcfg["show_throttle"]:
-                raw_throttle = api.read.input.throttle_raw()
+                raw_throttle = frame_api.read.input.throttle_raw()
                 if self.wcfg["show_throttle_filtered"]:
-                    throttle = raw_throttle, api.read.input.throttle()
+                    throttle = raw_throttle, frame_api.read.input.throttle()
                 else:
                     throttle = raw_throttle, raw_throttle
                 self.update_throttle(throttle, self.last_throttle)
@@ -192,12 +189,12 @@ class Realtime(Overlay):
 
             # Brake
             if self.wcfg["show_brake"]:
-                raw_brake = api.read.input.brake_raw()
+                raw_brake = frame_api.read.input.brake_raw()
                 if self.wcfg["show_brake_filtered"]:
                     if self.wcfg["show_brake_pressure"]:
-                        f_brake = self.filtered_brake_pressure(api.read.brake.pressure())
+                        f_brake = self.filtered_brake_pressure(frame_api.read.brake.pressure())
                     else:
-                        f_brake = api.read.input.brake()
+                        f_brake = frame_api.read.input.brake()
                     brake = raw_brake, f_brake
                 else:
                     brake = raw_brake, raw_brake
@@ -206,9 +203,9 @@ class Realtime(Overlay):
 
             # Clutch
             if self.wcfg["show_clutch"]:
-                raw_clutch = api.read.input.clutch_raw()
+                raw_clutch = frame_api.read.input.clutch_raw()
                 if self.wcfg["show_clutch_filtered"]:
-                    clutch = raw_clutch, api.read.input.clutch()
+                    clutch = raw_clutch, frame_api.read.input.clutch()
                 else:
                     clutch = raw_clutch, raw_clutch
                 self.update_clutch(clutch, self.last_clutch)
@@ -216,7 +213,7 @@ class Realtime(Overlay):
 
             # Force feedback
             if self.wcfg["show_ffb_meter"]:
-                ffb = api.read.input.force_feedback()
+                ffb = frame_api.read.input.force_feedback()
                 self.update_ffb(ffb, self.last_ffb)
                 self.last_ffb = ffb
 
@@ -317,13 +314,13 @@ class Realtime(Overlay):
 
     def draw_readings(self, painter, value, fgcolor):
         """Draw readings"""
-        self.pen.setColor(fgcolor)
-        painter.setFont(self.font)
-        painter.setPen(self.pen)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_readings,
             Qt.AlignCenter,
-            f"{value * 100:.0f}"
+            f"{value * 100:.0f}",
+            self.font,
+            fgcolor
         )
 
     # Additional methods
@@ -0,0 +1,209 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2024 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Pit strategy Widget
+"""
+
+from PySide2.QtCore import Qt
+from PySide2.QtWidgets import QGridLayout
+
+from .. import calculation as calc
+from ..module_info import minfo
+from ._base import Overlay
+
+WIDGET_NAME = "pit_strategy"
+
+
+class Realtime(Overlay):
+    """Draw widget"""
+
+    def __init__(self, config):
+        # Assign base setting
+        Overlay.__init__(self, config, WIDGET_NAME)
+
+        # Config font
+        font_m = self.get_font_metrics(
+            self.config_font(self.wcfg["font_name"], self.wcfg["font_size"]))
+
+        # Config variable
+        bar_padx = round(self.wcfg["font_size"] * self.wcfg["bar_padding"]) * 2
+        bar_gap = self.wcfg["bar_gap"]
+        self.bar_width = max(self.wcfg["bar_width"], 3)
+        style_width = font_m.width * (self.bar_width + 4) + bar_padx
+
+        # Base style
+        self.setStyleSheet(
+            f"font-family: {self.wcfg['font_name']};"
+            f"font-size: {self.wcfg['font_size']}px;"
+            f"font-weight: {self.wcfg['font_weight']};"
+        )
+
+        # Create layout
+        layout = QGridLayout()
+        layout.setContentsMargins(0,0,0,0)  # remove border
+        layout.setSpacing(bar_gap)
+        layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setLayout(layout)
+
+        # Pit stop counts
+        if self.wcfg["show_pit_stops"]:
+            bar_style_pit_stops = self.set_qss(
+                fg_color=self.wcfg["font_color_pit_stops"],
+                bg_color=self.wcfg["bkg_color_pit_stops"]
+            )
+            self.bar_pit_stops = self.set_qlabel(
+                text=self.format_pit_stops(0),
+                style=bar_style_pit_stops,
+                width=style_width,
+            )
+            self.set_primary_orient(
+                target=self.bar_pit_stops,
+                column=self.wcfg["column_index_pit_stops"],
+            )
+
+        # Next pit stop lap
+        if self.wcfg["show_next_pit_lap"]:
+            bar_style_next_pit_lap = self.set_qss(
+                fg_color=self.wcfg["font_color_next_pit_lap"],
+                bg_color=self.wcfg["bkg_color_next_pit_lap"]
+            )
+            self.bar_next_pit_lap = self.set_qlabel(
+                text=self.format_next_pit_lap(()),
+                style=bar_style_next_pit_lap,
+                width=style_width,
+            )
+            self.set_primary_orient(
+                target=self.bar_next_pit_lap,
+                column=self.wcfg["column_index_next_pit_lap"],
+            )
+
+        # Refuel amount per pit stop
+        if self.wcfg["show_refuel"]:
+            bar_style_refuel = self.set_qss(
+                fg_color=self.wcfg["font_color_refuel"],
+                bg_color=self.wcfg["bkg_color_refuel"]
+            )
+            self.bar_refuel = self.set_qlabel(
+                text=self.format_refuel(0),
+                style=bar_style_refuel,
+                width=style_width,
+            )
+            self.set_primary_orient(
+                target=self.bar_refuel,
+                column=self.wcfg["column_index_refuel"],
+            )
+
+        # Fuel saving target
+        if self.wcfg["show_fuel_saving"]:
+            bar_style_fuel_saving = self.set_qss(
+                fg_color=self.wcfg["font_color_fuel_saving"],
+                bg_color=self.wcfg["bkg_color_fuel_saving"]
+            )
+            self.bar_fuel_saving = self.set_qlabel(
+                text=self.format_fuel_saving(0),
+                style=bar_style_fuel_saving,
+                width=style_width,
+            )
+            self.set_primary_orient(
+                target=self.bar_fuel_saving,
+                column=self.wcfg["column_index_fuel_saving"],
+            )
+
+        # Finish probability
+        if self.wcfg["show_finish_probability"]:
+            bar_style_finish_probability = self.set_qss(
+                fg_color=self.wcfg["font_color_finish_probability"],
+                bg_color=self.wcfg["bkg_color_finish_probability"]
+            )
+            self.bar_finish_probability = self.set_qlabel(
+                text=self.format_finish_probability(0),
+                style=bar_style_finish_probability,
+                width=style_width,
+            )
+            self.set_primary_orient(
+                target=self.bar_finish_probability,
+                column=self.wcfg["column_index_finish_probability"],
+            )
+
+        # Last data
+        self.last_update_version = None
+
+        # Skip update while strategy unchanged
+        self.set_update_sources(lambda: minfo.strategy.updateVersion)
+
+    def timerEvent(self, event):
+        """Update when vehicle on track"""
+        if self.state.active:
+
+            # Strategy
+            update_version = minfo.strategy.updateVersion
+            self.update_strategy(update_version, self.last_update_version)
+            self.last_update_version = update_version
+
+    # GUI update methods
+    def update_strategy(self, curr, last):
+        """Strategy"""
+        if curr != last:
+            strategy = minfo.strategy
+            if self.wcfg["show_pit_stops"]:
+                self.bar_pit_stops.setText(
+                    self.format_pit_stops(strategy.numPitStops))
+            if self.wcfg["show_next_pit_lap"]:
+                self.bar_next_pit_lap.setText(
+                    self.format_next_pit_lap(strategy.pitStopLaps))
+            if self.wcfg["show_refuel"]:
+                self.bar_refuel.setText(
+                    self.format_refuel(strategy.refuelAmount))
+            if self.wcfg["show_fuel_saving"]:
+                self.bar_fuel_saving.setText(
+                    self.format_fuel_saving(strategy.fuelSaving))
+            if self.wcfg["show_finish_probability"]:
+                self.bar_finish_probability.setText(
+                    self.format_finish_probability(strategy.finishProbability))
+
+    # Additional methods
+    def format_pit_stops(self, pit_stops):
+        """Format pit stop counts"""
+        return f"{self.wcfg['prefix_pit_stops']}{pit_stops: >{self.bar_width}d}"
+
+    def format_next_pit_lap(self, pit_laps):
+        """Format next pit stop lap"""
+        if pit_laps:
+            return f"{self.wcfg['prefix_next_pit_lap']}{pit_laps[0]: >{self.bar_width}d}"
+        return f"{self.wcfg['prefix_next_pit_lap']}{'-': >{self.bar_width}}"
+
+    def format_refuel(self, refuel):
+        """Format refuel amount"""
+        refuel = min(self.fuel_units(refuel), 999.9)
+        return f"{self.wcfg['prefix_refuel']}{refuel: >{self.bar_width}.1f}"
+
+    def format_fuel_saving(self, saving):
+        """Format fuel saving percentage"""
+        return f"{self.wcfg['prefix_fuel_saving']}{saving: >{self.bar_width - 1}.1f}%"
+
+    def format_finish_probability(self, probability):
+        """Format finish probability"""
+        return (f"{self.wcfg['prefix_finish_probability']}"
+                f"{probability * 100: >{self.bar_width - 1}.0f}%")
+
+    def fuel_units(self, fuel):
+        """2 different fuel unit conversion, default is Liter"""
+        if self.cfg.units["fuel_unit"] == "Gallon":
+            return calc.liter2gallon(fuel)
+        return fuel
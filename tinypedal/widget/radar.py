@@ -21,16 +21,27 @@ Radar Widget
 """
 
 from dataclasses import dataclass
+from time import perf_counter
 
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPixmap, QLinearGradient, QRadialGradient, QPen, QBrush, QColor
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
+from ._motion import MotionInterpolator
 
 WIDGET_NAME = "radar"
+VEHICLE_COLUMNS = (
+    "isPlayer",
+    "inGarage",
+    "inPit",
+    "position",
+    "isYellow",
+    "isLapped",
+    "relativeOrientationXZRadians",
+    "relativeRotatedPosXZ",
+)
 
 
 class Realtime(Overlay):
@@ -59,6 +70,10 @@ class Realtime(Overlay):
         self.indicator_color_critical = QColor(self.wcfg["indicator_color_critical"])
         self.vehicle_hide_range = self.set_range_dimension("vehicle_maximum_visible_distance")
         self.radar_hide_range = self.set_range_dimension("auto_hide_minimum_distance")
+        self.nearby_range = max(
+            calc.distance((0, 0), (max(rect.ahead, rect.behind), rect.side))
+            for rect in (self.vehicle_hide_range, self.radar_hide_range)
+        )
 
         # Config canvas
         self.resize(self.area_size, self.area_size)
@@ -76,27 +91,49 @@ class Realtime(Overlay):
         self.autohide_timer_start = 1
         self.show_radar = True
 
-        self.vehicles_data = None
         self.last_veh_data_version = None
+        self.last_veh_pos_version = None
+
+        # Vehicle motion interpolation
+        if self.wcfg["enable_vehicle_motion_interpolation"]:
+            self.motion = MotionInterpolator()
+        else:
+            self.motion = None
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
 
+            veh_info = minfo.vehicles
+
             # Auto hide radar if no nearby vehicles
             if self.wcfg["auto_hide"]:
-                self.set_autohide_state()
+                self.set_autohide_state(veh_info)
 
             # Vehicles
-            veh_data_version = minfo.vehicles.dataSetVersion
-            self.update_vehicle(veh_data_version, self.last_veh_data_version)
+            veh_data_version = veh_info.version(VEHICLE_COLUMNS)
+            self.update_vehicle(veh_data_version, self.last_veh_data_version, veh_info)
             self.last_veh_data_version = veh_data_version
 
+            # Vehicle motion
+            if self.motion:
+                veh_pos_version = veh_info.columnVersion["relativeRotatedPosXZ"]
+                self.update_motion(veh_pos_version, self.last_veh_pos_version, veh_info)
+                self.last_veh_pos_version = veh_pos_version
+
     # GUI update methods
-    def update_vehicle(self, curr, last):
+    def update_vehicle(self, curr, last, veh_info):
         """Vehicle update"""
         if curr != last:
-            self.vehicles_data = minfo.vehicles.dataSet
+            self.update()
+
+    def update_motion(self, curr, last, veh_info):
+        """Vehicle motion sample & update, redraw interpolated position on every update"""
+        if curr != last:
+            self.motion.update(
+                veh_info.slotID, veh_info.relativeRotatedPosXZ,
+                veh_info.relativeOrientationXZRadians, veh_info.total)
+        if veh_info.total:
             self.update()
 
     def paintEvent(self, event):
@@ -106,9 +143,10 @@ class Realtime(Overlay):
             painter.setRenderHint(QPainter.Antialiasing, True)
             # Draw marks
             painter.drawPixmap(0, 0, self.pixmap_marks)
-            # Draw vehicles
-            if self.vehicles_data:
-                self.draw_vehicle(painter, self.indicator_dimension)
+            # Draw vehicles, nearby list from same data set
+            veh_info = minfo.vehicles
+            if veh_info.total:
+                self.draw_vehicle(painter, self.indicator_dimension, veh_info)
             # Apply mask
             if self.wcfg["show_fade_out"]:
                 painter.setCompositionMode(QPainter.CompositionMode_DestinationOut)
@@ -271,7 +309,7 @@ class Realtime(Overlay):
                 0, indicator.width, self.area_size
             )
 
-    def draw_vehicle(self, painter, indicator):
+    def draw_vehicle(self, painter, indicator, veh_info):
         """Draw vehicles"""
         if self.wcfg["vehicle_outline_width"] > 0:
             self.pen.setWidth(self.wcfg["vehicle_outline_width"])
@@ -285,12 +323,18 @@ class Realtime(Overlay):
         nearest_right = indicator.max_range_x
 
         # Draw opponent vehicle within radar range
-        for veh_info in self.vehicles_data:
-            if veh_info.isPlayer:
+        motion = self.motion
+        now = perf_counter()
+        for index in self.nearby_vehicles(veh_info):
+            if veh_info.isPlayer[index]:
                 continue
 
             # -x = left, +x = right, -y = ahead, +y = behind
-            raw_pos_x, raw_pos_y = veh_info.relativeRotatedPosXZ
+            raw_pos_x, raw_pos_y = veh_info.relativeRotatedPosXZ[index]
+            ori_rad = veh_info.relativeOrientationXZRadians[index]
+            if motion:
+                raw_pos_x, raw_pos_y, ori_rad = motion.position(
+                    veh_info.slotID[index], now, raw_pos_x, raw_pos_y, ori_rad)
             if (self.vehicle_hide_range.behind > raw_pos_y > -self.vehicle_hide_range.ahead and
                 -self.vehicle_hide_range.side < raw_pos_x < self.vehicle_hide_range.side):
 
@@ -306,10 +350,10 @@ class Realtime(Overlay):
                 # Rotated position relative to player
                 pos_x = self.scale_veh_pos(raw_pos_x)
                 pos_y = self.scale_veh_pos(raw_pos_y)
-                angle_deg = round(calc.rad2deg(-veh_info.relativeOrientationXZRadians), 3)
+                angle_deg = round(calc.rad2deg(-ori_rad), 3)
 
                 # Draw vehicle
-                self.brush.setColor(self.color_lap_diff(veh_info))
+                self.brush.setColor(self.color_lap_diff(veh_info, index))
                 painter.setBrush(self.brush)
                 painter.translate(pos_x, pos_y)
                 painter.rotate(angle_deg)
@@ -350,33 +394,33 @@ class Realtime(Overlay):
         self.indicator_color.setAlphaF(alpha)
         return self.indicator_color
 
-    def color_lap_diff(self, veh_info):
+    def color_lap_diff(self, veh_info, index):
         """Compare lap differences & set color"""
-        if veh_info.position == 1:
+        if veh_info.position[index] == 1:
             return self.wcfg["vehicle_color_leader"]
-        if veh_info.inPit:
+        if veh_info.inPit[index]:
             return self.wcfg["vehicle_color_in_pit"]
-        if veh_info.isYellow and not veh_info.inPit + veh_info.inGarage:
+        if veh_info.isYellow[index] and not veh_info.inPit[index] + veh_info.inGarage[index]:
             return self.wcfg["vehicle_color_yellow"]
-        if veh_info.isLapped > 0:
+        if veh_info.isLapped[index] > 0:
             return self.wcfg["vehicle_color_laps_ahead"]
-        if veh_info.isLapped < 0:
+        if veh_info.isLapped[index] < 0:
             return self.wcfg["vehicle_color_laps_behind"]
         return self.wcfg["vehicle_color_same_lap"]
 
-    def set_autohide_state(self):
+    def set_autohide_state(self, veh_info):
         """Auto hide radar if in private qualifying or no nearby vehicles"""
         if (self.wcfg["auto_hide_in_private_qualifying"] and
             self.cfg.user.setting["module_restapi"]["enable"] and
-            api.read.session.session_type() == 2 and
+            frame_api.read.session.session_type() == 2 and
             minfo.restapi.privateQualifying == 1):
             self.show_radar = False
             return None
 
-        lap_etime = api.read.timing.elapsed()
-        in_garage = api.read.vehicle.in_garage()
+        lap_etime = frame_api.read.timing.elapsed()
+        in_garage = frame_api.read.vehicle.in_garage()
 
-        if self.is_nearby() or in_garage:
+        if self.is_nearby(veh_info) or in_garage:
             if not self.show_radar:
                 self.show_radar = True
             self.autohide_timer_start = lap_etime
@@ -392,14 +436,21 @@ class Realtime(Overlay):
                 self.autohide_timer_start = 0
         return None
 
-    def is_nearby(self):
+    def nearby_vehicles(self, veh_info):
+        """Find vehicle index list within radar range from spatial grid"""
+        plr_index = frame_api.read.vehicle.player_index()
+        if not 0 <= plr_index < veh_info.total:
+            return range(veh_info.total)
+        pos_x, pos_z = veh_info.posXZ[plr_index]
+        return sorted(calc.spatial_grid_nearby(
+            veh_info.spatialGrid, veh_info.spatialGridSize, pos_x, pos_z, self.nearby_range))
+
+    def is_nearby(self, veh_info):
         """Check nearby vehicles"""
-        if not self.vehicles_data:
-            return False
-        for veh_info in self.vehicles_data:
-            if not veh_info.isPlayer:
+        for index in self.nearby_vehicles(veh_info):
+            if not veh_info.isPlayer[index]:
                 # -x = left, +x = right, -y = ahead, +y = behind
-                raw_pos_x, raw_pos_y = veh_info.relativeRotatedPosXZ
+                raw_pos_x, raw_pos_y = veh_info.relativeRotatedPosXZ[index]
                 if (self.radar_hide_range.behind > raw_pos_y > -self.radar_hide_range.ahead and
                     -self.radar_hide_range.side < raw_pos_x < self.radar_hide_range.side):
                     return True
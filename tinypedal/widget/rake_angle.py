@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "rake_angle"
 
@@ -83,7 +82,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Rake angle
-            rake = round(calc.rake(*api.read.wheel.ride_height()), 2)
+            rake = round(calc.rake(*frame_api.read.wheel.ride_height()), 2)
             self.update_rakeangle(rake, self.last_rake)
             self.last_rake = rake
 
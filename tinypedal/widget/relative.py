@@ -29,6 +29,7 @@ from .. import formatter as fmt
 from ..const import PATH_BRANDLOGO
 from ..module_info import minfo
 from ._base import Overlay
+from ._table import PainterTable
 
 WIDGET_NAME = "relative"
 
@@ -94,6 +95,20 @@ class Realtime(Overlay):
         layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.setLayout(layout)
 
+        # Painter table mode
+        if self.wcfg["enable_painter_table_mode"]:
+            self.painter_table = PainterTable(
+                self.config_font(
+                    self.wcfg["font_name"],
+                    self.wcfg["font_size"],
+                    self.wcfg["font_weight"]
+                ),
+                bar_gap,
+            )
+            layout.addWidget(self.painter_table, 0, 0)
+        else:
+            self.painter_table = None
+
         # Driver position
         if self.wcfg["show_position"]:
             bar_style_pos = self.set_qss(
@@ -257,9 +272,9 @@ class Realtime(Overlay):
         if self.state.active:
 
             relative_list = minfo.relative.relative
-            vehicles_data = minfo.vehicles.dataSet
+            veh_info = minfo.vehicles
             total_idx = len(relative_list)
-            total_veh_idx = len(vehicles_data)
+            total_veh_idx = veh_info.total
 
             # Relative update
             for idx in range(self.veh_range):
@@ -267,7 +282,7 @@ class Realtime(Overlay):
                 # Get vehicle data
                 if idx < total_idx and 0 <= relative_list[idx] < total_veh_idx:
                     self.curr_data[idx] = self.get_data(
-                        relative_list[idx], vehicles_data)
+                        relative_list[idx], veh_info)
                 elif self.last_data[idx] == self.empty_vehicles_data:
                     continue  # skip if already empty
                 else:
@@ -522,12 +537,16 @@ class Realtime(Overlay):
         """Set table"""
         for idx in range(self.veh_range):
             bar_name = f"{idx}_{name}"
-            self.data_bar[bar_name] = self.set_qlabel(
-                text="",
-                style=style,
-                width=width,
-            )
-            self.layout().addWidget(self.data_bar[bar_name], idx, column)
+            if self.painter_table:
+                self.data_bar[bar_name] = self.painter_table.add_cell(
+                    idx, column, width, style)
+            else:
+                self.data_bar[bar_name] = self.set_qlabel(
+                    text="",
+                    style=style,
+                    width=width,
+                )
+                self.layout().addWidget(self.data_bar[bar_name], idx, column)
 
     # Additional methods
     def color_lap_diff(self, is_lapped):
@@ -590,50 +609,50 @@ class Realtime(Overlay):
             return "OUT" + f"{pit_time:.1f}"[:5].rjust(5) if pit_time > 0 else "-:--.---"
         return calc.sec2laptime_full(laptime_last)[:8].rjust(8)
 
-    def get_data(self, index, vehicles_data):
+    def get_data(self, index, veh_info):
         """Relative data"""
         # Check whether is lapped (is_lapped: int)
-        is_lapped = vehicles_data[index].isLapped
+        is_lapped = veh_info.isLapped[index]
 
         # Highlighted player (hi_player: bool)
-        hi_player = self.wcfg["show_player_highlighted"] and vehicles_data[index].isPlayer
+        hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer[index]
 
         # 0 Vehicle in pit (in_pit: bool)
-        in_pit = vehicles_data[index].inPit
+        in_pit = veh_info.inPit[index]
 
         # 1 Driver position (position: int, is_lapped, hi_player)
-        position = (vehicles_data[index].position, is_lapped, hi_player)
+        position = (veh_info.position[index], is_lapped, hi_player)
 
         # 2 Driver name (drv_name: str, is_lapped, hi_player)
-        drv_name = (vehicles_data[index].driverName, is_lapped, hi_player)
+        drv_name = (veh_info.driverName[index], is_lapped, hi_player)
 
         # 3 Vehicle name (veh_name: str, is_lapped, hi_player)
-        veh_name = (vehicles_data[index].vehicleName, is_lapped, hi_player)
+        veh_name = (veh_info.vehicleName[index], is_lapped, hi_player)
 
         # 4 Position in class (pos_class: int, hi_player)
-        pos_class = (vehicles_data[index].positionInClass, hi_player)
+        pos_class = (veh_info.positionInClass[index], hi_player)
 
         # 5 Vehicle class (veh_class: str)
-        veh_class = vehicles_data[index].vehicleClass
+        veh_class = veh_info.vehicleClass[index]
 
         # 6 Time gap (time_gap: float, is_lapped, hi_player)
-        time_gap = (vehicles_data[index].relativeTimeGap, is_lapped, hi_player)
+        time_gap = (veh_info.relativeTimeGap[index], is_lapped, hi_player)
 
         # 7 Tyre compound index (tire_idx: tuple, hi_player)
-        tire_idx = (vehicles_data[index].tireCompound, hi_player)
+        tire_idx = (veh_info.tireCompound[index], hi_player)
 
         # 8 Lap time (laptime: tuple, hi_player)
         laptime = ((
-                vehicles_data[index].inPit,
-                vehicles_data[index].lastLapTime,
-                vehicles_data[index].pitTime
+                veh_info.inPit[index],
+                veh_info.lastLapTime[index],
+                veh_info.pitTime[index]
             ),
             hi_player)
 
         # 9 Pitstop count (pit_count: int, pit_state: int, hi_player)
         pit_count = (
-            vehicles_data[index].numPitStops,
-            vehicles_data[index].pitState,
+            veh_info.numPitStops[index],
+            veh_info.pitState[index],
             hi_player)
 
         return (in_pit, position, drv_name, veh_name, pos_class, veh_class,
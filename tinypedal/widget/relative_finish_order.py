@@ -26,9 +26,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "relative_finish_order"
 MAGIC_NUM = 99999
@@ -231,14 +230,14 @@ class Realtime(Overlay):
 
     def update_predication(self):
         """Update predication"""
-        is_lap_type_session = api.read.session.lap_type()
-        in_formation = api.read.session.in_formation()
+        is_lap_type_session = frame_api.read.session.lap_type()
+        in_formation = frame_api.read.session.in_formation()
         energy_type = minfo.restapi.maxVirtualEnergy
 
         leader_index = self.find_leader_index()
-        player_index = api.read.vehicle.player_index()
-        leader_lap_into = api.read.lap.progress(leader_index)
-        player_lap_into = api.read.lap.progress()
+        player_index = frame_api.read.vehicle.player_index()
+        leader_lap_into = frame_api.read.lap.progress(leader_index)
+        player_lap_into = frame_api.read.lap.progress()
 
         leader_laptime_pace = self.leader_pace.update(leader_index)
         player_laptime_pace = minfo.delta.lapTimePace
@@ -247,13 +246,13 @@ class Realtime(Overlay):
         player_valid = 0 < player_laptime_pace < MAGIC_NUM
 
         if is_lap_type_session and leader_valid and player_valid:
-            laps_total = api.read.lap.maximum()
-            leader_laps_left = laps_total - api.read.lap.completed_laps(leader_index) - leader_lap_into
-            player_laps_left = laps_total - api.read.lap.completed_laps() - player_lap_into
+            laps_total = frame_api.read.lap.maximum()
+            leader_laps_left = laps_total - frame_api.read.lap.completed_laps(leader_index) - leader_lap_into
+            player_laps_left = laps_total - frame_api.read.lap.completed_laps() - player_lap_into
             time_left = min(leader_laptime_pace, player_laptime_pace) * leader_laps_left
             laps_diff = player_laps_left - (time_left / player_laptime_pace)
         else:
-            time_left = api.read.session.remaining()
+            time_left = frame_api.read.session.remaining()
             laps_diff = 0
 
         # Update last pit time slot
@@ -423,8 +422,8 @@ class Realtime(Overlay):
     @staticmethod
     def find_leader_index():
         """Find leader index"""
-        for index in range(api.read.vehicle.total_vehicles()):
-            if api.read.vehicle.place(index) == 1:
+        for index in range(frame_api.read.vehicle.total_vehicles()):
+            if frame_api.read.vehicle.place(index) == 1:
                 return index
         return 0
 
@@ -492,15 +491,15 @@ class LapTimePace:
     def reset_laptime(self, index: int) -> float:
         """Reset laptime"""
         return min(filter(self.verify,
-            (api.read.timing.last_laptime(index),
-            api.read.timing.best_laptime(index),
+            (frame_api.read.timing.last_laptime(index),
+            frame_api.read.timing.best_laptime(index),
             MAGIC_NUM)))
 
     def update(self, index: int = 0) -> float:
         """Calculate laptime pace"""
-        lap_stime = api.read.timing.start(index)
-        self.pit_lap = bool(self.pit_lap + api.read.vehicle.in_pits(index))
-        veh_class = api.read.vehicle.class_name(index)
+        lap_stime = frame_api.read.timing.start(index)
+        self.pit_lap = bool(self.pit_lap + frame_api.read.vehicle.in_pits(index))
+        veh_class = frame_api.read.vehicle.class_name(index)
 
         # Reset if vehicle class changes
         if veh_class != self.last_vehicle_class:
@@ -508,13 +507,13 @@ class LapTimePace:
             self.laptime_pace = self.reset_laptime(index)
 
         if lap_stime != self.last_lap_stime:
-            self.validating = api.read.timing.elapsed()
+            self.validating = frame_api.read.timing.elapsed()
             self.pit_lap = 0
         self.last_lap_stime = lap_stime
 
         if self.validating:
-            timer = api.read.timing.elapsed() - self.validating
-            laptime_last = api.read.timing.last_laptime(index)
+            timer = frame_api.read.timing.elapsed() - self.validating
+            laptime_last = frame_api.read.timing.last_laptime(index)
             if 1 < timer <= 10 and self.verify(laptime_last):
                 if not self.pit_lap:
                     if laptime_last < self.laptime_pace:
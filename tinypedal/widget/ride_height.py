@@ -23,8 +23,7 @@ Ride height Widget
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "ride_height"
 
@@ -114,7 +113,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read ride height & rake data
-            self.ride_height = api.read.wheel.ride_height()
+            self.ride_height = frame_api.read.wheel.ride_height()
             self.update_rideh(self.ride_height, self.last_ride_height)
             self.last_ride_height = self.ride_height
 
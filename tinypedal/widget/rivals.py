@@ -26,10 +26,10 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import formatter as fmt
-from ..api_control import api
 from ..const import PATH_BRANDLOGO
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
+from ._table import PainterTable
 
 WIDGET_NAME = "rivals"
 
@@ -94,6 +94,20 @@ class Realtime(Overlay):
         layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.setLayout(layout)
 
+        # Painter table mode
+        if self.wcfg["enable_painter_table_mode"]:
+            self.painter_table = PainterTable(
+                self.config_font(
+                    self.wcfg["font_name"],
+                    self.wcfg["font_size"],
+                    self.wcfg["font_weight"]
+                ),
+                bar_gap,
+            )
+            layout.addWidget(self.painter_table, 0, 0)
+        else:
+            self.painter_table = None
+
         # Driver position
         if self.wcfg["show_position"]:
             bar_style_pos = self.set_qss(
@@ -254,11 +268,11 @@ class Realtime(Overlay):
         """Update when vehicle on track"""
         if self.state.active:
 
-            player_idx = api.read.vehicle.player_index()
-            vehicles_data = minfo.vehicles.dataSet
+            player_idx = frame_api.read.vehicle.player_index()
+            veh_info = minfo.vehicles
             total_idx = len(minfo.relative.classes)
-            total_veh_idx = len(vehicles_data)
-            in_race = api.read.session.in_race()
+            total_veh_idx = veh_info.total
+            in_race = frame_api.read.session.in_race()
 
             if player_idx < total_idx:
                 rivals_list = minfo.relative.classes[player_idx][5:7]
@@ -271,7 +285,7 @@ class Realtime(Overlay):
                 # Get vehicle data
                 if 0 <= rivals_list[idx] < total_veh_idx:
                     self.curr_data[idx] = self.get_data(
-                        rivals_list[idx], player_idx, vehicles_data, in_race)
+                        rivals_list[idx], player_idx, veh_info, in_race)
                 elif self.last_data[idx] == self.empty_vehicles_data:
                     continue  # skip if already empty
                 else:
@@ -502,12 +516,16 @@ class Realtime(Overlay):
         """Set table"""
         for idx in range(self.veh_range):
             bar_name = f"{idx}_{name}"
-            self.data_bar[bar_name] = self.set_qlabel(
-                text="",
-                style=style,
-                width=width,
-            )
-            self.layout().addWidget(self.data_bar[bar_name], idx, column)
+            if self.painter_table:
+                self.data_bar[bar_name] = self.painter_table.add_cell(
+                    idx, column, width, style)
+            else:
+                self.data_bar[bar_name] = self.set_qlabel(
+                    text="",
+                    style=style,
+                    width=width,
+                )
+                self.layout().addWidget(self.data_bar[bar_name], idx, column)
             if idx > 0:  # show only first row initially
                 self.data_bar[bar_name].hide()
 
@@ -587,54 +605,54 @@ class Realtime(Overlay):
             return f"{'+-'[is_ahead]}{gap_behind_class:.0f}L"
         return f"{'+-'[is_ahead]}{gap_behind_class:.{self.int_decimals}f}"
 
-    def get_data(self, index, player_idx, vehicles_data, in_race):
+    def get_data(self, index, player_idx, veh_info, in_race):
         """Standings data"""
         # 0 Vehicle in pit (in_pit: bool)
-        in_pit = vehicles_data[index].inPit
+        in_pit = veh_info.inPit[index]
 
         # 1 Driver position (position: int)
-        position = vehicles_data[index].position
+        position = veh_info.position[index]
 
         # 2 Driver name (drv_name: str)
-        drv_name = vehicles_data[index].driverName
+        drv_name = veh_info.driverName[index]
 
         # 3 Vehicle name (veh_name: str)
-        veh_name = vehicles_data[index].vehicleName
+        veh_name = veh_info.vehicleName[index]
 
         # 4 Position in class (pos_class: int)
-        pos_class = vehicles_data[index].positionInClass
+        pos_class = veh_info.positionInClass[index]
 
         # 5 Vehicle class (veh_class: str)
-        veh_class = vehicles_data[index].vehicleClass
+        veh_class = veh_info.vehicleClass[index]
 
         # 6 Tyre compound index (tire_idx: tuple)
-        tire_idx = vehicles_data[index].tireCompound
+        tire_idx = veh_info.tireCompound[index]
 
         # 7 Lap time (laptime: tuple)
         if self.wcfg["show_best_laptime"] or in_race:
             laptime = (
-                    vehicles_data[index].inPit,
-                    vehicles_data[index].lastLapTime,
-                    vehicles_data[index].pitTime
+                    veh_info.inPit[index],
+                    veh_info.lastLapTime[index],
+                    veh_info.pitTime[index]
                 )
         else:
             laptime = (
                     0,
-                    vehicles_data[index].bestLapTime,
+                    veh_info.bestLapTime[index],
                     0
                 )
 
         # 8 Best lap time (best_laptime: float)
-        best_laptime = vehicles_data[index].bestLapTime
+        best_laptime = veh_info.bestLapTime[index]
 
         # 9 Pitstop count (pit_count: int, pit_state: int)
         pit_count = (
-            vehicles_data[index].numPitStops,
-            vehicles_data[index].pitState)
+            veh_info.numPitStops[index],
+            veh_info.pitState[index])
 
         # 10 Time interval (time_int: float, is_ahead)
-        is_ahead = vehicles_data[index].position < vehicles_data[player_idx].position
-        time_int = (vehicles_data[player_idx if is_ahead else index].gapBehindNextInClass, is_ahead)
+        is_ahead = veh_info.position[index] < veh_info.position[player_idx]
+        time_int = (veh_info.gapBehindNextInClass[player_idx if is_ahead else index], is_ahead)
 
         return (in_pit, position, drv_name, veh_name, pos_class, veh_class,
                 tire_idx, laptime, best_laptime, pit_count, time_int)
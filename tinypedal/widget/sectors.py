@@ -25,9 +25,8 @@ from PySide2.QtWidgets import QGridLayout, QHBoxLayout, QLabel
 
 from .. import calculation as calc
 from .. import validator as val
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "sectors"
 MAGIC_NUM = 99999  # magic number for default variable not updated by rF2
@@ -144,8 +143,8 @@ class Realtime(Overlay):
         if self.state.active and minfo.sectors.sectorPrev:
 
             # Read Sector data
-            lap_stime = api.read.timing.start()
-            lap_etime = api.read.timing.elapsed()
+            lap_stime = frame_api.read.timing.start()
+            lap_etime = frame_api.read.timing.elapsed()
             laptime_curr = max(lap_etime - lap_stime, 0)
 
             # Save switch
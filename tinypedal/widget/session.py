@@ -27,8 +27,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "session"
 
@@ -161,7 +160,7 @@ class Realtime(Overlay):
 
             # Session name
             if self.wcfg["show_session_name"]:
-                session_name = self.session_name_list[api.read.session.session_type()]
+                session_name = self.session_name_list[frame_api.read.session.session_type()]
                 self.update_session_name(session_name, self.last_session_name)
                 self.last_session_name = session_name
 
@@ -173,22 +172,22 @@ class Realtime(Overlay):
 
             # Session time
             if self.wcfg["show_session_time"]:
-                session_time = api.read.session.remaining()
+                session_time = frame_api.read.session.remaining()
                 self.update_session_time(session_time, self.last_session_time)
                 self.last_session_time = session_time
 
             # Lap number
             if self.wcfg["show_lapnumber"]:
-                lap_number = api.read.lap.number()
-                lap_max = api.read.lap.maximum()
+                lap_number = frame_api.read.lap.number()
+                lap_max = frame_api.read.lap.maximum()
                 lap_into = lap_number + calc.lap_progress_correction(
-                    api.read.lap.progress(), api.read.timing.current_laptime())
+                    frame_api.read.lap.progress(), frame_api.read.timing.current_laptime())
                 self.update_lapnumber(lap_into, self.last_lap_into, lap_number, lap_max)
                 self.last_lap_into = lap_into
 
             # Driver place & total vehicles
             if self.wcfg["show_position"]:
-                place = (api.read.vehicle.place(), api.read.vehicle.total_vehicles())
+                place = (frame_api.read.vehicle.place(), frame_api.read.vehicle.total_vehicles())
                 self.update_position(place, self.last_place)
                 self.last_place = place
 
@@ -215,7 +214,7 @@ class Realtime(Overlay):
     def update_lapnumber(self, curr, last, lap_num, lap_max):
         """Lap number"""
         if curr != last:
-            lap_total = lap_max if api.read.session.lap_type() else "-"
+            lap_total = lap_max if frame_api.read.session.lap_type() else "-"
             lap_text = f"{self.wcfg['prefix_lap_number']}{curr:02.2f}/{lap_total}"
 
             self.bar_lapnumber.setText(lap_text)
@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "speedometer"
 
@@ -142,9 +141,9 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read speed data
-            speed = api.read.vehicle.speed()
-            lap_etime = api.read.timing.elapsed()
-            raw_throttle = api.read.input.throttle_raw()
+            speed = frame_api.read.vehicle.speed()
+            lap_etime = frame_api.read.timing.elapsed()
+            raw_throttle = frame_api.read.input.throttle_raw()
 
             # Update current speed
             if self.wcfg["show_speed"]:
@@ -171,7 +170,7 @@ class Realtime(Overlay):
 
             # Update fastest speed
             if self.wcfg["show_speed_fastest"]:
-                if api.read.engine.gear() < 0:  # reset on reverse gear
+                if frame_api.read.engine.gear() < 0:  # reset on reverse gear
                     self.last_speed_fast = 0
                 if speed > self.last_speed_fast:
                     self.update_speed("fast", speed, self.last_speed_fast)
@@ -26,10 +26,10 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import formatter as fmt
-from ..api_control import api
 from ..const import PATH_BRANDLOGO
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
+from ._table import PainterTable
 
 WIDGET_NAME = "standings"
 
@@ -103,6 +103,20 @@ class Realtime(Overlay):
         layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.setLayout(layout)
 
+        # Painter table mode
+        if self.wcfg["enable_painter_table_mode"]:
+            self.painter_table = PainterTable(
+                self.config_font(
+                    self.wcfg["font_name"],
+                    self.wcfg["font_size"],
+                    self.wcfg["font_weight"]
+                ),
+                bar_gap,
+            )
+            layout.addWidget(self.painter_table, 0, 0)
+        else:
+            self.painter_table = None
+
         # Driver position
         if self.wcfg["show_position"]:
             self.bar_style_pos = (
@@ -314,10 +328,10 @@ class Realtime(Overlay):
         if self.state.active:
 
             standings_list = minfo.relative.standings
-            vehicles_data = minfo.vehicles.dataSet
+            veh_info = minfo.vehicles
             total_idx = len(standings_list) - 1  # skip final -1 index
-            total_veh_idx = len(vehicles_data)
-            in_race = api.read.session.in_race()
+            total_veh_idx = veh_info.total
+            in_race = frame_api.read.session.in_race()
 
             # Standings update
             for idx in range(self.veh_range):
@@ -325,7 +339,7 @@ class Realtime(Overlay):
                 # Get vehicle data
                 if idx < total_idx and -1 <= standings_list[idx] < total_veh_idx:
                     self.curr_data[idx] = self.get_data(
-                        standings_list[idx], vehicles_data, in_race,
+                        standings_list[idx], veh_info, in_race,
                         standings_list[idx] == -1)  # set state
                 elif self.last_data[idx] == self.empty_vehicles_data:
                     continue  # skip if already empty
@@ -584,12 +598,16 @@ class Realtime(Overlay):
         """Set table"""
         for idx in range(self.veh_range):
             bar_name = f"{idx}_{name}"
-            self.data_bar[bar_name] = self.set_qlabel(
-                text="",
-                style=style,
-                width=width,
-            )
-            self.layout().addWidget(self.data_bar[bar_name], idx, column)
+            if self.painter_table:
+                self.data_bar[bar_name] = self.painter_table.add_cell(
+                    idx, column, width, style)
+            else:
+                self.data_bar[bar_name] = self.set_qlabel(
+                    text="",
+                    style=style,
+                    width=width,
+                )
+                self.layout().addWidget(self.data_bar[bar_name], idx, column)
             if idx > 0:  # show only first row initially
                 self.data_bar[bar_name].hide()
 
@@ -698,85 +716,85 @@ class Realtime(Overlay):
             return f"{gap_behind:.0f}L"
         return f"{gap_behind:.{self.int_decimals}f}"
 
-    def get_data(self, index, vehicles_data, in_race, state):
+    def get_data(self, index, veh_info, in_race, state):
         """Standings data"""
         # Highlighted player
-        hi_player = self.wcfg["show_player_highlighted"] and vehicles_data[index].isPlayer
+        hi_player = self.wcfg["show_player_highlighted"] and veh_info.isPlayer[index]
 
         # 0 Vehicle in pit (in_pit: bool, state)
-        in_pit = (vehicles_data[index].inPit, state)
+        in_pit = (veh_info.inPit[index], state)
 
         # 1 Driver position (position: int, hi_player, state)
-        position = (vehicles_data[index].position, hi_player, state)
+        position = (veh_info.position[index], hi_player, state)
 
         # 2 Driver name (drv_name: str, hi_player, state)
-        drv_name = (vehicles_data[index].driverName, hi_player, state)
+        drv_name = (veh_info.driverName[index], hi_player, state)
 
         # 3 Vehicle name (veh_name: str, hi_player, state)
-        veh_name = (vehicles_data[index].vehicleName, hi_player, state)
+        veh_name = (veh_info.vehicleName[index], hi_player, state)
 
         # 4 Position in class (pos_class: int, hi_player, state)
-        pos_class = (vehicles_data[index].positionInClass, hi_player, state)
+        pos_class = (veh_info.positionInClass[index], hi_player, state)
 
         # 5 Vehicle class (veh_class: str, state)
-        veh_class = (vehicles_data[index].vehicleClass, state)
+        veh_class = (veh_info.vehicleClass[index], state)
 
         # 6 Tyre compound index (tire_idx: tuple, hi_player, state)
-        tire_idx = (vehicles_data[index].tireCompound, hi_player, state)
+        tire_idx = (veh_info.tireCompound[index], hi_player, state)
 
         # 7 Lap time (laptime: tuple, hi_player, state)
         if self.wcfg["show_best_laptime"] or in_race:
             laptime = ((
-                    vehicles_data[index].inPit,
-                    vehicles_data[index].lastLapTime,
-                    vehicles_data[index].pitTime
+                    veh_info.inPit[index],
+                    veh_info.lastLapTime[index],
+                    veh_info.pitTime[index]
                 ),
                 hi_player, state)
         else:
             laptime = ((
                     0,
-                    vehicles_data[index].bestLapTime,
+                    veh_info.bestLapTime[index],
                     0
                 ),
                 hi_player, state)
 
         # 8 Best lap time (best_laptime: float, hi_player, state)
-        best_laptime = (vehicles_data[index].bestLapTime, hi_player, state)
+        best_laptime = (veh_info.bestLapTime[index], hi_player, state)
 
         # 9 Time gap (time_gap: str, hi_player, state)
         if in_race:
             time_gap = (
                 self.gap_to_leader_race(
-                    vehicles_data[index].gapBehindLeader,
-                    vehicles_data[index].position
+                    veh_info.gapBehindLeader[index],
+                    veh_info.position[index]
                 ),
                 hi_player, state)
         else:
             time_gap = (
                 self.gap_to_session_bestlap(
-                    vehicles_data[index].bestLapTime,
-                    vehicles_data[index].sessionBestLapTime,
-                    vehicles_data[index].classBestLapTime,
+                    veh_info.bestLapTime[index],
+                    veh_info.sessionBestLapTime[index],
+                    veh_info.classBestLapTime[index],
                 ),
                 hi_player, state)
 
         # 10 Pitstop count (pit_count: int, pit_state: int, hi_player, state)
         pit_count = (
-            vehicles_data[index].numPitStops,
-            vehicles_data[index].pitState,
+            veh_info.numPitStops[index],
+            veh_info.pitState[index],
             hi_player, state)
 
         # 11 Time interval (time_int: tuple, hi_player, state)
         if self.show_class_interval:
             time_int = ((
-                    vehicles_data[index].positionInClass,
-                    vehicles_data[index].gapBehindNextInClass,
+                    veh_info.positionInClass[index],
+                    veh_info.gapBehindNextInClass[index],
                 ),
                 hi_player, state)
         else:
             time_int = ((
-                    vehicles_data[index].position,
-                    vehicles_data[index].gapBehindNext,
+                    veh_info.position[index],
+                    veh_info.gapBehindNext[index],
                 ),
                 hi_player, state)
 
@@ -21,11 +21,10 @@ Steering Widget
 """
 
 from PySide2.QtCore import Qt, QRectF
-from PySide2.QtGui import QPainter, QPixmap, QPen, QBrush
+from PySide2.QtGui import QPainter, QPixmap, QBrush
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api, text_cache
 
 WIDGET_NAME = "steering"
 
@@ -86,7 +85,6 @@ class Realtime(Overlay):
         self.pixmap_background = QPixmap(self.full_width, self.bar_height)
         self.pixmap_mark = QPixmap(self.full_width, self.bar_height)
 
-        self.pen = QPen()
         self.brush = QBrush(Qt.SolidPattern)
         self.draw_background()
         self.draw_scale_mark()
@@ -102,11 +100,11 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read steering data
-            self.raw_steering = api.read.input.steering_raw()
+            self.raw_steering = frame_api.read.input.steering_raw()
             if self.wcfg["manual_steering_range"] > 0:
                 self.sw_rot_range = self.wcfg["manual_steering_range"]
             else:
-                self.sw_rot_range = api.read.input.steering_range_physical()
+                self.sw_rot_range = frame_api.read.input.steering_range_physical()
                 if minfo.restapi.steeringWheelRange > 0 >= self.sw_rot_range:
                     self.sw_rot_range = minfo.restapi.steeringWheelRange
 
@@ -197,18 +195,21 @@ class Realtime(Overlay):
     def draw_readings(self, painter):
         """Draw readings"""
         angle = round(self.raw_steering * self.sw_rot_range * 0.5)
-        self.pen.setColor(self.wcfg["font_color"])
-        painter.setPen(self.pen)
-        painter.setFont(self.font)
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_bg_l,
             Qt.AlignLeft | Qt.AlignVCenter,
-            f"{abs(angle)}" if min(angle, 0) else ""
+            f"{abs(angle)}" if min(angle, 0) else "",
+            self.font,
+            self.wcfg["font_color"]
         )
-        painter.drawText(
+        text_cache.draw_text(
+            painter,
             self.rect_text_bg_r,
             Qt.AlignRight | Qt.AlignVCenter,
-            f"{abs(angle)}" if max(angle, 0) else ""
+            f"{abs(angle)}" if max(angle, 0) else "",
+            self.font,
+            self.wcfg["font_color"]
         )
 
     # Additional methods
@@ -26,9 +26,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "stint_history"
 
@@ -226,12 +225,12 @@ class Realtime(Overlay):
                     self.update_stint_history(self.history_data[index], index + 1)
 
             # Read stint data
-            lap_num = api.read.lap.number()
-            time_curr = api.read.session.elapsed()
-            in_pits = api.read.vehicle.in_pits()
-            in_garage = api.read.vehicle.in_garage()
+            lap_num = frame_api.read.lap.number()
+            time_curr = frame_api.read.session.elapsed()
+            in_pits = frame_api.read.vehicle.in_pits()
+            in_garage = frame_api.read.vehicle.in_garage()
 
-            wear_avg = 100 - sum(api.read.tyre.wear()) * 25
+            wear_avg = 100 - sum(frame_api.read.tyre.wear()) * 25
 
             # Check if virtual energy available
             if self.wcfg["show_virtual_energy_if_available"] and minfo.restapi.maxVirtualEnergy:
@@ -256,7 +255,7 @@ class Realtime(Overlay):
                 self.reset_stint = True
 
             # Current stint data
-            self.stint_data[0] = self.set_tyre_cmp(api.read.tyre.compound())
+            self.stint_data[0] = self.set_tyre_cmp(frame_api.read.tyre.compound())
             self.stint_data[1] = max(lap_num - self.start_laps, 0)
             self.stint_data[2] = max(time_curr - self.start_time, 0)
             self.stint_data[3] = max(self.start_fuel - fuel_curr, 0)
@@ -23,8 +23,7 @@ Suspension position Widget
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen
 
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "suspension_position"
 
@@ -108,7 +107,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Suspension position
-            self.pos_raw = api.read.wheel.suspension_deflection()
+            self.pos_raw = frame_api.read.wheel.suspension_deflection()
             self.update_susp_pos(self.pos_raw, self.last_pos_raw)
             self.last_pos_raw = self.pos_raw
 
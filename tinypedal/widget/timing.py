@@ -24,9 +24,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "timing"
 MAGIC_NUM = 99999  # magic number for default variable not updated by rF2
@@ -247,9 +246,9 @@ class Realtime(Overlay):
 
             # Session best laptime
             if self.wcfg["show_session_best"]:
-                veh_total = api.read.vehicle.total_vehicles()
-                laptime_best_tmp = api.read.timing.best_laptime(self.vehicle_counter)
-                same_vehicle_class = api.read.vehicle.same_class(self.vehicle_counter)
+                veh_total = frame_api.read.vehicle.total_vehicles()
+                laptime_best_tmp = frame_api.read.timing.best_laptime(self.vehicle_counter)
+                same_vehicle_class = frame_api.read.vehicle.same_class(self.vehicle_counter)
 
                 if 0 < laptime_best_tmp < self.laptime_sbst:
                     if self.wcfg["show_session_best_from_same_class_only"] and same_vehicle_class:
@@ -297,7 +296,7 @@ class Realtime(Overlay):
 
             # Session personal best laptime
             if self.wcfg["show_session_personal_best"]:
-                laptime_spbt = api.read.timing.best_laptime()
+                laptime_spbt = frame_api.read.timing.best_laptime()
                 self.update_laptime(laptime_spbt, self.last_laptime_spbt,
                                     self.prefix_spbt, "spbt")
                 self.last_laptime_spbt = laptime_spbt
@@ -20,14 +20,27 @@
 Track map Widget
 """
 
+from time import perf_counter
+
 from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainterPath, QPainter, QPixmap, QPen, QBrush
 
 from .. import calculation as calc
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, text_cache
+from ._motion import MotionInterpolator
 
 WIDGET_NAME = "track_map"
+VEHICLE_COLUMNS = (
+    "isPlayer",
+    "inGarage",
+    "inPit",
+    "position",
+    "isYellow",
+    "isLapped",
+    "lapProgress",
+    "posXZ",
+)
 
 
 class Realtime(Overlay):
@@ -70,8 +83,6 @@ class Realtime(Overlay):
         self.resize(self.area_size, self.area_size)
         self.pixmap_map = QPixmap(self.area_size, self.area_size)
 
-        self.pen = QPen()
-
         self.pixmap_veh_player = self.draw_vehicle_pixmap("player")
         self.pixmap_veh_leader = self.draw_vehicle_pixmap("leader")
         self.pixmap_veh_in_pit = self.draw_vehicle_pixmap("in_pit")
@@ -89,8 +100,15 @@ class Realtime(Overlay):
         self.vehicles_data = None
         self.last_coords_hash = -1
         self.last_veh_data_version = None
+        self.last_veh_pos_version = None
         self.circular_map = True
 
+        # Vehicle motion interpolation
+        if self.wcfg["enable_vehicle_motion_interpolation"]:
+            self.motion = MotionInterpolator()
+        else:
+            self.motion = None
+
         self.update_map(0, 1)
 
     def timerEvent(self, event):
@@ -103,10 +121,17 @@ class Realtime(Overlay):
             self.last_coords_hash = coords_hash
 
             # Vehicles
-            veh_data_version = minfo.vehicles.dataSetVersion
-            self.update_vehicle(veh_data_version, self.last_veh_data_version)
+            veh_info = minfo.vehicles
+            veh_data_version = veh_info.version(VEHICLE_COLUMNS)
+            self.update_vehicle(veh_data_version, self.last_veh_data_version, veh_info)
             self.last_veh_data_version = veh_data_version
 
+            # Vehicle motion
+            if self.motion:
+                veh_pos_version = veh_info.columnVersion["posXZ"]
+                self.update_motion(veh_pos_version, self.last_veh_pos_version, veh_info)
+                self.last_veh_pos_version = veh_pos_version
+
     # GUI update methods
     def update_map(self, curr, last):
         """Map update"""
@@ -114,10 +139,17 @@ class Realtime(Overlay):
             map_path = self.create_map_path(minfo.mapping.coordinates)
             self.draw_map_image(map_path, self.circular_map)
 
-    def update_vehicle(self, curr, last):
+    def update_vehicle(self, curr, last, veh_info):
         """Vehicle sort & update"""
         if curr != last:
-            self.vehicles_data = sorted(minfo.vehicles.dataSet, reverse=True)
+            self.vehicles_data = bool(veh_info.total)
+            self.update()
+
+    def update_motion(self, curr, last, veh_info):
+        """Vehicle motion sample & update, redraw interpolated position on every update"""
+        if curr != last:
+            self.motion.update(veh_info.slotID, veh_info.posXZ, None, veh_info.total)
+        if self.vehicles_data:
             self.update()
 
     def paintEvent(self, event):
@@ -138,20 +170,21 @@ class Realtime(Overlay):
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin)
 
-            total_nodes = len(self.map_scaled)
-            skip_node = total_nodes // (self.temp_map_size * 3) * self.display_detail_level
-            skipped_last_node = (total_nodes - 1) % skip_node if skip_node else 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
-                if index == 0:
-                    map_path.moveTo(*coords)
-                elif last_skip >= skip_node:
-                    map_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
-
-            if skipped_last_node:  # set last node if skipped
-                map_path.lineTo(*self.map_scaled[-1])
+            # Select simplified map nodes for display size
+            if self.display_detail_level:
+                lod_index = calc.select_lod_index(
+                    minfo.mapping.coordinatesLOD,
+                    self.temp_map_size / self.display_detail_level)
+            else:
+                lod_index = None
+            if lod_index:
+                map_nodes = map(self.map_scaled.__getitem__, lod_index)
+            else:
+                map_nodes = iter(self.map_scaled)
+
+            map_path.moveTo(*next(map_nodes))
+            for coords in map_nodes:
+                map_path.lineTo(*coords)
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -262,30 +295,38 @@ class Realtime(Overlay):
 
     def draw_vehicle(self, painter):
         """Draw vehicles"""
-        if self.wcfg["show_vehicle_standings"]:
-            painter.setFont(self.font)
-            self.pen.setColor(self.wcfg["font_color"])
-            painter.setPen(self.pen)
-
-        for veh_info in self.vehicles_data:
+        veh_info = minfo.vehicles
+        motion = self.motion
+        now = perf_counter()
+        for index in veh_info.drawOrder:
             if self.last_coords_hash:
-                pos_x, pos_y = self.vehicle_coords_scale(*veh_info.posXZ)
+                if motion:
+                    pos_x, pos_y, _ = motion.position(
+                        veh_info.slotID[index], now, *veh_info.posXZ[index])
+                    pos_x, pos_y = self.vehicle_coords_scale(pos_x, pos_y)
+                else:
+                    pos_x, pos_y = self.vehicle_coords_scale(*veh_info.posXZ[index])
                 offset = 0
             else:  # vehicles on temp map
-                inpit_offset = self.wcfg["font_size"] if veh_info.inPit else 0
+                inpit_offset = self.wcfg["font_size"] if veh_info.inPit[index] else 0
                 pos_x, pos_y = calc.rotate_pos(
-                    6.2831853 * veh_info.lapProgress,
+                    6.2831853 * veh_info.lapProgress[index],
                     self.temp_map_size / -2 + inpit_offset,  # x pos
                     0)  # y pos
                 offset = self.area_size * 0.5
 
             painter.translate(offset + pos_x, offset + pos_y)
-            painter.drawPixmap(-self.veh_size, -self.veh_size, self.color_veh_pixmap(veh_info))
+            painter.drawPixmap(
+                -self.veh_size, -self.veh_size, self.color_veh_pixmap(veh_info, index))
+            painter.resetTransform()
 
-            # Draw text standings
+            # Draw text standings, align to pixel grid for cached text pixmap
             if self.wcfg["show_vehicle_standings"]:
-                painter.drawText(self.veh_text_shape, Qt.AlignCenter, f"{veh_info.position}")
-            painter.resetTransform()
+                painter.translate(round(offset + pos_x), round(offset + pos_y))
+                text_cache.draw_text(
+                    painter, self.veh_text_shape, Qt.AlignCenter,
+                    f"{veh_info.position[index]}", self.font, self.wcfg["font_color"])
+                painter.resetTransform()
 
     def draw_vehicle_pixmap(self, suffix):
         """Draw vehicles pixmap"""
@@ -332,18 +373,18 @@ class Realtime(Overlay):
         )
         return veh_pos_x, veh_pos_y
 
-    def color_veh_pixmap(self, veh_info):
+    def color_veh_pixmap(self, veh_info, index):
         """Compare lap differences & set color"""
-        if veh_info.isPlayer:
+        if veh_info.isPlayer[index]:
             return self.pixmap_veh_player
-        if veh_info.position == 1:
+        if veh_info.position[index] == 1:
             return self.pixmap_veh_leader
-        if veh_info.inPit:
+        if veh_info.inPit[index]:
             return self.pixmap_veh_in_pit
-        if veh_info.isYellow and not veh_info.inPit + veh_info.inGarage:
+        if veh_info.isYellow[index] and not veh_info.inPit[index] + veh_info.inGarage[index]:
             return self.pixmap_veh_yellow
-        if veh_info.isLapped > 0:
+        if veh_info.isLapped[index] > 0:
             return self.pixmap_veh_laps_ahead
-        if veh_info.isLapped < 0:
+        if veh_info.isLapped[index] < 0:
             return self.pixmap_veh_laps_behind
         return self.pixmap_veh_same_lap
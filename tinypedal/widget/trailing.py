@@ -20,14 +20,12 @@
 Trailing Widget
 """
 
-from collections import deque
-
-from PySide2.QtCore import Qt, QPointF, QRect
+from PySide2.QtCore import Qt, QRect
 from PySide2.QtGui import QPainter, QPixmap, QPen
 
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
+from ._plot import PlotBuffer
 
 WIDGET_NAME = "trailing"
 
@@ -71,17 +69,17 @@ class Realtime(Overlay):
         self.pixmap_plot_last.fill(Qt.transparent)
 
         if self.wcfg["show_throttle"]:
-            self.data_throttle = self.create_data_samples(self.max_samples)
+            self.data_throttle = PlotBuffer(self.max_samples, self.display_scale)
         if self.wcfg["show_brake"]:
-            self.data_brake = self.create_data_samples(self.max_samples)
+            self.data_brake = PlotBuffer(self.max_samples, self.display_scale)
         if self.wcfg["show_clutch"]:
-            self.data_clutch = self.create_data_samples(self.max_samples)
+            self.data_clutch = PlotBuffer(self.max_samples, self.display_scale)
         if self.wcfg["show_ffb"]:
-            self.data_ffb = self.create_data_samples(self.max_samples)
+            self.data_ffb = PlotBuffer(self.max_samples, self.display_scale)
         if self.wcfg["show_wheel_lock"]:
-            self.data_wheel_lock = self.create_data_samples(self.max_samples)
+            self.data_wheel_lock = PlotBuffer(self.max_samples, self.display_scale)
         if self.wcfg["show_wheel_slip"]:
-            self.data_wheel_slip = self.create_data_samples(self.max_samples)
+            self.data_wheel_slip = PlotBuffer(self.max_samples, self.display_scale)
 
         self.pen = QPen()
         self.pen.setCapStyle(Qt.RoundCap)
@@ -100,7 +98,7 @@ class Realtime(Overlay):
 
             # Use elapsed time to determine whether data paused
             # Add 1 extra update compensation
-            lap_etime = api.read.timing.elapsed()
+            lap_etime = frame_api.read.timing.elapsed()
             if lap_etime != self.last_lap_etime:
                 self.update_plot = 2
             elif self.update_plot:
@@ -110,39 +108,39 @@ class Realtime(Overlay):
             if self.update_plot:
                 if self.wcfg["show_throttle"]:
                     if self.wcfg["show_raw_throttle"]:
-                        throttle = api.read.input.throttle_raw()
+                        throttle = frame_api.read.input.throttle_raw()
                     else:
-                        throttle = api.read.input.throttle()
+                        throttle = frame_api.read.input.throttle()
                     self.append_sample("throttle", throttle)
 
                 if self.wcfg["show_brake"]:
                     if self.wcfg["show_raw_brake"]:
-                        brake = api.read.input.brake_raw()
+                        brake = frame_api.read.input.brake_raw()
                     else:
-                        brake = api.read.input.brake()
+                        brake = frame_api.read.input.brake()
                     self.append_sample("brake", brake)
 
                 if self.wcfg["show_clutch"]:
                     if self.wcfg["show_raw_clutch"]:
-                        clutch = api.read.input.clutch_raw()
+                        clutch = frame_api.read.input.clutch_raw()
                     else:
-                        clutch = api.read.input.clutch()
+                        clutch = frame_api.read.input.clutch()
                     self.append_sample("clutch", clutch)
 
                 if self.wcfg["show_ffb"]:
-                    ffb = abs(api.read.input.force_feedback())
+                    ffb = abs(frame_api.read.input.force_feedback())
                     self.append_sample("ffb", ffb)
 
                 if self.wcfg["show_wheel_lock"]:
                     wheel_lock = min(abs(min(minfo.wheels.slipRatio)), 1)
-                    if wheel_lock >= self.wcfg["wheel_lock_threshold"] and api.read.input.brake_raw() > 0.02:
+                    if wheel_lock >= self.wcfg["wheel_lock_threshold"] and frame_api.read.input.brake_raw() > 0.02:
                         self.append_sample("wheel_lock", wheel_lock)
                     else:
                         self.append_sample("wheel_lock", -999)
 
                 if self.wcfg["show_wheel_slip"]:
                     wheel_slip = min(max(minfo.wheels.slipRatio), 1)
-                    if wheel_slip >= self.wcfg["wheel_slip_threshold"] and api.read.input.throttle_raw() > 0.02:
+                    if wheel_slip >= self.wcfg["wheel_slip_threshold"] and frame_api.read.input.throttle_raw() > 0.02:
                         self.append_sample("wheel_slip", wheel_slip)
                     else:
                         self.append_sample("wheel_slip", -999)
@@ -150,7 +148,6 @@ class Realtime(Overlay):
                 # Update after all pedal data set
                 if self.delayed_update:
                     self.delayed_update = False
-                    self.translate_samples()
                     self.draw_plot_section()
                     self.draw_plot()
                     self.pixmap_plot_last = self.pixmap_plot.copy(
@@ -230,17 +227,13 @@ class Realtime(Overlay):
         self.pen.setWidth(self.wcfg[f"{suffix}_line_width"])
         self.pen.setColor(self.wcfg[f"{suffix}_color"])
         painter.setPen(self.pen)
-        if self.wcfg[f"{suffix}_line_style"]:
-            painter.drawPoints(getattr(self, f"data_{suffix}"))
-        else:
-            painter.drawPolyline(getattr(self, f"data_{suffix}"))
+        data = getattr(self, f"data_{suffix}")
+        # Scroll plot, newest sample at 1 pixel offset
+        painter.resetTransform()
+        painter.translate(data.scroll_offset() + 1, 0)
+        data.draw(painter, self.wcfg[f"{suffix}_line_style"])
 
     # Additional methods
-    @staticmethod
-    def create_data_samples(samples):
-        """Create data sample list"""
-        return deque([QPointF(0, 0) for _ in range(samples)], samples)
-
     def scale_position(self, position):
         """Scale pedal value"""
         return position * 100 * self.pedal_scale + self.margin
@@ -248,26 +241,9 @@ class Realtime(Overlay):
     def append_sample(self, suffix, value):
         """Append input position sample to data list"""
         input_pos = self.scale_position(value)
-        getattr(self, f"data_{suffix}").appendleft(QPointF(0, input_pos))
+        getattr(self, f"data_{suffix}").append(input_pos)
         self.delayed_update = True
 
-    def translate_samples(self):
-        """Translate sample position"""
-        for index in range(self.max_samples):
-            index_offset = index * self.display_scale + 1
-            if self.wcfg["show_throttle"]:
-                self.data_throttle[index].setX(index_offset)
-            if self.wcfg["show_brake"]:
-                self.data_brake[index].setX(index_offset)
-            if self.wcfg["show_clutch"]:
-                self.data_clutch[index].setX(index_offset)
-            if self.wcfg["show_ffb"]:
-                self.data_ffb[index].setX(index_offset)
-            if self.wcfg["show_wheel_lock"]:
-                self.data_wheel_lock[index].setX(index_offset)
-            if self.wcfg["show_wheel_slip"]:
-                self.data_wheel_slip[index].setX(index_offset)
-
     def set_viewport_orientation(self):
         """Set viewport orientation"""
         if self.wcfg["show_inverted_pedal"]:
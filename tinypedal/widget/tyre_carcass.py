@@ -28,8 +28,7 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import heatmap as hmp
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "tyre_carcass"
 
@@ -152,7 +151,7 @@ class Realtime(Overlay):
 
             # Tyre compound
             if self.wcfg["show_tyre_compound"]:
-                tcmpd = api.read.tyre.compound()
+                tcmpd = frame_api.read.tyre.compound()
                 for cmpd_idx in range(2):
                     self.update_tcmpd(
                         self.bar_tcmpd[cmpd_idx],
@@ -162,7 +161,7 @@ class Realtime(Overlay):
                 self.last_tcmpd = tcmpd
 
             # Tyre carcass temperature
-            ctemp = api.read.tyre.carcass_temperature()
+            ctemp = frame_api.read.tyre.carcass_temperature()
             for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
                 self.update_ctemp(
                     self.bar_ctemp[tyre_idx],
@@ -173,7 +172,7 @@ class Realtime(Overlay):
 
             # Rate of change
             if self.wcfg["show_rate_of_change"]:
-                lap_etime = api.read.timing.elapsed()
+                lap_etime = frame_api.read.timing.elapsed()
 
                 if lap_etime != self.last_lap_etime:  # time stamp difference
                     self.last_lap_etime = lap_etime  # reset time stamp counter
@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt, QRectF
 from PySide2.QtGui import QPainter, QPen
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "tyre_load"
 
@@ -109,7 +108,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Read tyre load data
-            raw_load = api.read.tyre.load()
+            raw_load = frame_api.read.tyre.load()
             self.tload = tuple(map(round, raw_load))
             self.tratio = tuple(map(self.tyre_load_ratio, raw_load, [sum(raw_load)] * 4))
 
@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "tyre_pressure"
 
@@ -97,7 +96,7 @@ class Realtime(Overlay):
         if self.state.active:
 
             # Tyre pressure
-            tpres = api.read.tyre.pressure()
+            tpres = frame_api.read.tyre.pressure()
             for idx in range(4):
                 self.update_tpres(self.bar_tpres[idx], tpres[idx], self.last_tpres[idx])
             self.last_tpres = tpres
@@ -25,8 +25,7 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import heatmap as hmp
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "tyre_temperature"
 
@@ -140,7 +139,7 @@ class Realtime(Overlay):
 
             # Tyre compound
             if self.wcfg["show_tyre_compound"]:
-                tcmpd = api.read.tyre.compound()
+                tcmpd = frame_api.read.tyre.compound()
                 for cmpd_idx in range(2):
                     self.update_tcmpd(
                         self.bar_tcmpd[cmpd_idx],
@@ -151,7 +150,7 @@ class Realtime(Overlay):
 
             if self.wcfg["show_inner_center_outer"]:
                 # Surface temperature
-                stemp = api.read.tyre.surface_temperature()
+                stemp = frame_api.read.tyre.surface_temperature()
                 for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
                     for patch_idx in range(3):  # 0 1 2 / 7 8 9
                         self.update_stemp(
@@ -163,7 +162,7 @@ class Realtime(Overlay):
 
                 # Inner layer temperature
                 if self.wcfg["show_innerlayer"]:
-                    itemp = api.read.tyre.inner_temperature()
+                    itemp = frame_api.read.tyre.inner_temperature()
                     for tyre_idx in range(4):
                         for patch_idx in range(3):
                             self.update_itemp(
@@ -174,7 +173,7 @@ class Realtime(Overlay):
                     self.last_itemp = itemp
             else:
                 # Surface temperature
-                stemp = tuple(map(calc.mean, api.read.tyre.surface_temperature()))
+                stemp = tuple(map(calc.mean, frame_api.read.tyre.surface_temperature()))
                 for tyre_idx in range(4):  # 0 - fl, 1 - fr, 2 - rl, 3 - rr
                     self.update_stemp(
                         self.bar_stemp[tyre_idx],
@@ -185,7 +184,7 @@ class Realtime(Overlay):
 
                 # Inner layer temperature
                 if self.wcfg["show_innerlayer"]:
-                    itemp = tuple(map(calc.mean, api.read.tyre.inner_temperature()))
+                    itemp = tuple(map(calc.mean, frame_api.read.tyre.inner_temperature()))
                     for tyre_idx in range(4):
                         self.update_itemp(
                             self.bar_itemp[tyre_idx],
@@ -24,9 +24,8 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "tyre_wear"
 
@@ -213,9 +212,9 @@ class Realtime(Overlay):
                 self.checked = True
 
             # Read tyre wear data
-            lap_stime = api.read.timing.start()
-            lap_etime = api.read.timing.elapsed()
-            wear_curr = tuple(map(self.round2decimal, api.read.tyre.wear()))
+            lap_stime = frame_api.read.timing.start()
+            lap_etime = frame_api.read.timing.elapsed()
+            wear_curr = tuple(map(self.round2decimal, frame_api.read.tyre.wear()))
 
             if lap_stime != self.last_lap_stime:
                 self.wear_last_lap = self.wear_curr_lap
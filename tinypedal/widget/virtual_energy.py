@@ -318,6 +318,14 @@ class Realtime(Overlay):
         self.last_fuel_bias = None
         self.last_level_state = None
 
+        # Skip update while energy data unchanged
+        self.set_update_sources(
+            minfo.energy,
+            lambda: minfo.hybrid.fuelEnergyRatio,
+            lambda: minfo.fuel.estimatedLaps,
+            lambda: minfo.restapi.maxVirtualEnergy,
+        )
+
     def timerEvent(self, event):
         """Update when vehicle on track"""
         if self.state.active:
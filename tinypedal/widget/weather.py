@@ -26,8 +26,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout, QLabel
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "weather"
 PREFIX_WETNESS = "Dry","Wet"
@@ -124,20 +123,20 @@ class Realtime(Overlay):
 
             # Track temperature
             if self.wcfg["show_temperature"]:
-                temp_d = (api.read.session.track_temperature(),
-                          api.read.session.ambient_temperature())
+                temp_d = (frame_api.read.session.track_temperature(),
+                          frame_api.read.session.ambient_temperature())
                 self.update_temp(temp_d, self.last_temp_d)
                 self.last_temp_d = temp_d
 
             # Rain percentage
             if self.wcfg["show_rain"]:
-                rain_per = api.read.session.raininess()
+                rain_per = frame_api.read.session.raininess()
                 self.update_rain(rain_per, self.last_rain_per)
                 self.last_rain_per = rain_per
 
             # Surface wetness
             if self.wcfg["show_wetness"]:
-                wet_road = api.read.session.wetness()
+                wet_road = frame_api.read.session.wetness()
                 self.update_wetness(wet_road, self.last_wet_road)
                 self.last_wet_road = wet_road
 
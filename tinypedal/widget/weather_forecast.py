@@ -26,9 +26,8 @@ from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
 from .. import weather as wthr
-from ..api_control import api
 from ..module_info import minfo
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "weather_forecast"
 MAX_SLOT = 5
@@ -177,8 +176,8 @@ class Realtime(Overlay):
     def update_weather_forecast_restapi(self):
         """Update weather forecast from restapi"""
         # Read weather data
-        is_lap_type = api.read.session.lap_type()
-        forecast_info = self.get_forecast_info(api.read.session.session_type())
+        is_lap_type = frame_api.read.session.lap_type()
+        forecast_info = self.get_forecast_info(frame_api.read.session.session_type())
         forecast_count = min(len(forecast_info), MAX_SLOT)
 
         # Forecast
@@ -195,8 +194,8 @@ class Realtime(Overlay):
                     self.estimated_time[index] = min(round(
                         wthr.forecast_time_progress(
                             forecast_info[index][0],
-                            api.read.session.end(),
-                            api.read.session.elapsed()
+                            frame_api.read.session.end(),
+                            frame_api.read.session.elapsed()
                         ) / 60), wthr.MAX_MINUTES)
                     if self.estimated_time[index] <= 0 < index:
                         index_offset += 1
@@ -206,9 +205,9 @@ class Realtime(Overlay):
 
                 # Update slot 0 with live(now) weather condition
                 if index == 0:
-                    rain_chance = api.read.session.raininess() * 100
+                    rain_chance = frame_api.read.session.raininess() * 100
                     icon_index = wthr.sky_type_correction(forecast_info[index_bias][1], rain_chance)
-                    estimated_temp = api.read.session.ambient_temperature()
+                    estimated_temp = frame_api.read.session.ambient_temperature()
                 # Update slot with available forecast
                 elif index_bias < forecast_count:
                     rain_chance = forecast_info[index_bias][3]
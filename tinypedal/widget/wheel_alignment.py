@@ -24,8 +24,7 @@ from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QGridLayout
 
 from .. import calculation as calc
-from ..api_control import api
-from ._base import Overlay
+from ._base import Overlay, frame_api
 
 WIDGET_NAME = "wheel_alignment"
 
@@ -130,14 +129,14 @@ class Realtime(Overlay):
 
             # Camber
             if self.wcfg["show_camber"]:
-                camber = tuple(map(self.round2decimal, api.read.wheel.camber()))
+                camber = tuple(map(self.round2decimal, frame_api.read.wheel.camber()))
                 for idx in range(4):
                     self.update_wheel(self.bar_camber[idx], camber[idx], self.last_camber[idx])
                 self.last_camber = camber
 
             # Toe in
             if self.wcfg["show_toe_in"]:
-                toein = tuple(map(self.round2decimal, api.read.wheel.toe_symmetric()))
+                toein = tuple(map(self.round2decimal, frame_api.read.wheel.toe_symmetric()))
                 for idx in range(4):
                     self.update_wheel(self.bar_toein[idx], toein[idx], self.last_toein[idx])
                 self.last_toein = toein